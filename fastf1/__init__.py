@@ -81,6 +81,18 @@ WARNING, ERROR and CRITICAL.
 
 For more information see :ref:`logging`.
 
+
+Configure JSON Decoding
+.......................
+
+Parsing data from the F1 live timing API requires decoding a large amount of
+JSON data. FastF1 uses `orjson <https://pypi.org/project/orjson/>`_ for this
+if it is installed, which makes parsing considerably faster. Otherwise, the
+:mod:`json` module of the standard library is used. The results are the same
+in both cases.
+
+.. autofunction:: set_json_backend
+
 """
 from typing import Dict
 
@@ -91,6 +103,7 @@ from fastf1.events import (get_session,  # noqa: F401
                            get_testing_event,
                            get_event_schedule)
 
+from fastf1.internals.json_backend import set_json_backend  # noqa: F401
 from fastf1.logger import set_log_level  # noqa: F401
 
 from fastf1.req import Cache, RateLimitExceededError   # noqa: F401
@@ -1,16 +1,19 @@
+import array
 import base64
+import concurrent.futures
 import datetime
-import json
 import zlib
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from fastf1.internals import json_backend
 from fastf1.internals.pandas_extensions import create_df_fast
 from fastf1.logger import get_logger, soft_exceptions
 from fastf1.req import Cache
-from fastf1.utils import recursive_dict_get, to_timedelta, to_datetime
+from fastf1.utils import recursive_dict_get, to_datetime, to_datetime_array, \
+    to_timedelta, to_timedelta_array
 
 _logger = get_logger('api')
 
@@ -18,7 +21,6 @@ base_url = 'https://livetiming.formula1.com'
 
 headers: Dict[str, str] = {
     'Host': 'livetiming.formula1.com',
-    'Connection': 'close',
     'TE': 'identity',
     'User-Agent': 'BestHTTP',
     'Accept-Encoding': 'gzip, identity',
@@ -49,6 +51,22 @@ pages: Dict[str, str] = {
 }
 """Known API requests"""
 
+page_parsers: Dict[str, str] = {
+    'session_info': 'session_info',
+    'driver_list': 'driver_info',
+    'session_status': 'session_status_data',
+    'track_status': 'track_status_data',
+    'lap_count': 'lap_count',
+    'timing_data': '_extended_timing_data',
+    'timing_app_data': 'timing_app_data',
+    'car_data': 'car_data',
+    'position': 'position_data',
+    'weather_data': 'weather_data',
+    'race_control_messages': 'race_control_messages',
+}
+"""Pages whose parsed data is cached (stage 2) and the names of the parser
+functions that are applied to them"""
+
 
 def make_path(wname, wdate, sname, sdate):
     """Create the api path base string to append on livetiming.formula1.com for api
@@ -83,6 +101,18 @@ EMPTY_STREAM = {'Time': pd.NaT, 'Driver': str(), 'Position': np.NaN,
                 'GapToLeader': np.NaN, 'IntervalToPositionAhead': np.NaN}
 
 
+def _to_timedelta_list(x):
+    # bulk conversion with the same result as calling ``to_timedelta`` for
+    # each value (datetime.timedelta or None if a value cannot be converted)
+    return to_timedelta_array(x).astype('timedelta64[us]').tolist()
+
+
+def _to_datetime_list(x):
+    # bulk conversion with the same result as calling ``to_datetime`` for
+    # each value (datetime.datetime or None if a value cannot be converted)
+    return to_datetime_array(x).astype('datetime64[us]').tolist()
+
+
 def timing_data(path: str,
                 response: Optional[str] = None,
                 livedata=None
@@ -162,7 +192,7 @@ def timing_data(path: str,
     return laps_data, stream_data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def _extended_timing_data(path, response=None, livedata=None):
     # extended over the documentation of ``timing_data``:
     #   - returns session_split_times for splitting Q1/Q2/Q3 additionally
@@ -218,6 +248,8 @@ def _extended_timing_data(path, response=None, livedata=None):
             stream_data[key].extend(drv_stream_data[key])
 
     laps_data = pd.DataFrame(laps_data)
+    # the timestamps of the stream data of all drivers are converted at once
+    stream_data['Time'] = to_timedelta_array(stream_data['Time'])
     stream_data = pd.DataFrame(stream_data)
 
     _align_laps(laps_data, stream_data)
@@ -240,13 +272,27 @@ def _align_laps(laps_data, stream_data):
         leader = None
         max_delta = None
 
+        # group the data by driver once, the lap times and stream data of
+        # each driver are then accessed as arrays for every lap offset
+        laps_grouped = laps_data.groupby('Driver', sort=False)
+        lap_indices = laps_grouped.indices
+        lap_times = laps_data['Time'].to_numpy()
+        drv_lap_times = {drv: lap_times[idx]
+                         for drv, idx in lap_indices.items()}
+        drv_streams = _stream_data_per_driver(stream_data)
+
+        # laps on which one or more drivers pit
+        pit_laps = set(
+            laps_data.loc[laps_data['PitInTime'].notna(), 'NumberOfLaps']
+        )
+
         # try to align on the first lap where usable data is available
         # ideally, this is the end of the first lap
         offset = -1  # start at -1 so that value it is zero on first iteration
 
         max_offset = (
-                laps_data.loc[:, ('Driver', 'NumberOfLaps')].groupby('Driver')
-                .max()['NumberOfLaps']  # find max lap count for each driver
+                laps_grouped['NumberOfLaps']
+                .max()  # find max lap count for each driver
                 .min()  # find the smallest max lap count (first retirement)
                 - 1  # subtract one, because offset counts from zero
         )
@@ -261,17 +307,15 @@ def _align_laps(laps_data, stream_data):
             # find the leader after the first usable lap and get the expected
             # gaps to the leader for all other drivers
 
-            if not pd.isnull(
-                laps_data.loc[laps_data['NumberOfLaps'] == (offset + 1)]
-                         .loc[:, 'PitInTime']).all():
+            if (offset + 1) in pit_laps:
                 # cannot align on laps where one or more drivers pit, therefore
                 # skip and try next one
                 continue
 
             for drv in laps_data['Driver'].unique():
                 try:
-                    gap_str = _get_gap_str_for_drv(drv, offset, laps_data,
-                                                   stream_data)
+                    gap_str = _get_gap_str_for_drv(drv, offset, drv_lap_times,
+                                                   drv_streams)
                     if 'LAP' in gap_str:
                         leader = drv
                     else:
@@ -281,16 +325,14 @@ def _align_laps(laps_data, stream_data):
 
         # find the greatest delta between actual gap and currently calculated
         # gap
-        leader_time \
-            = laps_data[laps_data['Driver'] == leader].iloc[offset]['Time']
+        leader_time = pd.Timedelta(drv_lap_times[leader][offset])
 
         for drv in expected_gap.keys():
             if expected_gap[drv] is None:
                 delta[drv] = None
                 continue
 
-            other_time \
-                = laps_data[laps_data['Driver'] == drv].iloc[offset]['Time']
+            other_time = pd.Timedelta(drv_lap_times[drv][offset])
             is_gap = other_time - leader_time
             delta[drv] = expected_gap[drv] - is_gap
             if (max_delta is None) or (delta[drv] > max_delta):
@@ -302,7 +344,7 @@ def _align_laps(laps_data, stream_data):
         # greater than zero
         if max_delta > datetime.timedelta(0):
             max_delta = datetime.timedelta(0)
-        laps_data.loc[laps_data['Driver'] == leader, 'Time'] -= max_delta
+        drv_shift = {leader: max_delta}
 
         # Subtract the delta between actual gap and currently calculated gap
         # from each drivers timestamps to align them. Correct for the max
@@ -310,16 +352,48 @@ def _align_laps(laps_data, stream_data):
         for drv in delta.keys():
             if delta[drv] is None:
                 continue
-            laps_data.loc[laps_data['Driver'] == drv, 'Time'] \
-                -= (max_delta - delta[drv])
-
-
-def _get_gap_str_for_drv(drv, idx, laps_data, stream_data):
-    first_time = laps_data[laps_data['Driver'] == drv].iloc[idx]['Time']
-    ref_idx = (stream_data[stream_data['Driver'] == drv]['Time']
-               - first_time).abs().idxmin()
-    gap_str = stream_data.loc[ref_idx]['GapToLeader']
-    return gap_str
+            drv_shift[drv] = (drv_shift.get(drv, datetime.timedelta(0))
+                              + (max_delta - delta[drv]))
+
+        # all timestamps are shifted at once
+        shift = np.zeros(len(laps_data), dtype='timedelta64[ns]')
+        shift_values = pd.to_timedelta(list(drv_shift.values())).to_numpy()
+        for drv, value in zip(drv_shift.keys(), shift_values):
+            shift[lap_indices[drv]] = value
+        laps_data['Time'] = laps_data['Time'] - shift
+
+
+def _stream_data_per_driver(stream_data):
+    # split the stream data by driver; returns (times, gaps) for each
+    # driver where samples without timestamp are removed and the times are
+    # sorted (stable, so that the original order is kept for equal times)
+    times = stream_data['Time'].to_numpy()
+    gaps = stream_data['GapToLeader'].to_numpy()
+    streams = dict()
+    for drv, idx in stream_data.groupby('Driver', sort=False).indices.items():
+        drv_times = times[idx]
+        drv_gaps = gaps[idx]
+        if np.isnat(drv_times).any():
+            valid = ~np.isnat(drv_times)
+            drv_times, drv_gaps = drv_times[valid], drv_gaps[valid]
+        order = np.argsort(drv_times, kind='stable')
+        streams[drv] = (drv_times[order], drv_gaps[order])
+    return streams
+
+
+def _get_gap_str_for_drv(drv, idx, drv_lap_times, drv_streams):
+    first_time = drv_lap_times[drv][idx]
+    times, gaps = drv_streams.get(drv, (np.array([], 'timedelta64[ns]'), ()))
+    if not len(times) or np.isnat(first_time):
+        raise ValueError(f"No reference time for driver {drv}")
+    # find the sample which is closest to the lap end time; if two samples
+    # are equally close, the earlier one is used
+    i = np.searchsorted(times, first_time)
+    if (i == len(times)) \
+            or ((i > 0) and (first_time - times[i - 1] <= times[i] - first_time)):
+        # use the first one of multiple samples with the same time
+        i = np.searchsorted(times, times[i - 1])
+    return gaps[i]
 
 
 def _laps_data_driver(driver_raw, empty_vals, drv):
@@ -344,51 +418,68 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
 
     integrity_errors = list()
 
-    # do a quick first pass over the data to find out when laps start and end
-    # this is needed so we can work with a more efficient "look ahead" on the main pass
+    # convert all timestamps at once; the state machine below compares
+    # integer nanoseconds and the timedelta objects are only used as values
+    times = to_timedelta_array([time for time, _ in driver_raw])
+    if np.isnat(times).any():
+        # data without a valid timestamp cannot be assigned to a lap
+        is_valid = ~np.isnat(times)
+        driver_raw = [entry for entry, valid in zip(driver_raw, is_valid)
+                      if valid]
+        times = times[is_valid]
+    times_ns = times.view('int64').tolist()
+    times_td = times.astype('timedelta64[us]').tolist()
+
+    five_seconds = 5_000_000_000
+    five_minutes = 300_000_000_000
+
+    # find out when laps start first, so that the main pass can "look ahead"
     # example: we can have 'PitOut' 0.01s before a new lap starts, but 'PitOut' belongs to the new lap, not the old one
+    # only the lap count and the pit status are needed for this, therefore
+    # only the (few) entries which contain one of them are evaluated
+    lap_start_ns = list()  # start time of each lap, as seen by the look ahead
 
-    lapcnt = 0  # we're keeping two separate lap counts because sometimes the api has a non existent lap too much...
-    api_lapcnt = 0  # ...at the beginning; we can correct that though;
-    # api_lapcnt does not count backwards even if the source data does
+    api_lapcnt = 0  # api_lapcnt does not count backwards even if the source data does
     in_past = False  # flag for when the data went back in time
     out_of_pit = False  # flag set to true when driver drives out FOR THE FIRST TIME; stays true from then on
 
     # entries are prefilled with empty values and only overwritten if they exist in the response line
     drv_data = {key: [val, ] for key, val in empty_vals.items()}
 
-    for time, resp in driver_raw:
+    for i in [i for i, (_, resp) in enumerate(driver_raw)
+              if ('NumberOfLaps' in resp) or ('InPit' in resp)]:
+        resp = driver_raw[i][1]
+        n_laps = resp.get('NumberOfLaps')
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
-        if in_past and 'NumberOfLaps' in resp and resp['NumberOfLaps'] == api_lapcnt:
+        if in_past and (n_laps is not None) and n_laps == api_lapcnt:
             in_past = False  # we're back in the present
 
-        if 'NumberOfLaps' in resp and ((prev_lapcnt := resp['NumberOfLaps']) < api_lapcnt):
+        if (n_laps is not None) and (n_laps < api_lapcnt):
             _logger.warning(f"Driver {drv: >2}: Ignoring late data for a "
                             f"previously processed lap.The data may contain "
-                            f"errors (previous: {prev_lapcnt}; "
-                            f"current {lapcnt})")
+                            f"errors (previous: {n_laps}; "
+                            f"current {len(lap_start_ns)})")
             in_past = True
             continue
 
         if in_past:  # still in the past, just continue and ignore everything
             continue
 
-        if ('InPit' in resp) and (resp['InPit'] is False):
+        if resp.get('InPit', True) is False:
             out_of_pit = True  # drove out of the pits for the first time
 
         # new lap; create next row
-        if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
+        if (n_laps is not None) and n_laps > api_lapcnt:
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if out_of_pit:
-                drv_data['Time'][lapcnt] = to_timedelta(time)
-                lapcnt += 1
+                drv_data['Time'][len(lap_start_ns)] = times_td[i]
+                lap_start_ns.append(times_ns[i])
                 # append a new empty row; last row may not be populated (depending on session) and may be removed later
                 for key, val in empty_vals.items():
                     drv_data[key].append(val)
 
     # now, do the main pass where all the other data is actually filled in
-    # same counters and flags as before, reset them
     lapcnt = 0  # we're keeping two separate lap counts because sometimes the api has a non existent lap too much...
     api_lapcnt = 0  # ...at the beginning; we can correct that though;
     # api_lapcnt does not count backwards even if the source data does
@@ -401,26 +492,34 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
 
     pitstops = -1  # start with -1 because first is out lap, needs to be zero after that
 
+    # start time of the current lap according to the look ahead (None if
+    # there is none) and actual start time of the previous lap
+    next_lap_ns = lap_start_ns[0] if lap_start_ns else None
+    prev_lap_ns = None
+
     # iterate through the data; new lap triggers next row in data
-    for time, resp in driver_raw:
+    for i, (_, resp) in enumerate(driver_raw):
+        t_ns = times_ns[i]
+        n_laps = resp.get('NumberOfLaps')
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
-        if in_past and 'NumberOfLaps' in resp and resp['NumberOfLaps'] == api_lapcnt:
+        if in_past and (n_laps is not None) and n_laps == api_lapcnt:
             in_past = False  # we're back in the present
-        if in_past or ('NumberOfLaps' in resp and resp['NumberOfLaps'] < api_lapcnt):
+        if in_past or ((n_laps is not None) and n_laps < api_lapcnt):
             in_past = True
             continue
 
-        if (lapcnt == 0) and ((drv_data['Time'][lapcnt] - to_timedelta(time)) > pd.Timedelta(5, 'min')):
+        if (lapcnt == 0) and (next_lap_ns is not None) \
+                and (next_lap_ns - t_ns > five_minutes):
             # ignore any data which arrives more than 5 minutes before the end of the first lap, except 'PitOut'
-            if ('InPit' in resp) and (resp['InPit'] is False):
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)
+            if resp.get('InPit', True) is False:
+                drv_data['PitOutTime'][lapcnt] = times_td[i]
                 pitstops = 0  # special here, can be multiple times for no reason therefore set zero instead of +=1
             continue
 
         # values which are up to five seconds late are still counted towards the previous lap
         # (sector times, speed traps and lap times)
         lap_offset = 0
-        if (lapcnt > 0) and (to_timedelta(time) - drv_data['Time'][lapcnt - 1] < pd.Timedelta(5, 's')):
+        if (lapcnt > 0) and (t_ns - prev_lap_ns < five_seconds):
             lap_offset = 1
 
         if 'Sectors' in resp and isinstance(resp['Sectors'], dict):
@@ -430,9 +529,10 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
                                       ('2', 'Sector3Time', 'Sector3SessionTime')):
                 if val := recursive_dict_get(resp, 'Sectors', sn, 'Value'):
                     drv_data[sector][lapcnt - lap_offset] = to_timedelta(val)
-                    drv_data[sesst][lapcnt - lap_offset] = to_timedelta(time)
+                    drv_data[sesst][lapcnt - lap_offset] = times_td[i]
 
-        if val := recursive_dict_get(resp, 'LastLapTime', 'Value'):
+        if ('LastLapTime' in resp) \
+                and (val := recursive_dict_get(resp, 'LastLapTime', 'Value')):
             # if 'LastLapTime' is received less than five seconds after the start of a new lap, it is still added
             # to the last lap
             val = to_timedelta(val)
@@ -458,16 +558,16 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             # 'InPit': True is received once when entering pits, False is received once when leaving
             if resp['InPit'] is True:
                 if pitstops >= 0:
-                    drv_data['PitInTime'][lapcnt] = to_timedelta(time)
-            elif ((('NumberOfLaps' in resp) and resp['NumberOfLaps'] > api_lapcnt)
-                  or (drv_data['Time'][lapcnt] - to_timedelta(time))
-                  < pd.Timedelta(5, 's')):
+                    drv_data['PitInTime'][lapcnt] = times_td[i]
+            elif (((n_laps is not None) and n_laps > api_lapcnt)
+                  or ((next_lap_ns is not None)
+                      and (next_lap_ns - t_ns < five_seconds))):
                 # same response line as beginning of next lap
                 # or beginning of next lap less than 5 seconds away
-                drv_data['PitOutTime'][lapcnt + 1] = to_timedelta(time)  # add to next lap
+                drv_data['PitOutTime'][lapcnt + 1] = times_td[i]  # add to next lap
                 pitstops += 1
             else:
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)  # add to current lap
+                drv_data['PitOutTime'][lapcnt] = times_td[i]  # add to current lap
                 pitstops += 1
 
         # Get save information about personal best lap times at the timestamp
@@ -476,9 +576,10 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         # the previous 'BestLapTime' value is sent again. There is some extra
         # logic at then end that correctly marks personal best laps based on
         # the data that is saved here.
-        if val := recursive_dict_get(resp, 'BestLapTime', 'Value'):
+        if ('BestLapTime' in resp) \
+                and (val := recursive_dict_get(resp, 'BestLapTime', 'Value')):
             personal_best_lap_times.append(
-                (to_timedelta(time), to_timedelta(val))
+                (times_td[i], to_timedelta(val))
             )
 
         # Create approximate (sub)session (i.e. quali) split times by
@@ -489,18 +590,21 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         if (val := resp.get('BestLapTimes')) and isinstance(val, dict):
             session_n = int(list(val.keys())[0])
             if (session_n + 1) > len(session_split_times):
-                session_split_times.append(to_timedelta(time))
+                session_split_times.append(times_td[i])
 
         # new lap; create next row
-        if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
+        if (n_laps is not None) and n_laps > api_lapcnt:
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if pitstops >= 0:
-                drv_data['Time'][lapcnt] = to_timedelta(time)
+                drv_data['Time'][lapcnt] = times_td[i]
                 drv_data['NumberOfLaps'][lapcnt] = lapcnt + 1  # don't use F1's lap count; ours is better
                 drv_data['NumberOfPitStops'][lapcnt] = pitstops
                 drv_data['Driver'][lapcnt] = drv
                 lapcnt += 1
+                prev_lap_ns = t_ns
+                next_lap_ns = (lap_start_ns[lapcnt]
+                               if lapcnt < len(lap_start_ns) else None)
 
     if lapcnt == 0:  # no data at all for this driver
         return None, None
@@ -716,7 +820,8 @@ def _stream_data_driver(driver_raw, empty_vals, drv):
         drv (str): driver identifier
 
     Returns:
-         dictionary of timing stream data for this driver
+         dictionary of timing stream data for this driver; timestamps are
+         not converted yet
     """
     # entries are prefilled with empty or previous values and only overwritten if they exist in the response line
     # basically interpolation by filling up with last known value because not every value is in every response
@@ -738,7 +843,7 @@ def _stream_data_driver(driver_raw, empty_vals, drv):
 
         # at least one value was present, create next row
         if new_entry:
-            drv_data['Time'][i] = to_timedelta(time)
+            drv_data['Time'][i] = time  # converted by the caller
             drv_data['Driver'][i] = drv
             i += 1
 
@@ -753,7 +858,7 @@ def _stream_data_driver(driver_raw, empty_vals, drv):
     return drv_data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def timing_app_data(path, response=None, livedata=None):
     """
     .. warning::
@@ -811,7 +916,7 @@ def timing_app_data(path, response=None, livedata=None):
         if (len(entry) < 2) or 'Lines' not in entry[1]:
             continue
 
-        time = to_timedelta(entry[0])
+        time = entry[0]
         row = entry[1]
         for driver_number in row['Lines']:
             if update := recursive_dict_get(row, 'Lines', driver_number, 'Stints'):
@@ -822,9 +927,7 @@ def timing_app_data(path, response=None, livedata=None):
                     for key in data:
                         if key in stint:
                             val = stint[key]
-                            if key == 'LapTime':
-                                val = to_timedelta(val)
-                            elif key == 'New':
+                            if key == 'New':
                                 val = True if val == 'true' else False
                             data[key].append(val)
                         else:
@@ -838,6 +941,10 @@ def timing_app_data(path, response=None, livedata=None):
                     data['Driver'][-1] = driver_number
                     data['Stint'][-1] = stint_number
 
+    # all timestamps are converted at once
+    data['Time'] = to_timedelta_array(data['Time'])
+    data['LapTime'] = to_timedelta_array(data['LapTime'])
+
     df = pd.DataFrame(data)
     # pandas doesn't correctly infer bool dtype columns, set type explicitly
     df[['New', 'TyresNotChanged']] \
@@ -845,8 +952,9 @@ def timing_app_data(path, response=None, livedata=None):
     return df
 
 
-@Cache.api_request_wrapper
-def car_data(path, response=None, livedata=None):
+@Cache.api_request_wrapper(parser_version=1)
+def car_data(path, response=None, livedata=None, drivers=None,
+             workers=None):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
@@ -883,6 +991,12 @@ def car_data(path, response=None, livedata=None):
         path (str): api path base string (usually ``Session.api_path``)
         response: Response as returned by :func:`fetch_page` can be passed if it was downloaded already.
         livedata: An instance of :class:`fastf1.livetiming.data.LiveTimingData` to use as a source instead of the api
+        drivers (list, optional): Only return the data for these drivers (driver numbers as string). When the
+          cache is enabled, the data is cached for all drivers. Only the data for these drivers is read from it if
+          ``columnar_telemetry`` is enabled (see :func:`fastf1.Cache.enable_cache`).
+        workers (int, optional): Decode the data in this many processes in parallel. By default, the data is decoded
+          in the current process. Scripts that use this need an ``if __name__ == '__main__':`` guard on platforms
+          where new processes are spawned instead of forked (Windows and macOS).
 
     Returns:
         | A dictionary containing one pandas DataFrame per driver. Dictionary keys are the driver's numbers as
@@ -900,7 +1014,8 @@ def car_data(path, response=None, livedata=None):
         is_livedata = True
     elif response is None:
         _logger.info("Fetching car data...")
-        response = fetch_page(path, 'car_data')
+        # records are parsed while the response is read
+        response = _fetch_stream_records(path, 'car_data')
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -914,68 +1029,23 @@ def car_data(path, response=None, livedata=None):
     columns = ['Time', 'Date', 'RPM', 'Speed', 'nGear', 'Throttle', 'Brake',
                'DRS', 'Source']  # correct order required!
 
-    ts_length = 12  # length of timestamp: len('00:00:00:000')
-
-    data = dict()
-    decode_error_count = 0
-
-    for record in response:
-        try:
-            if is_livedata:
-                time = to_timedelta(record[0])
-                jrecord: dict = parse(record[1], zipped=True)
-            else:
-                time = to_timedelta(record[:ts_length])
-                jrecord: dict = parse(record[ts_length:], zipped=True)
-
-            for entry in jrecord['Entries']:
-                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
-                # number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len
-                # 26 with zeroes if shorter
-                date = to_datetime(entry['Utc'])
-
-                for drv in entry['Cars']:
-                    if drv not in data:
-                        # initialize dict entry for this driver
-                        data[drv] = list()
-
-                    try:
-                        rpm = entry['Cars'][drv]['Channels']['0']
-                        speed = entry['Cars'][drv]['Channels']['2']
-                        ngear = entry['Cars'][drv]['Channels']['3']
-                        throttle = entry['Cars'][drv]['Channels']['4']
-                        brake = entry['Cars'][drv]['Channels']['5']
-                        drs = entry['Cars'][drv]['Channels']['45']
-
-                    except KeyError:
-                        continue
-
-                    data[drv].append((time, date, rpm, speed, ngear, throttle,
-                                      brake, drs, 'car'))
-
-        except Exception:
-            # too risky to specify an exception: unexpected invalid data!
-            decode_error_count += 1
-            continue
+    data, decode_error_count, record_count = _decode_records(
+        _decode_car_data, response, is_livedata, workers
+    )
 
     if decode_error_count > 0:
         _logger.warning(f"Car data: failed to decode {decode_error_count} "
-                        f"messages ({len(response)} messages total)")
+                        f"messages ({record_count} messages total)")
 
     # create one dataframe per driver and check for the longest dataframe
     most_complete_ref = None
     for drv in data:
-        arr_all = np.array(data[drv])
-        time = arr_all[:, 0].astype('timedelta64[ns]')
-        date = arr_all[:, 1].astype('datetime64[ns]')
-        rpm = arr_all[:, 2].astype('int64')
-        speed = arr_all[:, 3].astype('int64')
-        ngear = arr_all[:, 4].astype('int64')
-        throttle = arr_all[:, 5].astype('int64')
-        brake = arr_all[:, 6].astype('int64')  # converted to bool later
-        drs = arr_all[:, 7].astype('int64')
-        source = arr_all[:, 8].astype('object')
+        # brake is converted to bool later
+        time, date, rpm, speed, ngear, throttle, brake, drs \
+            = _buffers_to_arrays(data[drv])
+        time = time.view('timedelta64[ns]')
+        date = date.view('datetime64[ns]')
+        source = np.full(len(time), 'car', dtype=object)
 
         data[drv] = create_df_fast(
             arrays=[time, date,
@@ -1021,11 +1091,15 @@ def car_data(path, response=None, livedata=None):
             .fillna(value=False, inplace=False) \
             .astype('bool')
 
+    if drivers is not None:
+        data = {drv: data[drv] for drv in drivers if drv in data}
+
     return data
 
 
-@Cache.api_request_wrapper
-def position_data(path, response=None, livedata=None):
+@Cache.api_request_wrapper(parser_version=1)
+def position_data(path, response=None, livedata=None, drivers=None,
+                  workers=None):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
@@ -1047,6 +1121,12 @@ def position_data(path, response=None, livedata=None):
         path (str): api path base string (usually ``Session.api_path``)
         response: Response as returned by :func:`fetch_page` can be passed if it was downloaded already.
         livedata: An instance of :class:`fastf1.livetiming.data.LiveTimingData` to use as a source instead of the api
+        drivers (list, optional): Only return the data for these drivers (driver numbers as string). When the
+          cache is enabled, the data is cached for all drivers. Only the data for these drivers is read from it if
+          ``columnar_telemetry`` is enabled (see :func:`fastf1.Cache.enable_cache`).
+        workers (int, optional): Decode the data in this many processes in parallel. By default, the data is decoded
+          in the current process. Scripts that use this need an ``if __name__ == '__main__':`` guard on platforms
+          where new processes are spawned instead of forked (Windows and macOS).
 
     Returns:
         | A dictionary containing one pandas DataFrame per driver. Dictionary keys are the driver's numbers as
@@ -1064,7 +1144,8 @@ def position_data(path, response=None, livedata=None):
         is_livedata = True
     elif response is None:
         _logger.info("Fetching position data...")
-        response = fetch_page(path, 'position')
+        # records are parsed while the response is read
+        response = _fetch_stream_records(path, 'position')
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1076,72 +1157,25 @@ def position_data(path, response=None, livedata=None):
     if not response:
         return {}
 
-    ts_length = 12  # length of timestamp: len('00:00:00:000')
     columns = ['Time', 'Date', 'Status', 'X', 'Y', 'Z',
                'Source']  # correct order required!
 
-    data = dict()
-    decode_error_count = 0
-
-    for record in response:
-        try:
-            if is_livedata:
-                time = record[0]
-                jrecord: dict = parse(record[1], zipped=True)
-            else:
-                time = to_timedelta(record[:ts_length])
-                jrecord: dict = parse(record[ts_length:], zipped=True)
-
-            for sample in jrecord['Position']:
-                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
-                # number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len
-                # 26 with zeroes if shorter
-                date = to_datetime(sample['Timestamp'])
-
-                for drv in sample['Entries']:
-                    if drv not in data:
-                        # initialize dict entry for this driver
-                        data[drv] = list()
-
-                    try:
-                        x = sample['Entries'][drv]['X']
-                        y = sample['Entries'][drv]['Y']
-                        z = sample['Entries'][drv]['Z']
-                    except KeyError:
-                        continue
-
-                    try:
-                        status = sample['Entries'][drv]['Status']
-                    except KeyError:
-                        status = None
-                    if str(status).isdigit():
-                        # Fallback on older api status mapping and convert
-                        status = 'OffTrack' if int(status) else 'OnTrack'
-
-                    data[drv].append((time, date, status, x, y, z, 'pos'))
-
-        except Exception:
-            # too risky to specify an exception: unexpected invalid data!
-            decode_error_count += 1
-            continue
+    data, decode_error_count, record_count = _decode_records(
+        _decode_position_data, response, is_livedata, workers
+    )
 
     if decode_error_count > 0:
         _logger.warning(
             f"Position data: failed to decode {decode_error_count} "
-            f"messages ({len(response)} messages total)")
+            f"messages ({record_count} messages total)")
 
     # create one dataframe per driver and check for the longest dataframe
     most_complete_ref = None
     for drv in data:
-        arr_all = np.array(data[drv])
-        time = arr_all[:, 0].astype('timedelta64[ns]')
-        date = arr_all[:, 1].astype('datetime64[ns]')
-        status = arr_all[:, 2].astype('object')
-        x = arr_all[:, 3].astype('int64')
-        y = arr_all[:, 4].astype('int64')
-        z = arr_all[:, 5].astype('int64')
-        source = arr_all[:, 6].astype('object')
+        time, date, status, x, y, z = _buffers_to_arrays(data[drv])
+        time = time.view('timedelta64[ns]')
+        date = date.view('datetime64[ns]')
+        source = np.full(len(time), 'pos', dtype=object)
 
         data[drv] = create_df_fast(
             arrays=[time, date, status, x, y, z, source],
@@ -1175,10 +1209,278 @@ def position_data(path, response=None, livedata=None):
             _logger.warning(f"Driver {drv: >2}: Position data is "
                             f"incomplete!")
 
+    if drivers is not None:
+        data = {drv: data[drv] for drv in drivers if drv in data}
+
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
+def telemetry_date_offsets(path, response=None, livedata=None, workers=None):
+    """
+    .. warning::
+        :mod:`fastf1.api` will be considered private in future releases and
+        potentially be removed or changed.
+
+    Determine the offset between the ``Date`` and the ``Time`` of the car
+    data and position data of each driver.
+
+    The offsets of all drivers are needed for calculating
+    :attr:`fastf1.core.Session.t0_date`, also if telemetry data is only
+    loaded for some drivers. They are derived from :func:`car_data` and
+    :func:`position_data` once and then cached separately, so that this is
+    cheap when the telemetry data is cached.
+
+    Args:
+        path (str): api path base string (usually ``Session.api_path``)
+        response: Unused, for consistency with the other api functions.
+        livedata: An instance of :class:`fastf1.livetiming.data.LiveTimingData` to use as a source instead of the api
+        workers (int, optional): Decode the data in this many processes in parallel, if it is not cached yet.
+
+    Returns:
+        A dictionary with the latest offset (``max(Date - Time)``, a
+        :class:`pandas.Timestamp`) of car data and position data for each
+        driver. Drivers without telemetry data are not included.
+    """
+    offsets = dict()
+    for parser in (car_data, position_data):
+        try:
+            data = parser(path, livedata=livedata, workers=workers)
+        except SessionNotAvailableError:
+            continue
+        for drv, df in data.items():
+            offset = latest_date_offset(df)
+            if (drv not in offsets) or (offset > offsets[drv]):
+                offsets[drv] = offset
+    return offsets
+
+
+def latest_date_offset(df: pd.DataFrame) -> pd.Timestamp:
+    """Latest offset between the ``Date`` and ``Time`` of telemetry data,
+    ``max(Date - Time)``."""
+    return max(df['Date'] - df['Time'])
+
+
+# minimum number of records for decoding them in parallel
+_MIN_PARALLEL_RECORDS = 2000
+
+# Samples are accumulated in one growable buffer per channel. Timestamps are
+# stored as integer nanoseconds (NaT for missing timestamps), so that the
+# buffers can be used as typed arrays without conversion.
+
+
+def _convert_timestamps(data: dict, times: list, dates: list):
+    # Convert all raw timestamps at once and replace the indices in the Time
+    # and Date buffers (the first two buffers of each driver) by the
+    # timestamps as integer nanoseconds
+    times = to_timedelta_array(times).view('int64')
+    dates = to_datetime_array(dates).view('int64')
+    for buffers in data.values():
+        buffers[0] = array.array(
+            'q', times[np.frombuffer(buffers[0], dtype='int64')].tobytes()
+        )
+        buffers[1] = array.array(
+            'q', dates[np.frombuffer(buffers[1], dtype='int64')].tobytes()
+        )
+
+
+def _buffers_to_arrays(buffers: list) -> List[np.ndarray]:
+    # typed buffers are used without copying, other buffers (lists) are
+    # converted to object arrays
+    return [np.frombuffer(buffer, dtype='int64')
+            if isinstance(buffer, array.array)
+            else np.array(buffer, dtype=object)
+            for buffer in buffers]
+
+
+def _init_decode_worker(backend):
+    json_backend.set_json_backend(backend)
+
+
+def _decode_records(decoder, records, is_livedata, workers):
+    # Decode the records of car data or position data. With more than one
+    # worker, the records are split into chunks that are decoded in a pool of
+    # processes. The results are merged in the order of the records.
+    # Returns a dict with one list of per-channel buffers for each driver
+    # (see `_buffers_to_arrays`), the number of records that failed to decode
+    # and the total number of records.
+    if (workers is None) or (workers <= 1):
+        return decoder(records, is_livedata)
+
+    records = list(records)
+    if len(records) < _MIN_PARALLEL_RECORDS:
+        # not worth the overhead of starting processes
+        return decoder(records, is_livedata)
+
+    # more chunks than workers for balancing the load between processes
+    chunk_size = -(-len(records) // (workers * 4))
+    chunks = [records[i:i + chunk_size]
+              for i in range(0, len(records), chunk_size)]
+
+    data = dict()
+    decode_error_count = 0
+    record_count = 0
+    # the JSON backend is passed explicitly, because spawned processes do not
+    # inherit the selection of this process
+    with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_init_decode_worker,
+            initargs=(json_backend.get_json_backend(), )) as pool:
+        for chunk_data, chunk_errors, chunk_count in pool.map(
+                decoder, chunks, [is_livedata] * len(chunks)):
+            for drv, buffers in chunk_data.items():
+                if drv not in data:
+                    data[drv] = buffers
+                    continue
+                for buffer, chunk_buffer in zip(data[drv], buffers):
+                    buffer.extend(chunk_buffer)
+            decode_error_count += chunk_errors
+            record_count += chunk_count
+    return data, decode_error_count, record_count
+
+
+def _to_int_or_fill(value, fill=0):
+    # integer channel value; invalid or missing values are replaced with the
+    # same fill value that is used for missing samples
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return fill
+
+
+def _decode_car_data(records, is_livedata):
+    ts_length = 12  # length of timestamp: len('00:00:00:000')
+
+    data = dict()
+    decode_error_count = 0
+    record_count = 0
+    # raw timestamps of all records and samples; the Time and Date buffers
+    # store indices into these lists until all timestamps are converted
+    times = list()
+    dates = list()
+
+    for record in records:
+        record_count += 1
+        try:
+            if is_livedata:
+                jrecord: dict = parse(record[1], zipped=True)
+                times.append(record[0])
+            else:
+                jrecord: dict = parse(record[ts_length:], zipped=True)
+                times.append(record[:ts_length])
+            time = len(times) - 1
+
+            for entry in jrecord['Entries']:
+                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
+                # number of millisecond decimal points
+                # always remove last char ('z'), max len 26, right pad to len
+                # 26 with zeroes if shorter
+                dates.append(entry['Utc'])
+                date = len(dates) - 1
+
+                for drv in entry['Cars']:
+                    if drv not in data:
+                        # initialize one buffer per channel for this driver:
+                        # Time, Date, RPM, Speed, nGear, Throttle, Brake, DRS
+                        data[drv] = [array.array('q') for _ in range(8)]
+
+                    try:
+                        channels = entry['Cars'][drv]['Channels']
+                        values = (channels['0'], channels['2'],
+                                  channels['3'], channels['4'],
+                                  channels['5'], channels['45'])
+                    except KeyError:
+                        continue
+                    try:
+                        sample = (time, date, *map(int, values))
+                    except (TypeError, ValueError):
+                        # invalid values are replaced individually, so
+                        # that the valid channels of the sample are kept
+                        sample = (time, date, *map(_to_int_or_fill, values))
+
+                    for buffer, value in zip(data[drv], sample):
+                        buffer.append(value)
+
+        except Exception:
+            # too risky to specify an exception: unexpected invalid data!
+            decode_error_count += 1
+            continue
+
+    _convert_timestamps(data, times, dates)
+    return data, decode_error_count, record_count
+
+
+def _decode_position_data(records, is_livedata):
+    ts_length = 12  # length of timestamp: len('00:00:00:000')
+
+    data = dict()
+    decode_error_count = 0
+    record_count = 0
+    # raw timestamps of all records and samples; the Time and Date buffers
+    # store indices into these lists until all timestamps are converted
+    times = list()
+    dates = list()
+
+    for record in records:
+        record_count += 1
+        try:
+            if is_livedata:
+                jrecord: dict = parse(record[1], zipped=True)
+                times.append(record[0])
+            else:
+                jrecord: dict = parse(record[ts_length:], zipped=True)
+                times.append(record[:ts_length])
+            time = len(times) - 1
+
+            for sample in jrecord['Position']:
+                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
+                # number of millisecond decimal points
+                # always remove last char ('z'), max len 26, right pad to len
+                # 26 with zeroes if shorter
+                dates.append(sample['Timestamp'])
+                date = len(dates) - 1
+
+                for drv in sample['Entries']:
+                    if drv not in data:
+                        # initialize one buffer per channel for this driver:
+                        # Time, Date, Status, X, Y, Z
+                        data[drv] = [array.array('q'), array.array('q'),
+                                     list(), array.array('q'),
+                                     array.array('q'), array.array('q')]
+
+                    try:
+                        values = (sample['Entries'][drv]['X'],
+                                  sample['Entries'][drv]['Y'],
+                                  sample['Entries'][drv]['Z'])
+                    except KeyError:
+                        continue
+                    try:
+                        x, y, z = map(int, values)
+                    except (TypeError, ValueError):
+                        # invalid values are replaced individually
+                        x, y, z = map(_to_int_or_fill, values)
+
+                    try:
+                        status = sample['Entries'][drv]['Status']
+                    except KeyError:
+                        status = None
+                    if str(status).isdigit():
+                        # Fallback on older api status mapping and convert
+                        status = 'OffTrack' if int(status) else 'OnTrack'
+
+                    for buffer, value in zip(data[drv],
+                                             (time, date, status, x, y, z)):
+                        buffer.append(value)
+
+        except Exception:
+            # too risky to specify an exception: unexpected invalid data!
+            decode_error_count += 1
+            continue
+
+    _convert_timestamps(data, times, dates)
+    return data, decode_error_count, record_count
+
+
+@Cache.api_request_wrapper(parser_version=1)
 def track_status_data(path, response=None, livedata=None):
     """
     .. warning::
@@ -1241,14 +1543,15 @@ def track_status_data(path, response=None, livedata=None):
         row = entry[1]
         if not isinstance(row, dict):
             continue
-        data['Time'].append(to_timedelta(entry[0]))
+        data['Time'].append(entry[0])
         data['Status'].append(row.get('Status', ''))
         data['Message'].append(row.get('Message', ''))
 
+    data['Time'] = _to_timedelta_list(data['Time'])
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def session_status_data(path, response=None, livedata=None):
     """
     .. warning::
@@ -1304,7 +1607,7 @@ def session_status_data(path, response=None, livedata=None):
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def race_control_messages(path, response=None, livedata=None):
     """
     .. warning::
@@ -1372,7 +1675,7 @@ def race_control_messages(path, response=None, livedata=None):
         if isinstance(messages, dict):
             messages = list(messages.values())
         for entry in messages:
-            data['Time'].append(to_datetime(entry['Utc']))
+            data['Time'].append(entry['Utc'])
 
             for key, conv in zip(data_keys, converters):
                 try:
@@ -1381,10 +1684,11 @@ def race_control_messages(path, response=None, livedata=None):
                     # type conversion failed or key is missing
                     data[key].append(None)
 
+    data['Time'] = _to_datetime_list(data['Time'])
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def lap_count(path, response=None, livedata=None):
     """
     .. warning::
@@ -1436,7 +1740,7 @@ def lap_count(path, response=None, livedata=None):
     converters = (int, int)
 
     for entry in response:
-        data['Time'].append(to_timedelta(entry[0]))
+        data['Time'].append(entry[0])
 
         for key, conv in zip(data_keys, converters):
             try:
@@ -1445,10 +1749,11 @@ def lap_count(path, response=None, livedata=None):
                 # type conversion failed or key is missing
                 data[key].append(None)
 
+    data['Time'] = _to_timedelta_list(data['Time'])
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def driver_info(path, response=None, livedata=None):
     """
     .. warning::
@@ -1537,7 +1842,7 @@ def driver_info(path, response=None, livedata=None):
         return drv_info
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def weather_data(path, response=None, livedata=None):
     """
     .. warning::
@@ -1606,7 +1911,7 @@ def weather_data(path, response=None, livedata=None):
         if not isinstance(row, dict):
             continue
 
-        data['Time'].append(to_timedelta(entry[0]))
+        data['Time'].append(entry[0])
         for key, conv in zip(data_keys, converters):
             try:
                 data[key].append(conv(row[key]))
@@ -1614,10 +1919,11 @@ def weather_data(path, response=None, livedata=None):
                 # type conversion failed or key is missing
                 data[key].append(conv(0))
 
+    data['Time'] = _to_timedelta_list(data['Time'])
     return data
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def season_schedule(path, response=None):
     if response is None:
         _logger.info("Fetching season schedule...")
@@ -1631,7 +1937,7 @@ def season_schedule(path, response=None):
     return response['Meetings']
 
 
-@Cache.api_request_wrapper
+@Cache.api_request_wrapper(parser_version=1)
 def session_info(path, response=None, livedata=None):
     """
     .. warning::
@@ -1694,35 +2000,121 @@ def fetch_page(path, name):
     page = pages[name]
     is_stream = 'jsonStream' in page
     is_z = '.z.' in page
+    if is_stream:
+        records = _fetch_stream_records(path, name)
+        if records is None:
+            return None
+        records = list(records)
+        if name in ('position', 'car_data'):
+            # Special case to improve memory efficiency
+            return records
+        else:
+            decode_error_count = 0
+            tl = 12  # length of timestamp: len('00:00:00:000')
+            ret = list()
+            for e in records:
+                try:
+                    ret.append([e[:tl], parse(e[tl:], zipped=is_z)])
+                except json_backend.JSONDecodeError:
+                    decode_error_count += 1
+                    continue
+            if decode_error_count > 0:
+                _logger.warning(f"Failed to decode {decode_error_count}"
+                                f" messages ({len(records)} messages "
+                                f"total)")
+            return ret
+
     r = Cache.requests_get(base_url + path + pages[name], headers=headers)
     if r.status_code == 200:
-        raw = r.content.decode('utf-8-sig')
-        if is_stream:
-            records = raw.split('\r\n')[:-1]  # last split is empty
-            if name in ('position', 'car_data'):
-                # Special case to improve memory efficiency
-                return records
-            else:
-                decode_error_count = 0
-                tl = 12  # length of timestamp: len('00:00:00:000')
-                ret = list()
-                for e in records:
-                    try:
-                        ret.append([e[:tl], parse(e[tl:], zipped=is_z)])
-                    except json.JSONDecodeError:
-                        decode_error_count += 1
-                        continue
-                if decode_error_count > 0:
-                    _logger.warning(f"Failed to decode {decode_error_count}"
-                                    f" messages ({len(records)} messages "
-                                    f"total)")
-                return ret
-        else:
-            return parse(raw, is_z)
+        return parse(r.content.decode('utf-8-sig'), is_z)
     else:
         return None
 
 
+def prefetch_pages(path: str, names: Iterable[str], max_workers: int = 4):
+    """Download pages concurrently into the requests cache or the raw store,
+    without parsing them.
+
+    Pages are skipped if their parsed data is cached already and up to date,
+    or if their response is cached and not expired. Afterwards, the pages can be parsed one after another without
+    waiting for the network. Errors are ignored here, they occur again when
+    a page is fetched for parsing.
+
+    Args:
+        path: api path base string (usually ``Session.api_path``)
+        names: page names (see ``api.pages``)
+        max_workers: maximum number of concurrent requests
+    """
+    if (Cache._CACHE_DIR is None) or Cache._tmp_disabled \
+            or (Cache._backend is not None):
+        # nothing to download to, or pages are likely available from the
+        # backend in parsed form
+        return
+    if (Cache._requests_session_cached is None) \
+            and (Cache._raw_store is None):
+        return
+    if (Cache._requests_session_cached is not None) \
+            and Cache._requests_session_cached.settings.only_if_cached:
+        return  # offline mode
+
+    missing = list()
+    for name in names:
+        parser = page_parsers.get(name)
+        if (parser is not None) \
+                and Cache._cache_entry_ok_for_use(path, globals()[parser]):
+            continue  # not needed, the parsed data is used
+        if Cache._has_fresh_response(base_url + path + pages[name]):
+            # downloaded already and not expired; expired responses are
+            # revalidated here
+            continue
+        missing.append(name)
+    if len(missing) < 2:
+        return  # no benefit
+
+    def _fetch(name):
+        url = base_url + path + pages[name]
+        if 'jsonStream' not in pages[name]:
+            Cache.requests_get(url, headers=headers)
+        else:
+            # the body is stored in the raw store while it is read
+            for _ in Cache.requests_get_stream(url, headers=headers) or ():
+                pass
+
+    _logger.debug(f"Prefetching {len(missing)} pages")
+    with concurrent.futures.ThreadPoolExecutor(
+            min(max_workers, len(missing))) as pool:
+        futures = {pool.submit(_fetch, name): name for name in missing}
+        for future in concurrent.futures.as_completed(futures):
+            if (exc := future.exception()) is not None:
+                _logger.debug(f"Failed to prefetch {futures[future]}",
+                              exc_info=exc)
+
+
+def _fetch_stream_records(path: str, name: str) -> Optional[Iterator[str]]:
+    # Fetch a jsonStream page and return an iterator over its records (not
+    # parsed). The response body is read and split into records
+    # incrementally, as the iterator is consumed. Returns None if the
+    # request failed.
+    content = Cache.requests_get_stream(base_url + path + pages[name],
+                                        headers=headers)
+    if content is None:
+        return None
+    return _iter_stream_records(content)
+
+
+def _iter_stream_records(content: Iterable[bytes]) -> Iterator[str]:
+    # Split the body of a jsonStream response into records, while it is read
+    # in chunks. Equivalent to `body.decode('utf-8-sig').split('\r\n')[:-1]`,
+    # i.e. data after the last line break is dropped.
+    rest = b''
+    encoding = 'utf-8-sig'  # strip BOM from the first record
+    for chunk in content:
+        *lines, rest = (rest + chunk).split(b'\r\n')
+        for line in lines:
+            yield line.decode(encoding)
+            encoding = 'utf-8'
+
+
 def parse(text: str, zipped: bool = False) -> Union[str, dict]:
     """
     .. warning::
@@ -1745,7 +2137,7 @@ def parse(text: str, zipped: bool = False) -> Union[str, dict]:
             - a string
     """
     if text[0] == '{':
-        return json.loads(text)
+        return json_backend.loads(text)
     if text[0] == '"':
         text = text.strip('"')
     if zipped:
@@ -0,0 +1,32 @@
+"""Tools for managing the FastF1 cache.
+
+The cache itself is configured through :class:`fastf1.Cache`. This package
+provides additional tools, for example to fill the cache for a whole season
+in advance. These are also available from the command line::
+
+    python -m fastf1.cache warm --year 2023 --sessions R,Q
+
+The cached data of a season can be moved to another machine as a single
+file with :mod:`fastf1.cache.bundle`::
+
+    python -m fastf1.cache export --year 2023 --path 2023.ff1bundle
+
+A cache can be shared between multiple machines using one of the storage
+backends in :mod:`fastf1.cache.backends`.
+"""
+from fastf1.cache.backends import (  # noqa F401
+    CacheBackend,
+    HTTPBackend,
+    LocalDirectoryBackend,
+    SharedDirectoryBackend
+)
+from fastf1.cache.bundle import (  # noqa F401
+    BundleSummary,
+    export_bundle,
+    import_bundle
+)
+from fastf1.cache.warm import (  # noqa F401
+    WarmUpResult,
+    warm_cache,
+    warm_sessions
+)
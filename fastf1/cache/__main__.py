@@ -0,0 +1,118 @@
+import argparse
+import sys
+
+from fastf1.cache.warm import warm_cache
+from fastf1.req import Cache
+
+
+def warm(args):
+    sessions = args.sessions.split(',') if args.sessions else None
+    result = warm_cache(args.year, sessions, cache_dir=args.cache_dir,
+                        fetch_workers=args.fetch_workers,
+                        parse_workers=args.parse_workers)
+
+    print(f"Sessions: {result.sessions}\n"
+          f"Pages parsed: {result.parsed} ({result.bytes / 1e6:.1f} MB)\n"
+          f"Pages cached already: {result.cached}\n"
+          f"Pages unavailable: {result.unavailable}\n"
+          f"Duration: {result.duration:.0f}s")
+    if result.failures:
+        print(f"Failed pages: {len(result.failures)}")
+        for api_path, page, error in result.failures:
+            print(f"  {api_path}{page}: {error}")
+        sys.exit(1)
+
+
+def export(args):
+    if args.cache_dir is not None:
+        Cache.enable_cache(args.cache_dir)
+    result = Cache.export_bundle(args.year, args.path,
+                                 compression=args.compression)
+    print(f"Parsed entries: {result.parsed}\n"
+          f"Responses: {result.responses}\n"
+          f"Bundle size: {result.bytes / 1e6:.1f} MB\n"
+          f"Duration: {result.duration:.0f}s")
+
+
+def import_(args):
+    if args.cache_dir is not None:
+        Cache.enable_cache(args.cache_dir)
+    try:
+        result = Cache.import_bundle(args.path)
+    except ValueError as exc:
+        print(f"Import failed: {exc}")
+        sys.exit(1)
+    print(f"Season: {result.year}\n"
+          f"Parsed entries: {result.parsed}\n"
+          f"Responses: {result.responses}\n"
+          f"Duration: {result.duration:.0f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m fastf1.cache",
+        description="Manage the FastF1 cache",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    subparsers = parser.add_subparsers()
+
+    warm_parser = subparsers.add_parser(
+        'warm', help='Fill the cache with the data of a whole season',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    warm_parser.add_argument('--year', type=int, required=True,
+                             help='Championship year')
+    warm_parser.add_argument('--sessions', type=str, default=None,
+                             help="Comma separated session identifiers, "
+                                  "e.g. 'R,Q'. By default, all sessions are "
+                                  "included.")
+    warm_parser.add_argument('--cache-dir', type=str, default=None,
+                             help='Cache directory. By default, the default '
+                                  'cache location is used.')
+    warm_parser.add_argument('--fetch-workers', type=int, default=4,
+                             help='Number of threads that download data')
+    warm_parser.add_argument('--parse-workers', type=int, default=None,
+                             help='Number of processes that parse data. By '
+                                  'default, one process per CPU is used.')
+    warm_parser.set_defaults(func=warm)
+
+    export_parser = subparsers.add_parser(
+        'export', help='Pack the cached data of a season into a bundle file',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    export_parser.add_argument('--year', type=int, required=True,
+                               help='Championship year')
+    export_parser.add_argument('--path', type=str, required=True,
+                               help='Path of the bundle file')
+    export_parser.add_argument('--compression', type=str, default='zlib',
+                               choices=['zlib', 'zstd', 'lz4'],
+                               help='Compression codec')
+    export_parser.add_argument('--cache-dir', type=str, default=None,
+                               help='Cache directory. By default, the '
+                                    'default cache location is used.')
+    export_parser.set_defaults(func=export)
+
+    import_parser = subparsers.add_parser(
+        'import', help='Unpack a bundle file into the cache',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    import_parser.add_argument('--path', type=str, required=True,
+                               help='Path of the bundle file')
+    import_parser.add_argument('--cache-dir', type=str, default=None,
+                               help='Cache directory. By default, the '
+                                    'default cache location is used.')
+    import_parser.set_defaults(func=import_)
+
+    if not len(sys.argv) > 1:
+        # user did not provide any arguments
+        parser.print_help()
+        parser.exit(1)
+
+    args = parser.parse_args()
+    args.func(args)  # call function associated with subparser
+
+
+if __name__ == '__main__':
+    # guarded, because worker processes may import this module again
+    main()
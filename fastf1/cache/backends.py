@@ -0,0 +1,223 @@
+"""Storage backends for sharing a cache between multiple machines.
+
+A backend is an additional, shared tier behind the local cache directory
+(see ``backend`` in :func:`fastf1.Cache.enable_cache`). Parsed data (stage 2)
+and raw responses of the live timing API's data streams (stage 1) that are
+not available locally are looked up in the backend before they are
+downloaded and parsed. Data that had to be downloaded or parsed locally is
+added to the backend, unless the backend is read-only. One warm cache can
+therefore serve any number of machines.
+
+The local cache directory is always used as the working copy, because cached
+data is memory mapped and locked locally. Data from the backend is copied to
+the local cache directory when it is used for the first time.
+
+Backends store binary objects under keys. A key is a relative path with
+``'/'`` as separator, for example
+``'parsed/2023/2023-03-05_Bahrain_Grand_Prix/2023-03-05_Race/car_data.ff1pkl'``.
+Custom backends can be implemented by subclassing :class:`CacheBackend`.
+"""
+import abc
+import os
+import threading
+import urllib.parse
+from typing import Iterator, Optional
+
+import requests
+
+
+class CacheBackend(abc.ABC):
+    """Interface for cache storage backends.
+
+    Implementations need to be safe for concurrent use by multiple threads.
+    """
+
+    read_only: bool = False
+    """If ``True``, data is only read from the backend and never added to
+    it"""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the data that is stored under a key or ``None`` if the key
+        does not exist."""
+
+    @abc.abstractmethod
+    def put(self, key: str, data: bytes):
+        """Store data under a key, replacing any existing data. The data
+        needs to become visible to readers atomically."""
+
+    @abc.abstractmethod
+    def exists(self, key: str) -> bool:
+        """Return whether a key exists."""
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Remove a key. Keys that do not exist are ignored."""
+
+    @abc.abstractmethod
+    def list(self, prefix: str = '') -> Iterator[str]:
+        """Iterate over all keys that start with a prefix."""
+
+
+class LocalDirectoryBackend(CacheBackend):
+    """Backend that stores each key as a file in a directory.
+
+    Args:
+        path: path of the directory (will be created if necessary)
+    """
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(os.path.expandvars(path))
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+    def _file_path(self, key: str) -> str:
+        parts = key.split('/')
+        if any(part in ('', '.', '..') for part in parts):
+            raise ValueError(f"Invalid cache key '{key}'")
+        return os.path.join(self.path, *parts)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._file_path(key), 'rb') as fobj:
+                return fobj.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        path = self._file_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first, so that readers never see
+        # incomplete data
+        tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.ff1tmp"
+        try:
+            with open(tmp_path, 'wb') as fobj:
+                fobj.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+    def exists(self, key: str) -> bool:
+        return os.path.isfile(self._file_path(key))
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._file_path(key))
+        except FileNotFoundError:
+            pass
+
+    def list(self, prefix: str = '') -> Iterator[str]:
+        for dirpath, _, filenames in os.walk(self.path):
+            rel_dir = os.path.relpath(dirpath, self.path)
+            for filename in filenames:
+                if filename.endswith('.ff1tmp'):
+                    continue
+                key = filename if rel_dir == '.' \
+                    else '/'.join(rel_dir.split(os.sep) + [filename])
+                if key.startswith(prefix):
+                    yield key
+
+
+class SharedDirectoryBackend(LocalDirectoryBackend):
+    """Backend for a directory that is shared by multiple machines, for
+    example on a network file system.
+
+    The shared directory is read-only by default, so that it can be
+    populated by a single machine (e.g. with
+    :func:`fastf1.cache.warm_cache`) and then be used by all others. Writes
+    are atomic, so a writable shared directory can also be used by multiple
+    machines concurrently, as long as the file system supports atomic
+    renames.
+
+    Args:
+        path: path of the shared directory
+        read_only: never add or remove data
+    """
+    def __init__(self, path: str, read_only: bool = True):
+        self.read_only = read_only
+        if read_only:
+            self.path = os.path.expanduser(os.path.expandvars(path))
+        else:
+            super().__init__(path)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r}, " \
+               f"read_only={self.read_only})"
+
+    def put(self, key: str, data: bytes):
+        if self.read_only:
+            raise PermissionError(f"{self!r} is read-only")
+        super().put(key, data)
+
+    def delete(self, key: str):
+        if self.read_only:
+            raise PermissionError(f"{self!r} is read-only")
+        super().delete(key)
+
+
+class HTTPBackend(CacheBackend):
+    """Backend for a simple HTTP object store.
+
+    Each key is mapped to the URL ``<base_url>/<key>``. Data is read with
+    ``GET`` and ``HEAD`` requests and written and removed with ``PUT`` and
+    ``DELETE`` requests. Listing keys requires that the server returns a
+    JSON array of keys for ``GET <base_url>/?prefix=<prefix>``.
+
+    Args:
+        base_url: URL of the object store
+        read_only: never add or remove data
+        timeout: timeout for each request in seconds
+        headers: additional headers for all requests, for example for
+            authentication
+    """
+    def __init__(self, base_url: str, read_only: bool = False,
+                 timeout: float = 30.0, headers: Optional[dict] = None):
+        self.base_url = base_url.rstrip('/')
+        self.read_only = read_only
+        self.timeout = timeout
+        self._session = requests.Session()
+        if headers:
+            self._session.headers.update(headers)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.base_url!r}, " \
+               f"read_only={self.read_only})"
+
+    def _url(self, key: str) -> str:
+        return f"{self.base_url}/{urllib.parse.quote(key)}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        r = self._session.get(self._url(key), timeout=self.timeout)
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.content
+
+    def put(self, key: str, data: bytes):
+        if self.read_only:
+            raise PermissionError(f"{self!r} is read-only")
+        r = self._session.put(self._url(key), data=data,
+                              timeout=self.timeout)
+        r.raise_for_status()
+
+    def exists(self, key: str) -> bool:
+        r = self._session.head(self._url(key), timeout=self.timeout)
+        if r.status_code == 404:
+            return False
+        r.raise_for_status()
+        return True
+
+    def delete(self, key: str):
+        if self.read_only:
+            raise PermissionError(f"{self!r} is read-only")
+        r = self._session.delete(self._url(key), timeout=self.timeout)
+        if r.status_code != 404:
+            r.raise_for_status()
+
+    def list(self, prefix: str = '') -> Iterator[str]:
+        r = self._session.get(self.base_url + '/', params={'prefix': prefix},
+                              timeout=self.timeout)
+        r.raise_for_status()
+        yield from r.json()
@@ -0,0 +1,478 @@
+"""Portable cache bundles.
+
+A bundle contains the cached data of one season in a single compressed
+archive: the parsed data (stage 2) and the raw responses from the requests
+cache and from the raw store (stage 1). It can be moved to another machine,
+for example one without internet access, and imported into its cache
+directory there. This is much faster than copying the cache directory,
+which consists of thousands of small files and one large SQLite database
+that contains the responses of all seasons.
+
+A bundle is a tar archive that is compressed as a whole with one of the
+codecs in :mod:`fastf1.internals.compression`. Its first member is
+``manifest.json``, an index of all other members with their size and
+SHA-256 digest. The archive is written and read sequentially and every
+member is verified when the bundle is imported.
+
+Bundles are usually created and imported through
+:func:`fastf1.Cache.export_bundle` and :func:`fastf1.Cache.import_bundle` or
+from the command line::
+
+    python -m fastf1.cache export --year 2023 --path 2023.ff1bundle
+    python -m fastf1.cache import --path 2023.ff1bundle
+"""
+import dataclasses
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tarfile
+import time
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastf1.internals import columnar, compression
+from fastf1.internals.cache_index import CacheIndex, INDEX_FILE_NAME
+from fastf1.internals.raw_store import RawEntry, RawStore
+from fastf1.logger import get_logger
+from fastf1.req import Cache
+from fastf1.version import __version__
+
+
+_logger = get_logger(__name__)
+
+
+BUNDLE_FORMAT = 1
+"""Version of the bundle format"""
+
+MANIFEST_NAME = 'manifest.json'
+
+_HTTP_CACHE_NAME = 'fastf1_http_cache'
+
+
+@dataclasses.dataclass
+class BundleSummary:
+    """Summary of an exported or imported bundle."""
+
+    year: int
+    """Championship year"""
+    parsed: int = 0
+    """Number of parsed data entries (stage 2)"""
+    responses: int = 0
+    """Number of raw responses (stage 1)"""
+    bytes: int = 0
+    """Size of the bundle file in bytes"""
+    duration: float = 0.0
+    """Total duration in seconds"""
+
+
+def export_bundle(year: int, path: str, cache_dir: str, *,
+                  codec: str = 'zlib',
+                  level: Optional[int] = None) -> BundleSummary:
+    """Pack the cached data of one season into a bundle file.
+
+    Args:
+        year: championship year
+        path: path of the bundle file, an existing file is replaced
+        cache_dir: path of the cache directory
+        codec: compression codec of the bundle, see
+            :mod:`fastf1.internals.compression`
+        level: compression level, the codec's default level if ``None``
+
+    Returns:
+        a summary of the exported data
+    """
+    compression.check_codec(codec)
+    t_start = time.perf_counter()
+    summary = BundleSummary(year)
+
+    # collect the members and their digests first, so that the manifest
+    # can be written at the start of the archive
+    members = list()
+    for rel_path, file_path in _iter_parsed_files(cache_dir, year):
+        size, digest = _hash_file(file_path)
+        members.append({'name': f'parsed/{rel_path}', 'type': 'parsed',
+                        'path': rel_path, 'size': size, 'sha256': digest,
+                        'source': file_path})
+    summary.parsed = len({_entry_path(m['path']) for m in members})
+
+    store_dir = os.path.join(cache_dir, Cache._RAW_STORE_DIR)
+    if os.path.isdir(store_dir):
+        store = RawStore(store_dir)
+        objects: Dict[str, dict] = dict()
+        for entry in store.entries():
+            if not _is_season_url(entry.url, year):
+                continue
+            if entry.digest not in objects:
+                file_path = store.object_path(entry.digest)
+                size, digest = _hash_file(file_path)
+                objects[entry.digest] = {
+                    'name': f'raw/{entry.digest}.ff1raw', 'type': 'raw',
+                    'size': size, 'sha256': digest, 'source': file_path,
+                    'responses': list()
+                }
+            objects[entry.digest]['responses'].append(entry._asdict())
+            summary.responses += 1
+        members.extend(objects.values())
+
+    for i, (key, columns, value) in enumerate(
+            _iter_http_responses(cache_dir, year)):
+        members.append({'name': f'http/{i}', 'type': 'http', 'key': key,
+                        'columns': columns, 'size': len(value),
+                        'sha256': hashlib.sha256(value).hexdigest()})
+        summary.responses += 1
+
+    manifest = {
+        'format': BUNDLE_FORMAT,
+        'year': year,
+        'created': time.time(),
+        'fastf1_version': __version__,
+        'members': [{k: v for k, v in m.items() if k != 'source'}
+                    for m in members]
+    }
+
+    tmp_path = f"{path}.{os.getpid()}.ff1tmp"
+    try:
+        with open(tmp_path, 'wb') as fobj, \
+                compression.stream_writer(fobj, codec, level) as stream, \
+                tarfile.open(fileobj=stream, mode='w|') as tar:
+            _add_member(tar, MANIFEST_NAME,
+                        io.BytesIO(json.dumps(manifest).encode()))
+            http_values = _iter_http_values(cache_dir, members)
+            for member in members:
+                if member['type'] == 'http':
+                    value = next(http_values)
+                    _add_member(tar, member['name'], io.BytesIO(value),
+                                size=member['size'])
+                else:
+                    with open(member['source'], 'rb') as src:
+                        _add_member(tar, member['name'], src,
+                                    size=member['size'])
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+    summary.bytes = os.path.getsize(path)
+    summary.duration = time.perf_counter() - t_start
+    _logger.info(f"Exported {summary.parsed} parsed entries and "
+                 f"{summary.responses} responses for {year} to '{path}'")
+    return summary
+
+
+def import_bundle(path: str, cache_dir: str) -> BundleSummary:
+    """Unpack a bundle into a cache directory.
+
+    All members of the bundle are extracted to a temporary directory and
+    verified first. Only then are they moved into the cache, replacing
+    existing entries. If the bundle is damaged, the cache is not modified.
+
+    Args:
+        path: path of the bundle file
+        cache_dir: path of the cache directory
+
+    Returns:
+        a summary of the imported data
+
+    Raises:
+        ValueError: the file is not a valid bundle or it is damaged
+    """
+    t_start = time.perf_counter()
+    staging_dir = os.path.join(cache_dir,
+                               f'bundle.{os.getpid()}.ff1tmp')
+    os.makedirs(staging_dir)
+    try:
+        manifest = _extract(path, staging_dir)
+        summary = BundleSummary(manifest['year'],
+                                bytes=os.path.getsize(path))
+        members = manifest['members']
+        staged = {m['name']: os.path.join(staging_dir, str(i))
+                  for i, m in enumerate(members)}
+
+        summary.parsed = _commit_parsed(
+            cache_dir, [(m, staged[m['name']]) for m in members
+                        if m['type'] == 'parsed']
+        )
+
+        raw_members = [m for m in members if m['type'] == 'raw']
+        if raw_members:
+            store = RawStore(os.path.join(cache_dir, Cache._RAW_STORE_DIR))
+            for member in raw_members:
+                for response in member['responses']:
+                    with open(staged[member['name']], 'rb') as fobj:
+                        store.add(RawEntry(**response), fobj)
+                    summary.responses += 1
+
+        http_members = [m for m in members if m['type'] == 'http']
+        if http_members:
+            summary.responses += _commit_http(
+                cache_dir, [(m, staged[m['name']]) for m in http_members]
+            )
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    summary.duration = time.perf_counter() - t_start
+    _logger.info(f"Imported {summary.parsed} parsed entries and "
+                 f"{summary.responses} responses for {summary.year} from "
+                 f"'{path}'")
+    return summary
+
+
+def _is_season_url(url: str, year: int) -> bool:
+    # the year is a path component (live timing API, Ergast) or part of the
+    # file name (schedule)
+    return re.search(rf'[/_]{year}(?:[/.?]|$)', url) is not None
+
+
+def _iter_parsed_files(cache_dir: str, year: int) \
+        -> Iterator[Tuple[str, str]]:
+    # (relative path, path) of all files of all parsed entries of a season
+    season_dir = os.path.join(cache_dir, str(year))
+    for dirpath, dirnames, filenames in os.walk(season_dir):
+        dirnames.sort()
+        for dirname in list(dirnames):
+            if dirname.endswith('.ff1tmp'):
+                dirnames.remove(dirname)
+        is_columnar = dirpath.endswith(columnar.COLUMNAR_SUFFIX)
+        if is_columnar and (columnar.read_columnar_meta(dirpath) is None):
+            continue  # incomplete entry
+        if not is_columnar:
+            filenames = [f for f in filenames if f.endswith('.ff1pkl')]
+        for filename in sorted(filenames):
+            file_path = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(file_path, cache_dir)
+            yield '/'.join(rel_path.split(os.sep)), file_path
+
+
+def _entry_path(rel_path: str) -> str:
+    # relative path of the entry (file or columnar directory) of a file
+    parent = rel_path.rpartition('/')[0]
+    if parent.endswith(columnar.COLUMNAR_SUFFIX):
+        return parent
+    return rel_path
+
+
+def _hash_file(path: str) -> Tuple[int, str]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as fobj:
+        while chunk := fobj.read(1 << 20):
+            digest.update(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+
+def _add_member(tar: tarfile.TarFile, name: str, fobj: BinaryIO,
+                size: Optional[int] = None):
+    info = tarfile.TarInfo(name)
+    if size is None:
+        size = len(fobj.getvalue())
+    info.size = size
+    info.mtime = int(time.time())
+    tar.addfile(info, fobj)
+
+
+def _open_http_cache(cache_dir: str):
+    from requests_cache.backends.sqlite import SQLiteCache
+    return SQLiteCache(os.path.join(cache_dir, _HTTP_CACHE_NAME))
+
+
+def _iter_http_responses(cache_dir: str, year: int) \
+        -> Iterator[Tuple[str, dict, bytes]]:
+    # (key, other columns, serialized response) of all responses of a season
+    # in the requests cache; the rows are copied as they are, so that the
+    # responses do not need to be serialized again
+    db_path = os.path.join(cache_dir, _HTTP_CACHE_NAME + '.sqlite')
+    if not os.path.isfile(db_path):
+        return
+    responses = _open_http_cache(cache_dir).responses
+    # all rows are read in a single pass, each value only once
+    con = sqlite3.connect(db_path, timeout=30)
+    try:
+        cursor = con.execute(f"SELECT * FROM {responses.table_name}")
+        columns = [col[0] for col in cursor.description]
+        for values in cursor:
+            row = dict(zip(columns, values))
+            key, value = row['key'], bytes(row.pop('value'))
+            # the url is only known after deserializing the response with
+            # the serializer of the requests cache
+            response = responses.deserialize(key, value)
+            if response is None:
+                _logger.debug(f"Skipping unreadable cached response '{key}'")
+                continue
+            if _is_season_url(response.url, year):
+                yield key, row, value
+    finally:
+        con.close()
+
+
+def _iter_http_values(cache_dir: str, members: List[dict]) -> Iterator[bytes]:
+    # read the serialized responses again while the archive is written
+    db_path = os.path.join(cache_dir, _HTTP_CACHE_NAME + '.sqlite')
+    con = None
+    try:
+        for member in members:
+            if member['type'] != 'http':
+                continue
+            if con is None:
+                table_name = _open_http_cache(cache_dir).responses.table_name
+                con = sqlite3.connect(db_path, timeout=30)
+            row = con.execute(
+                f"SELECT value FROM {table_name} WHERE key = ?",
+                (member['key'], )
+            ).fetchone()
+            value = bytes(row[0]) if row is not None else b''
+            if hashlib.sha256(value).hexdigest() != member['sha256']:
+                raise RuntimeError(f"Cached response '{member['key']}' was "
+                                   f"modified during the export")
+            yield value
+    finally:
+        if con is not None:
+            con.close()
+
+
+def _extract(path: str, staging_dir: str) -> dict:
+    # extract and verify all members of a bundle, each one into a file that
+    # is named after its position in the manifest
+    with open(path, 'rb') as fobj:
+        try:
+            stream = compression.stream_reader(fobj)
+        except ValueError:
+            raise ValueError(f"'{path}' is not a FastF1 cache bundle") \
+                from None
+        try:
+            with stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+                manifest = _read_manifest(tar, path)
+                positions = {m['name']: i for i, m
+                             in enumerate(manifest['members'])}
+                extracted = set()
+                while (info := tar.next()) is not None:
+                    if (info.name not in positions) or not info.isfile():
+                        raise ValueError(f"Unexpected member '{info.name}' "
+                                         f"in bundle '{path}'")
+                    member = manifest['members'][positions[info.name]]
+                    _extract_member(
+                        tar, info, member, path,
+                        os.path.join(staging_dir,
+                                     str(positions[info.name]))
+                    )
+                    extracted.add(info.name)
+        except (tarfile.TarError, EOFError, OSError) as exc:
+            raise ValueError(f"Bundle '{path}' is damaged: {exc!r}") from exc
+
+    missing = set(positions) - extracted
+    if missing:
+        raise ValueError(f"Bundle '{path}' is incomplete, {len(missing)} "
+                         f"members are missing")
+    return manifest
+
+
+def _read_manifest(tar: tarfile.TarFile, path: str) -> dict:
+    info = tar.next()
+    if (info is None) or (info.name != MANIFEST_NAME):
+        raise ValueError(f"'{path}' is not a FastF1 cache bundle")
+    manifest = json.loads(tar.extractfile(info).read())
+    if manifest.get('format') != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported bundle format "
+                         f"{manifest.get('format')} of '{path}'")
+    for member in manifest['members']:
+        if member['type'] == 'parsed':
+            _check_rel_path(member['path'], path)
+    return manifest
+
+
+def _check_rel_path(rel_path: str, path: str):
+    # parsed entries may only be written inside the cache directory
+    parts = rel_path.split('/')
+    if (not rel_path) or rel_path.startswith('/') \
+            or any(part in ('', '.', '..') for part in parts) \
+            or not (parts[-1].endswith('.ff1pkl')
+                    or _entry_path(rel_path) != rel_path):
+        raise ValueError(f"Invalid entry path '{rel_path}' in bundle "
+                         f"'{path}'")
+
+
+def _extract_member(tar: tarfile.TarFile, info: tarfile.TarInfo,
+                    member: dict, path: str, dest_path: str):
+    src = tar.extractfile(info)
+    digest = hashlib.sha256()
+    size = 0
+    with open(dest_path, 'wb') as fobj:
+        while chunk := src.read(1 << 20):
+            digest.update(chunk)
+            size += len(chunk)
+            fobj.write(chunk)
+    if (size != member['size']) or (digest.hexdigest() != member['sha256']):
+        raise ValueError(f"Member '{member['name']}' of bundle '{path}' is "
+                         f"damaged (checksum mismatch)")
+
+
+def _commit_parsed(cache_dir: str,
+                   members: List[Tuple[dict, str]]) -> int:
+    # move the parsed entries into the cache, replacing local entries in
+    # either format
+    entries: Dict[str, List[Tuple[str, str]]] = dict()
+    for member, staged_path in members:
+        entries.setdefault(_entry_path(member['path']), list()).append(
+            (member['path'].rpartition('/')[2], staged_path)
+        )
+
+    # the index only exists if a size limit was used with this cache;
+    # otherwise, it is built when a limit is set
+    index = None
+    if os.path.exists(os.path.join(cache_dir, INDEX_FILE_NAME)):
+        index = CacheIndex(cache_dir)
+    for rel_entry, files in entries.items():
+        entry_path = os.path.join(cache_dir, *rel_entry.split('/'))
+        stem = os.path.splitext(entry_path)[0]
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        columnar.remove_columnar(stem + columnar.COLUMNAR_SUFFIX)
+        if os.path.isfile(stem + '.ff1pkl'):
+            os.remove(stem + '.ff1pkl')
+
+        if entry_path.endswith(columnar.COLUMNAR_SUFFIX):
+            tmp_path = f"{entry_path}.{os.getpid()}.ff1tmp"
+            os.makedirs(tmp_path)
+            try:
+                for filename, staged_path in files:
+                    shutil.move(staged_path, os.path.join(tmp_path,
+                                                          filename))
+                os.replace(tmp_path, entry_path)
+            finally:
+                columnar.remove_columnar(tmp_path)
+        else:
+            shutil.move(files[0][1], entry_path)
+
+        if index is None:
+            continue
+        try:
+            index.record_write(entry_path)
+        except Exception as exc:
+            # the index is not critical, caching works without it
+            _logger.debug("Failed to update cache index", exc_info=exc)
+    return len(entries)
+
+
+def _commit_http(cache_dir: str, members: List[Tuple[dict, str]]) -> int:
+    # copy the responses into the requests cache database; the table is
+    # created by requests-cache if necessary
+    table_name = _open_http_cache(cache_dir).responses.table_name
+    db_path = os.path.join(cache_dir, _HTTP_CACHE_NAME + '.sqlite')
+    con = sqlite3.connect(db_path, timeout=30)
+    try:
+        with con:
+            for member, staged_path in members:
+                with open(staged_path, 'rb') as fobj:
+                    row = dict(member['columns'], key=member['key'],
+                               value=sqlite3.Binary(fobj.read()))
+                con.execute(
+                    f"INSERT OR REPLACE INTO {table_name} "
+                    f"({', '.join(row)}) "
+                    f"VALUES ({', '.join('?' * len(row))})",
+                    tuple(row.values())
+                )
+    finally:
+        con.close()
+    return len(members)
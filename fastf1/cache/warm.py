@@ -0,0 +1,264 @@
+"""Fill the cache for a whole season in advance.
+
+The raw data of all sessions is downloaded concurrently by a pool of threads
+and stored in the requests cache (stage 1) or the raw store. As soon as a
+page is available, it is parsed in a pool of worker processes which store the
+parsed data in the stage 2 cache. The workers use the same cache
+configuration as the main process. They run in offline mode and only ever
+read the raw data from the cache.
+
+All requests are sent through :class:`fastf1.Cache` and are therefore subject
+to the same rate limits as any other request.
+
+Data from Ergast is not included. It is requested once when a session is
+loaded for the first time.
+"""
+import concurrent.futures
+import dataclasses
+import multiprocessing
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+import fastf1._api as api
+from fastf1.core import Session
+from fastf1.events import get_event_schedule
+from fastf1.logger import get_logger, set_log_level
+from fastf1.req import Cache
+
+
+_logger = get_logger(__name__)
+
+
+PARSERS = api.page_parsers
+"""API pages that are cached and the names of the parser functions in
+:mod:`fastf1._api` that are applied to them"""
+
+
+@dataclasses.dataclass
+class WarmUpResult:
+    """Summary of a cache warm-up."""
+
+    sessions: int = 0
+    """Number of sessions"""
+    fetched: int = 0
+    """Number of pages that were fetched"""
+    parsed: int = 0
+    """Number of pages that were parsed and stored in the stage 2 cache"""
+    cached: int = 0
+    """Number of pages that were skipped, because the parsed data was cached
+    already"""
+    unavailable: int = 0
+    """Number of pages that do not exist for their session"""
+    bytes: int = 0
+    """Total size of the fetched pages in bytes"""
+    duration: float = 0.0
+    """Total duration in seconds"""
+    failures: List[Tuple[str, str, str]] = dataclasses.field(
+        default_factory=list
+    )
+    """Pages that could not be fetched or parsed as tuples of
+    ``(api path, page, error message)``"""
+
+
+def warm_cache(year: int,
+               sessions: Optional[Iterable[str]] = None,
+               *,
+               cache_dir: Optional[str] = None,
+               fetch_workers: int = 4,
+               parse_workers: Optional[int] = None) -> WarmUpResult:
+    """Fill the cache with the data of all sessions of a season.
+
+    Sessions that have not started yet and events that are not supported by
+    the F1 live timing API are skipped. Pages for which the parsed data is
+    cached already are skipped as well, so an interrupted warm-up can simply
+    be restarted. Cached data that was created by an older version of its
+    parser is parsed again.
+
+    The parse workers are started with the ``'spawn'`` method. Scripts that
+    call this function therefore need to protect their entry point with an
+    ``if __name__ == '__main__':`` guard.
+
+    Args:
+        year: championship year
+        sessions: identifiers of the sessions that are included for each
+            event (for example ``['R', 'Q']``, see :ref:`SessionIdentifier`);
+            by default, all sessions are included
+        cache_dir: path of the cache directory, by default the current cache
+            configuration or the default cache location is used
+        fetch_workers: number of threads that download data
+        parse_workers: number of processes that parse data; by default, one
+            process per CPU is used
+
+    Returns:
+        a summary of the warm-up
+    """
+    if cache_dir is not None:
+        Cache.enable_cache(cache_dir)
+    else:
+        Cache._enable_default_cache()
+
+    schedule = get_event_schedule(year)
+    identifiers = list(sessions) if sessions is not None \
+        else [1, 2, 3, 4, 5]
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None)
+
+    selected = list()
+    for i in range(len(schedule)):
+        event = schedule.iloc[i]
+        if not event.F1ApiSupport:
+            continue
+        for identifier in identifiers:
+            try:
+                session = event.get_session(identifier)
+            except ValueError:
+                continue  # this event does not have such a session
+            if (not pd.isnull(session.date)) and (session.date > now):
+                continue
+            selected.append(session)
+
+    return warm_sessions(selected, fetch_workers=fetch_workers,
+                         parse_workers=parse_workers)
+
+
+def warm_sessions(sessions: Iterable[Session],
+                  *,
+                  fetch_workers: int = 4,
+                  parse_workers: Optional[int] = None) -> WarmUpResult:
+    """Fill the cache with the data of the given sessions.
+
+    The cache needs to be enabled already. See :func:`warm_cache` for
+    details.
+
+    Args:
+        sessions: the sessions for which data is cached
+        fetch_workers: number of threads that download data
+        parse_workers: number of processes that parse data; by default, one
+            process per CPU is used
+
+    Returns:
+        a summary of the warm-up
+    """
+    if Cache._CACHE_DIR is None:
+        raise RuntimeError("The cache needs to be enabled for a warm-up")
+    if Cache._requests_session_cached is None:
+        raise RuntimeError("The requests cache needs to be enabled for a "
+                           "warm-up")
+
+    result = WarmUpResult()
+    t_start = time.perf_counter()
+
+    tasks = list()
+    for session in sessions:
+        result.sessions += 1
+        for page, parser in PARSERS.items():
+            # cached data of an older parser version is parsed again
+            if Cache._cache_entry_ok_for_use(session.api_path,
+                                             getattr(api, parser)):
+                result.cached += 1
+            else:
+                tasks.append((session.api_path, page))
+
+    total = len(tasks)
+    _logger.info(f"Warming up the cache for {result.sessions} sessions "
+                 f"({total} pages, {result.cached} cached already)")
+
+    with concurrent.futures.ThreadPoolExecutor(fetch_workers) as fetch_pool, \
+            concurrent.futures.ProcessPoolExecutor(
+                parse_workers, initializer=_init_parse_worker,
+                initargs=(Cache._get_config(), ),
+                # forking while the download threads are running can
+                # deadlock the workers (e.g. on a lock held by sqlite)
+                mp_context=multiprocessing.get_context('spawn')
+            ) as parse_pool:
+        pending = {fetch_pool.submit(_fetch_page, api_path, page):
+                   (api_path, page, 'fetch')
+                   for api_path, page in tasks}
+
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                api_path, page, step = pending.pop(future)
+                try:
+                    ret = future.result()
+                except Exception as exc:
+                    result.failures.append((api_path, page, repr(exc)))
+                    _logger.warning(f"Failed to {step} {api_path}{page}: "
+                                    f"{exc!r}")
+                    continue
+
+                if step == 'fetch':
+                    status_code, size = ret
+                    if status_code == 404:
+                        result.unavailable += 1
+                        continue
+                    elif status_code != 200:
+                        result.failures.append(
+                            (api_path, page, f"HTTP {status_code}")
+                        )
+                        _logger.warning(f"Failed to fetch {api_path}{page}: "
+                                        f"HTTP {status_code}")
+                        continue
+                    result.fetched += 1
+                    result.bytes += size
+                    future = parse_pool.submit(_parse_page, api_path,
+                                               PARSERS[page])
+                    pending[future] = (api_path, page, 'parse')
+                else:
+                    result.parsed += 1
+
+                _log_progress(result, total, t_start)
+
+    result.duration = time.perf_counter() - t_start
+    _logger.info(
+        f"Cache warm-up finished in {result.duration:.0f}s: "
+        f"{result.parsed} pages parsed, {result.unavailable} unavailable, "
+        f"{len(result.failures)} failed"
+    )
+    return result
+
+
+def _log_progress(result: WarmUpResult, total: int, t_start: float):
+    elapsed = time.perf_counter() - t_start
+    throughput = result.bytes / 1e6 / elapsed if elapsed > 0 else 0.0
+    _logger.info(
+        f"[fetched {result.fetched + result.unavailable}/{total} | "
+        f"parsed {result.parsed}/{total} | "
+        f"{result.bytes / 1e6:.1f} MB at {throughput:.2f} MB/s | "
+        f"{len(result.failures)} failed]"
+    )
+
+
+def _fetch_page(api_path: str, page: str) -> Tuple[int, int]:
+    # download a page into the cache; jsonStream pages are fetched in the
+    # same way as when a session is loaded, so that they are stored in the
+    # raw store if it is enabled
+    url = api.base_url + api_path + api.pages[page]
+    if 'jsonStream' not in api.pages[page]:
+        r = Cache.requests_get(url, headers=api.headers)
+        return r.status_code, len(r.content)
+
+    status_code, content = Cache._get_stream(url, headers=api.headers)
+    if content is None:
+        return status_code, 0
+    return status_code, sum(len(chunk) for chunk in content)
+
+
+def _init_parse_worker(cache_config: dict):
+    # the workers use the same cache configuration as the main process
+    set_log_level('WARNING')
+    Cache.enable_cache(**cache_config)
+    Cache.offline_mode(True)
+
+
+def _parse_page(api_path: str, parser: str):
+    # parse a page from the requests cache into the stage 2 cache; the parsed
+    # data is not sent back to the main process
+    try:
+        getattr(api, parser)(api_path)
+    except SystemExit:
+        # the cache exits if no data could be loaded at all
+        raise RuntimeError("Failed to load data") from None
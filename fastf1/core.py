@@ -40,11 +40,13 @@ Apart from only providing data, the :class:`Laps`, :class:`Lap` and
 analyzing specific parts of the data.
 """
 import collections
+import functools
 import re
 from functools import cached_property
 import warnings
 import typing
-from typing import Optional, List, Literal, Iterable, Union, Tuple, Any
+from typing import (Optional, List, Literal, Iterable, Union, Tuple, Any,
+                    Callable, Dict)
 
 import numpy as np
 import pandas as pd
@@ -1058,11 +1060,17 @@ class Session:
 
         self._session_split_times: Optional[list] = None
 
+        # loaders for data that is loaded on first access (lazy loading);
+        # keyed by the attribute names that are set by each loader
+        self._lazy_loaders: Dict[str, Callable[[], None]] = dict()
+
     def __repr__(self):
         return (f"{self.event.year} Season Round {self.event.RoundNumber}: "
                 f"{self.event.EventName} - {self.name}")
 
     def _get_property_warn_not_loaded(self, name):
+        if not hasattr(self, name):
+            self._load_pending(name)
         if not hasattr(self, name):
             raise DataNotLoadedError("The data you are trying to access has not "
                                      "been loaded yet. See `Session.load`")
@@ -1192,7 +1200,8 @@ class Session:
         return self._get_property_warn_not_loaded('_t0_date')
 
     def load(self, *, laps=True, telemetry=True, weather=True, messages=True,
-             livedata=None):
+             livedata=None, drivers=None, lazy=False, fetch_workers=4,
+             parse_workers=None):
         """Load session data from the supported APIs.
 
         This method allows to flexibly load some or all data that FastF1 can
@@ -1238,11 +1247,65 @@ class Session:
             livedata (:class:`fastf1.livetiming.data.LiveTimingData`, optional):
                 instead of requesting the data from the api, locally saved
                 livetiming data can be used as a data source
+            drivers (list, optional): Only load telemetry data for these
+                drivers, given as driver numbers or three letter
+                abbreviations (for example ``['VER', '16']``). By default,
+                the cached telemetry data of all drivers is read and then
+                filtered. Only if the cache is enabled with
+                ``Cache.enable_cache(..., columnar_telemetry=True)``, cached
+                telemetry data for other drivers is not read at all, which
+                makes loading faster and requires less memory. All other
+                data is always loaded for all drivers.
+                :attr:`Session.t0_date` and therefore all timestamps are the
+                same as when the data of all drivers is loaded.
+            lazy (bool): Do not load any data yet. Each type of data is
+                loaded when it is accessed for the first time instead (for
+                example, telemetry data is loaded on first access of
+                :attr:`Session.car_data`, :attr:`Session.pos_data` or any
+                telemetry of a lap). Data that is never accessed is never
+                loaded. The other arguments select the data that is
+                available, as usual. Note that data which combines
+                multiple types of data can only use the data that is
+                loaded at that time. For example, ``LapStartDate`` is
+                only added to :attr:`Session.laps` if the telemetry data
+                is loaded first, and laps that are generated for drivers
+                who retired on track do not use the car data.
+            fetch_workers (int): Maximum number of pages that are
+                downloaded concurrently from the F1 live timing API, before
+                the data is parsed. Data that is cached already is not
+                downloaded again. Set to 1 to download one page at a time
+                while loading.
+            parse_workers (int, optional): Number of processes in which car
+                data and position data are decoded in parallel, if they are
+                not cached yet. By default, all data is decoded in the
+                current process. On platforms where new processes are
+                spawned instead of forked (Windows and macOS), the code that
+                calls this method needs to be protected by an
+                ``if __name__ == '__main__':`` guard in the main script, see
+                :mod:`multiprocessing`.
         """
+        # options of a previous call do not apply anymore
+        self._lazy_loaders.clear()
+
+        if lazy:
+            self._register_lazy_loaders(
+                laps=laps, telemetry=telemetry, weather=weather,
+                messages=messages, livedata=livedata, drivers=drivers,
+                parse_workers=parse_workers
+            )
+            _logger.info(f"Data for {self.event['EventName']} - {self.name} "
+                         f"will be loaded on first access "
+                         f"[v{fastf1.__version__}]")
+            return
+
         _logger.info(f"Loading data for "
                      f"{self.event['EventName']} - {self.name}"
                      f" [v{fastf1.__version__}]")
 
+        if self.f1_api_support and (livedata is None) and (fetch_workers > 1):
+            self._prefetch(laps=laps, telemetry=telemetry, weather=weather,
+                           messages=messages, max_workers=fetch_workers)
+
         self._load_session_info(livedata=livedata)
         self._load_drivers_results(livedata=livedata)
 
@@ -1255,7 +1318,10 @@ class Session:
                 self._add_first_lap_time_from_ergast()
 
             if telemetry:
-                self._load_telemetry(livedata=livedata)
+                if drivers is not None:
+                    drivers = self._get_driver_numbers(drivers)
+                self._load_telemetry(livedata=livedata, drivers=drivers,
+                                     parse_workers=parse_workers)
 
             if weather:
                 self._load_weather_data(livedata=livedata)
@@ -1278,6 +1344,117 @@ class Session:
         _logger.info(f"Finished loading data for {len(self.drivers)} "
                      f"drivers: {self.drivers}")
 
+    @soft_exceptions("prefetch", "Failed to prefetch data!", _logger)
+    def _prefetch(self, *, laps, telemetry, weather, messages, max_workers):
+        # download all required pages concurrently, so that they can then be
+        # parsed one after another without waiting
+        names = ['session_info', 'driver_list']
+        if laps:
+            names.extend(['session_status', 'track_status', 'timing_data',
+                          'timing_app_data'])
+            if self.name in _RACE_LIKE_SESSIONS:
+                names.append('lap_count')
+        if telemetry:
+            names.extend(['car_data', 'position'])
+        if weather:
+            names.append('weather_data')
+        if messages:
+            names.append('race_control_messages')
+        api.prefetch_pages(self.api_path, names, max_workers=max_workers)
+
+    def _register_lazy_loaders(self, *, laps, telemetry, weather, messages,
+                               livedata, drivers, parse_workers):
+        groups = [
+            (('_session_info', ),
+             functools.partial(self._load_session_info, livedata=livedata)),
+            (('_results', ),
+             functools.partial(self._load_results_lazy, livedata=livedata))
+        ]
+        if self.f1_api_support:
+            if laps:
+                groups.append((
+                    ('_session_status', '_session_start_time', '_total_laps',
+                     '_track_status', '_laps'),
+                    functools.partial(self._load_laps_lazy, livedata=livedata)
+                ))
+            if telemetry:
+                groups.append((
+                    ('_car_data', '_pos_data', '_t0_date'),
+                    functools.partial(self._load_telemetry_lazy,
+                                      livedata=livedata, drivers=drivers,
+                                      parse_workers=parse_workers)
+                ))
+            if weather:
+                groups.append((
+                    ('_weather_data', ),
+                    functools.partial(self._load_weather_data,
+                                      livedata=livedata)
+                ))
+            if messages:
+                groups.append((
+                    ('_race_control_messages', ),
+                    functools.partial(self._load_race_control_messages,
+                                      livedata=livedata)
+                ))
+        elif any((laps, telemetry, weather, messages)):
+            _logger.warning(
+                "Cannot load laps, telemetry, weather, and message data "
+                "because the relevant API is not supported for this "
+                "session."
+            )
+
+        for names, loader in groups:
+            for name in names:
+                # remove data from a previous call, so that it is loaded
+                # again with the new options
+                if hasattr(self, name):
+                    delattr(self, name)
+                self._lazy_loaders[name] = loader
+
+    def _load_pending(self, *names):
+        # run the lazy loaders for some attributes, if they have not run yet;
+        # each loader only runs once, even if it fails
+        for name in names:
+            loader = self._lazy_loaders.get(name)
+            if loader is None:
+                continue
+            for key in [key for key, value in self._lazy_loaders.items()
+                        if value is loader]:
+                del self._lazy_loaders[key]
+            loader()
+
+    def _load_results_lazy(self, livedata=None):
+        self._load_drivers_results(livedata=livedata)
+        if (self.name in _QUALI_LIKE_SESSIONS) and hasattr(self, '_results') \
+                and self._results['Position'].isna().all():
+            # results are calculated from the laps in this case
+            self._load_pending('_laps')
+
+    def _load_laps_lazy(self, livedata=None):
+        self._load_session_status_data(livedata=livedata)
+        self._load_total_lap_count(livedata=livedata)
+        self._load_track_status_data(livedata=livedata)
+        self._load_laps_data(livedata=livedata)
+        self._add_first_lap_time_from_ergast()
+        # deleted laps are marked based on the race control messages
+        self._load_pending('_race_control_messages')
+        if hasattr(self, '_laps') \
+                and (getattr(self, '_t0_date', None) is not None):
+            # telemetry was loaded first
+            self._laps['LapStartDate'] \
+                = self._laps['LapStartTime'] + self._t0_date
+
+        self._fix_missing_laps_retired_on_track()
+        self._set_laps_deleted_from_rcm()
+        self._calculate_quali_like_session_results()
+
+    def _load_telemetry_lazy(self, livedata=None, drivers=None,
+                             parse_workers=None):
+        if drivers is not None:
+            drivers = self._get_driver_numbers(drivers)
+        self._load_telemetry(livedata=livedata, drivers=drivers,
+                             parse_workers=parse_workers)
+
     @soft_exceptions("session info data",
                      "Failed to load session info data!",
                      _logger)
@@ -2135,7 +2312,8 @@ class Session:
 
     @soft_exceptions("telemetry data", "Failed to load telemetry data!",
                      _logger)
-    def _load_telemetry(self, livedata=None):
+    def _load_telemetry(self, livedata=None, drivers=None,
+                        parse_workers=None):
         """Load telemetry data from the API.
 
         This method can only be called after :meth:`load_laps` has been
@@ -2159,20 +2337,35 @@ class Session:
             livedata (:class:`fastf1.livetiming.data.LiveTimingData`, optional) :
                 instead of requesting the data from the api, locally saved
                 livetiming data can be used as a data source
+            drivers (list, optional): only load telemetry for these drivers
+                (driver numbers as string)
+            parse_workers (int, optional): number of processes for decoding
+                the data in parallel
         """
         try:
-            car_data = api.car_data(self.api_path, livedata=livedata)
+            car_data = api.car_data(self.api_path, livedata=livedata,
+                                    drivers=drivers, workers=parse_workers)
         except api.SessionNotAvailableError:
             _logger.warning("Car telemetry data is unavailable!")
             car_data = {}
 
         try:
-            pos_data = api.position_data(self.api_path, livedata=livedata)
+            pos_data = api.position_data(self.api_path, livedata=livedata,
+                                         drivers=drivers,
+                                         workers=parse_workers)
         except api.SessionNotAvailableError:
             _logger.warning("Car position data is unavailable!")
             pos_data = {}
 
-        self._calculate_t0_date(car_data, pos_data)
+        if drivers is None:
+            self._calculate_t0_date(car_data, pos_data)
+        else:
+            # t0_date is always determined from the data of all drivers,
+            # so that it does not depend on the selection of drivers
+            offsets = api.telemetry_date_offsets(
+                self.api_path, livedata=livedata, workers=parse_workers
+            )
+            self._set_t0_date(max(offsets.values(), default=None))
 
         self._car_data = dict()
         self._pos_data = dict()
@@ -2182,7 +2375,7 @@ class Session:
             if not src:
                 continue
 
-            for drv in self.drivers:
+            for drv in (self.drivers if drivers is None else drivers):
                 # drop and recalculate timestamps based on 'Date', because
                 # 'Date' has a higher resolution
                 try:
@@ -2221,6 +2414,18 @@ class Session:
             raise ValueError(f"Invalid driver identifier '{identifier}'")
         return self.results[mask].iloc[0]
 
+    def _get_driver_numbers(self, identifiers) -> List[str]:
+        # resolve driver abbreviations to driver numbers; driver numbers are
+        # accepted as they are, even if they are not in the results
+        numbers = list()
+        for identifier in identifiers:
+            identifier = str(identifier)
+            if identifier.isdigit():
+                numbers.append(identifier)
+            else:
+                numbers.append(self.get_driver(identifier)['DriverNumber'])
+        return numbers
+
     def get_circuit_info(self) -> Optional[CircuitInfo]:
         """Returns additional information about the circuit that hosts this
         event.
@@ -2262,10 +2467,13 @@ class Session:
             data.extend(list(tds.values()))
 
         for d in data:
-            new_offset = max(d['Date'] - d['Time'])
+            new_offset = api.latest_date_offset(d)
             if date_offset is None or new_offset > date_offset:
                 date_offset = new_offset
 
+        self._set_t0_date(date_offset)
+
+    def _set_t0_date(self, date_offset):
         if date_offset is None:
             self._t0_date = None
             _logger.warning("Failed to determine `Session.t0_date`!")
@@ -1,7 +1,7 @@
 import copy
-import json
 from typing import List, Literal, Optional, Union
 
+from fastf1.internals import json_backend
 from fastf1.req import Cache
 import fastf1.ergast.structure as API
 from fastf1.version import __version__
@@ -486,7 +486,7 @@ class Ergast:
         r = Cache.requests_get(url, headers=HEADERS, params=params)
         if r.status_code == 200:
             try:
-                return json.loads(r.content.decode('utf-8'))
+                return json_backend.loads(r.content.decode('utf-8'))
             except Exception as exc:
                 Cache.delete_response(url)  # don't keep a corrupted response
                 raise ErgastJsonError(
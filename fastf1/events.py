@@ -161,7 +161,6 @@ API Reference
 """  # noqa: W605 invalid escape sequence (escaped space)
 import collections
 import datetime
-import json
 import warnings
 from typing import Literal, Union, Optional
 
@@ -180,6 +179,7 @@ import pandas as pd
 import fastf1._api
 from fastf1.core import Session
 import fastf1.ergast
+from fastf1.internals import json_backend
 from fastf1.logger import get_logger, soft_exceptions
 from fastf1.req import Cache
 from fastf1.utils import recursive_dict_get, to_datetime, to_timedelta
@@ -542,7 +542,7 @@ def _get_schedule_ff1(year):
     )
 
     data = dict()
-    json_data = json.loads(response.text)
+    json_data = json_backend.loads(response.text)
     for key in json_data.keys():
         data[key] = list(json_data[key].values())
 
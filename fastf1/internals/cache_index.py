@@ -0,0 +1,172 @@
+"""Index of the entries in the stage 2 cache.
+
+The index is a small SQLite database in the root of the cache directory. It
+records the size, parser version and time of last access for each cached
+entry. This allows to determine the size of the cache without walking the
+whole cache directory and to evict the least recently used sessions when the
+cache exceeds a maximum size.
+
+A new connection is opened for each operation, so that the index can be
+used from multiple threads and processes concurrently.
+"""
+import contextlib
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastf1.internals import internals_logger as logger
+
+
+INDEX_FILE_NAME = 'fastf1_cache_index.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    session TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    parser_version INTEGER,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_session ON entries (session);
+"""
+
+
+def get_entry_size(path: str) -> int:
+    """Return the size of an entry file or entry directory in bytes."""
+    if os.path.isdir(path):
+        return sum(entry.stat().st_size for entry in os.scandir(path)
+                   if entry.is_file())
+    return os.path.getsize(path)
+
+
+class CacheIndex:
+    """Index of the stage 2 cache entries in a cache directory.
+
+    Entry paths and session paths are stored relative to the cache
+    directory.
+
+    Args:
+        cache_dir: path of the cache directory
+    """
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.db_path = os.path.join(cache_dir, INDEX_FILE_NAME)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # commit on success and always close the connection
+        con = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.cache_dir).replace(os.sep, '/')
+
+    def record_write(self, path: str, parser_version: Optional[int] = None):
+        """Add or update an entry after it was written to the cache.
+
+        The session of an entry is the directory that contains it.
+        """
+        size = get_entry_size(path)
+        rel_path = self._relpath(path)
+        session, _, file_name = rel_path.rpartition('/')
+        with self._connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(path, session, name, size, parser_version, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (rel_path, session, os.path.splitext(file_name)[0], size,
+                 parser_version, time.time())
+            )
+
+    def record_accesses(self, accesses: Dict[str, float]):
+        """Update the time of last access for multiple entries at once.
+
+        Args:
+            accesses: time of last access by entry path
+        """
+        with self._connect() as con:
+            con.executemany(
+                "UPDATE entries SET last_access = ? WHERE path = ?",
+                [(t, self._relpath(path)) for path, t in accesses.items()]
+            )
+
+    def remove(self, path: str):
+        """Remove an entry from the index."""
+        with self._connect() as con:
+            con.execute("DELETE FROM entries WHERE path = ?",
+                        (self._relpath(path), ))
+
+    def clear(self):
+        """Remove all entries from the index."""
+        with self._connect() as con:
+            con.execute("DELETE FROM entries")
+
+    def total_size(self) -> int:
+        """Total size of all indexed entries in bytes."""
+        with self._connect() as con:
+            size, = con.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return size
+
+    def sessions_by_last_access(self) -> List[Tuple[str, int, float]]:
+        """Return all sessions as tuples ``(session, size, last_access)``,
+        least recently used session first."""
+        with self._connect() as con:
+            return con.execute(
+                "SELECT session, SUM(size), MAX(last_access) FROM entries "
+                "GROUP BY session ORDER BY MAX(last_access) ASC"
+            ).fetchall()
+
+    def session_entries(self, session: str) -> List[str]:
+        """Return the absolute paths of all entries for a session."""
+        with self._connect() as con:
+            rows = con.execute(
+                "SELECT path FROM entries WHERE session = ?", (session, )
+            ).fetchall()
+        return [os.path.join(self.cache_dir, *row[0].split('/'))
+                for row in rows]
+
+    def remove_session(self, session: str):
+        """Remove all entries of a session from the index."""
+        with self._connect() as con:
+            con.execute("DELETE FROM entries WHERE session = ?", (session, ))
+
+    def rebuild(self, entry_suffixes: Tuple[str, ...]):
+        """Add all existing entries in the cache directory to the index.
+
+        This walks the whole cache directory. Entries that are already
+        indexed are not changed.
+
+        Args:
+            entry_suffixes: file name suffixes of cache entries
+        """
+        logger.info("Building cache index...")
+        now = time.time()
+        rows = list()
+        for dirpath, dirnames, filenames in os.walk(self.cache_dir):
+            for name in filenames + dirnames:
+                if not name.endswith(entry_suffixes):
+                    continue
+                path = os.path.join(dirpath, name)
+                rel_path = self._relpath(path)
+                rows.append((
+                    rel_path, rel_path.rpartition('/')[0],
+                    os.path.splitext(name)[0], get_entry_size(path), None,
+                    os.path.getmtime(path) if os.path.exists(path) else now
+                ))
+        with self._connect() as con:
+            con.executemany(
+                "INSERT OR IGNORE INTO entries "
+                "(path, session, name, size, parser_version, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        logger.info(f"Cache index built ({len(rows)} entries)")
@@ -0,0 +1,245 @@
+"""Statistics about the use of the cache.
+
+The statistics are collected by a :class:`StatsRecorder`. It keeps running
+totals and additionally adds each recorded value to any number of
+:class:`CacheStats` objects that are currently being collected, for example
+for loading a single session.
+
+Additionally, the latency and the errors of all requests that are sent to a
+server are recorded for each endpoint (host name).
+"""
+import bisect
+import contextlib
+import copy
+import dataclasses
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                                      10.0, 30.0)
+"""Upper bounds in seconds of the buckets of the latency histograms; the last
+bucket of a histogram counts all requests that took longer."""
+
+
+@dataclasses.dataclass
+class StageStats:
+    """Counters for one stage of the cache.
+
+    The meaning of the counters depends on the stage:
+
+    - ``requests``: raw API responses from the requests cache or the raw
+      store (stage 1). A hit is a response that was served from the cache and
+      a miss is a response that had to be requested from the server.
+      ``bytes_read`` is the size of cached responses, ``bytes_written`` is
+      the size of downloaded responses and ``read_time`` is the total time
+      spent on requests, including the time for downloading.
+    - ``memory``: parsed data from the in-memory cache. Only hits and misses
+      are counted.
+    - ``parsed``: parsed data from the stage 2 cache on disk.
+      ``read_time`` and ``write_time`` are the time spent on reading and
+      deserializing and on serializing and writing the data.
+    - ``remote``: parsed data and raw responses from a shared cache backend
+      (see :mod:`fastf1.cache.backends`). ``read_time`` and ``write_time``
+      are the time spent on transferring data from and to the backend.
+    """
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    """Number of misses for which cached data existed, but could not be used
+    (e.g. because it was created by a different version of the parser)"""
+    bytes_read: int = 0
+    bytes_written: int = 0
+    read_time: float = 0.0
+    """Time in seconds"""
+    write_time: float = 0.0
+    """Time in seconds"""
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of hits, ``None`` if nothing was counted yet."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+
+@dataclasses.dataclass
+class FunctionStats:
+    """Statistics for a single API function or for all API functions
+    combined."""
+    requests: StageStats = dataclasses.field(default_factory=StageStats)
+    """Raw API responses (stage 1)"""
+    memory: StageStats = dataclasses.field(default_factory=StageStats)
+    """Parsed data from the in-memory cache"""
+    parsed: StageStats = dataclasses.field(default_factory=StageStats)
+    """Parsed data from the stage 2 cache"""
+    remote: StageStats = dataclasses.field(default_factory=StageStats)
+    """Data from a shared cache backend"""
+    parse_calls: int = 0
+    """Number of times that data was parsed"""
+    parse_time: float = 0.0
+    """Time in seconds spent on parsing, including the time for requests"""
+
+    def _add(self, stage: str, counts: Dict[str, Any]):
+        target = self if stage == 'parser' else getattr(self, stage)
+        for name, value in counts.items():
+            setattr(target, name, getattr(target, name) + value)
+
+
+@dataclasses.dataclass
+class EndpointStats:
+    """Statistics for all requests that were sent to one server.
+
+    Each attempt of a request is counted separately, including attempts
+    that are retried.
+    """
+    requests: int = 0
+    """Number of attempts"""
+    retries: int = 0
+    """Number of attempts that were retried"""
+    failures: int = 0
+    """Number of requests that failed after all retries"""
+    errors: Dict[str, int] = dataclasses.field(default_factory=dict)
+    """Number of failed attempts by type of error (for example
+    ``'timeout'``, ``'connection'`` or ``'http_503'``)"""
+    latency: List[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    """Histogram of the latency of all attempts, see
+    :data:`LATENCY_BUCKETS`"""
+    latency_total: float = 0.0
+    """Total latency of all attempts in seconds"""
+
+    def _add(self, latency: float, error: Optional[str], retry: bool,
+             failure: bool):
+        self.requests += 1
+        self.retries += retry
+        self.failures += failure
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        self.latency[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_total += latency
+
+
+@dataclasses.dataclass
+class CacheStats(FunctionStats):
+    """Statistics about the use of the cache.
+
+    The statistics for each stage are summed over all API functions. The
+    statistics for the individual API functions are available through
+    :attr:`functions`. Requests that are not made by an API function (e.g.
+    requests to Ergast) are only included in the total. The latency and the
+    errors of all requests that were sent to a server are available through
+    :attr:`endpoints`.
+
+    Use :meth:`to_dict` to obtain the statistics in a format that can be
+    serialized as JSON.
+    """
+    functions: Dict[str, FunctionStats] = dataclasses.field(
+        default_factory=dict
+    )
+    """Statistics for each API function by function name"""
+    endpoints: Dict[str, EndpointStats] = dataclasses.field(
+        default_factory=dict
+    )
+    """Statistics for the requests that were sent to each server by host
+    name"""
+
+    def _record_request(self, endpoint: str, *args):
+        self.endpoints.setdefault(endpoint, EndpointStats())._add(*args)
+
+    def _record(self, stage: str, function: Optional[str],
+                counts: Dict[str, Any]):
+        self._add(stage, counts)
+        if function is not None:
+            self.functions.setdefault(function, FunctionStats()) \
+                ._add(stage, counts)
+
+    def to_dict(self) -> dict:
+        """Return the statistics as a (nested) dictionary."""
+        return dataclasses.asdict(self)
+
+
+class StatsRecorder:
+    """Thread-safe recorder for cache statistics."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._total = CacheStats()
+        self._collectors: List[CacheStats] = list()
+
+    def record(self, stage: str, function: Optional[str] = None,
+               **counts):
+        """Add values to the counters of a stage.
+
+        Args:
+            stage: ``'requests'``, ``'memory'``, ``'parsed'``, ``'remote'``
+                or ``'parser'`` (for the parse counters)
+            function: name of the API function; by default, the function
+                which is currently executed in this thread (see
+                :meth:`function`) is used, if any
+            **counts: values that are added to the counters with the same
+                names
+        """
+        if function is None:
+            function = getattr(self._local, 'function', None)
+        with self._lock:
+            self._total._record(stage, function, counts)
+            for stats in self._collectors:
+                stats._record(stage, function, counts)
+
+    def record_request(self, endpoint: str, latency: float,
+                       error: Optional[str] = None, retry: bool = False,
+                       failure: bool = False):
+        """Record one attempt of a request that was sent to a server.
+
+        Args:
+            endpoint: host name of the server
+            latency: time in seconds until the response was received or
+                the attempt failed
+            error: type of the error if the attempt failed
+            retry: whether the request is retried after this attempt
+            failure: whether the request finally failed with this attempt
+        """
+        with self._lock:
+            self._total._record_request(endpoint, latency, error, retry,
+                                        failure)
+            for stats in self._collectors:
+                stats._record_request(endpoint, latency, error, retry,
+                                      failure)
+
+    @contextlib.contextmanager
+    def function(self, name: str) -> Iterator[None]:
+        """Attribute all values that are recorded in this thread to an API
+        function while the context is active."""
+        previous = getattr(self._local, 'function', None)
+        self._local.function = name
+        try:
+            yield
+        finally:
+            self._local.function = previous
+
+    @contextlib.contextmanager
+    def collect(self) -> Iterator[CacheStats]:
+        """Collect the values that are recorded while the context is active
+        into a new :class:`CacheStats` object."""
+        stats = CacheStats()
+        with self._lock:
+            self._collectors.append(stats)
+        try:
+            yield stats
+        finally:
+            with self._lock:
+                # compare by identity, equal statistics may be collected
+                # by multiple callers
+                self._collectors = [s for s in self._collectors
+                                    if s is not stats]
+
+    def total(self) -> CacheStats:
+        """Return a copy of the running totals."""
+        with self._lock:
+            return copy.deepcopy(self._total)
+
+    def reset(self):
+        """Reset the running totals."""
+        with self._lock:
+            self._total = CacheStats()
@@ -0,0 +1,277 @@
+"""Partitioned, columnar on-disk storage for dictionaries of DataFrames.
+
+This is used by the stage 2 cache for per-driver telemetry data (car data and
+position data). Each entry is a directory with separate files for each
+driver, so that the data for a subset of drivers can be read without reading
+the whole entry.
+
+In columnar format, the directory contains one ``.npy`` file per driver and
+dtype, where each file holds all columns of that dtype in pandas' block
+layout. The files can be opened with memory mapping, which means that
+reading an entry costs little more than an mmap and multiple processes share
+the same pages through the OS page cache. Object columns that only contain
+strings (or None) are stored as integer codes together with the unique
+values. All other columns which can not be represented by a plain numpy dtype
+are pickled separately per driver.
+
+Pickled data can optionally be compressed (see
+:mod:`fastf1.internals.compression`). The ``.npy`` files are never
+compressed, so that they can still be memory mapped.
+"""
+import io
+import json
+import os
+import tarfile
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from pandas import DataFrame, RangeIndex
+
+from fastf1.internals import compression
+from fastf1.internals import internals_logger as logger
+from fastf1.internals.pandas_extensions import create_df_from_blocks
+
+
+COLUMNAR_SUFFIX = '.ff1col'
+_META_FILE = '_meta.json'
+
+
+def is_columnar_compatible(data) -> bool:
+    """Check whether ``data`` can be stored in columnar format.
+
+    This is the case for dictionaries with string keys where each value is a
+    DataFrame with a default ``RangeIndex`` and unique string column names.
+    """
+    if not isinstance(data, dict) or not data:
+        return False
+    for key, df in data.items():
+        if not isinstance(key, str) or not isinstance(df, DataFrame):
+            return False
+        if not (isinstance(df.index, RangeIndex)
+                and df.index.start == 0 and df.index.step == 1):
+            return False
+        if not df.columns.is_unique \
+                or not all(isinstance(c, str) for c in df.columns):
+            return False
+    return True
+
+
+def _is_block_dtype(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufmM'
+
+
+def _is_str_column(values: np.ndarray) -> bool:
+    return values.dtype == object \
+        and all((v is None) or isinstance(v, str) for v in set(values))
+
+
+def write_columnar(data: Dict[str, DataFrame], path: str,
+                   compression_codec: Optional[str] = None,
+                   compression_level: Optional[int] = None,
+                   **meta):
+    """Write a dictionary of DataFrames to a columnar cache entry.
+
+    Args:
+        data: dictionary of DataFrames, see :func:`is_columnar_compatible`
+        path: path of the entry directory (will be created)
+        compression_codec: codec for compressing pickled data
+        compression_level: compression level, default level of the codec
+            if ``None``
+        **meta: additional json-serializable metadata that is stored
+            alongside the data (e.g. the cache version)
+    """
+    os.makedirs(path, exist_ok=True)
+    entries = dict()
+    for n, (key, df) in enumerate(data.items()):
+        columns = list(df.columns)
+        groups = dict()
+        strings = list()
+        objects = list()
+        for col in columns:
+            dtype = df[col].dtype
+            if _is_block_dtype(dtype):
+                groups.setdefault(dtype.str, list()).append(col)
+            elif _is_str_column(df[col].to_numpy()):
+                strings.append(col)
+            else:
+                objects.append(col)
+
+        blocks = list()
+        for i, (dtype_str, cols) in enumerate(groups.items()):
+            fname = f'{n}.{i}.npy'
+            values = np.empty((len(cols), len(df)), dtype=np.dtype(dtype_str))
+            for row, col in enumerate(cols):
+                values[row] = df[col].to_numpy()
+            np.save(os.path.join(path, fname), values, allow_pickle=False)
+            blocks.append({'file': fname, 'columns': cols})
+
+        str_columns = list()
+        for i, col in enumerate(strings):
+            fname = f'{n}.s{i}.npy'
+            codes, uniques = _encode_strings(df[col].to_numpy())
+            np.save(os.path.join(path, fname), codes, allow_pickle=False)
+            str_columns.append(
+                {'file': fname, 'column': col, 'values': uniques}
+            )
+
+        obj_file = None
+        if objects:
+            obj_file = f'{n}.obj.pkl'
+            with open(os.path.join(path, obj_file), 'wb') as fobj:
+                compression.dump(df.loc[:, objects], fobj, compression_codec,
+                                 compression_level)
+
+        entries[key] = {'columns': columns, 'length': len(df),
+                        'blocks': blocks, 'strings': str_columns,
+                        'objects': obj_file}
+
+    meta = dict(meta)
+    meta['entries'] = entries
+    # metadata is written last, an entry without metadata is incomplete
+    with open(os.path.join(path, _META_FILE), 'w') as fobj:
+        json.dump(meta, fobj)
+
+
+def _encode_strings(values: np.ndarray):
+    # encode an object array of strings as integer codes + unique values
+    lookup = dict()
+    codes = np.empty(len(values), dtype='int32')
+    for i, v in enumerate(values):
+        codes[i] = lookup.setdefault(v, len(lookup))
+    return codes, list(lookup.keys())
+
+
+def read_columnar_meta(path: str) -> Optional[dict]:
+    """Read the metadata of a columnar cache entry.
+
+    Returns ``None`` if the entry does not exist or is incomplete.
+    """
+    try:
+        with open(os.path.join(path, _META_FILE), 'r') as fobj:
+            return json.load(fobj)
+    except (OSError, ValueError):
+        return None
+
+
+def read_columnar(path: str,
+                  meta: Optional[dict] = None,
+                  keys: Optional[Iterable[str]] = None,
+                  mmap: bool = True) -> Dict[str, DataFrame]:
+    """Read a columnar cache entry.
+
+    Args:
+        path: path of the entry directory
+        meta: previously loaded metadata of this entry (optional)
+        keys: only read the DataFrames for these keys (default: all)
+        mmap: open the data with memory mapping; modifications of the
+            returned data are copy-on-write and never change the files
+
+    Returns:
+        dictionary of DataFrames
+    """
+    if meta is None:
+        meta = read_columnar_meta(path)
+        if meta is None:
+            raise FileNotFoundError(f"Incomplete cache entry: {path}")
+
+    entries = meta['entries']
+    if keys is None:
+        keys = entries.keys()
+
+    mmap_mode = 'c' if mmap else None
+    data = dict()
+    for key in keys:
+        if key not in entries:
+            continue
+        entry = entries[key]
+        columns = entry['columns']
+        positions = {col: i for i, col in enumerate(columns)}
+
+        blocks = list()
+        for block in entry['blocks']:
+            values = np.load(os.path.join(path, block['file']),
+                             mmap_mode=mmap_mode, allow_pickle=False)
+            blocks.append(
+                (values, [positions[col] for col in block['columns']])
+            )
+
+        for str_col in entry['strings']:
+            codes = np.load(os.path.join(path, str_col['file']),
+                            mmap_mode=mmap_mode, allow_pickle=False)
+            uniques = np.empty(len(str_col['values']), dtype=object)
+            uniques[:] = str_col['values']
+            blocks.append(
+                (uniques[codes].reshape(1, -1), [positions[str_col['column']]])
+            )
+
+        if entry['objects'] is not None:
+            with open(os.path.join(path, entry['objects']), 'rb') as fobj:
+                obj_df = compression.load(fobj)
+            for col in obj_df.columns:
+                values = obj_df[col].to_numpy().reshape(1, -1)
+                blocks.append((values, [positions[col]]))
+
+        data[key] = create_df_from_blocks(
+            blocks=blocks, columns=columns, length=entry['length']
+        )
+
+    logger.debug(f"Read {len(data)} columnar entries from {path}")
+    return data
+
+
+def get_size(path: str, meta: dict,
+             keys: Optional[Iterable[str]] = None) -> int:
+    """Return the total size in bytes of the files that hold the data for
+    some keys (default: all) of a columnar cache entry."""
+    entries = meta['entries']
+    if keys is None:
+        keys = entries.keys()
+    size = 0
+    for key in keys:
+        if key not in entries:
+            continue
+        entry = entries[key]
+        files = [block['file'] for block in entry['blocks']] \
+            + [str_col['file'] for str_col in entry['strings']]
+        if entry['objects'] is not None:
+            files.append(entry['objects'])
+        size += sum(os.path.getsize(os.path.join(path, fname))
+                    for fname in files)
+    return size
+
+
+def pack_columnar(path: str) -> bytes:
+    """Pack a columnar cache entry into a single (uncompressed) tar archive,
+    e.g. for storing it in a remote cache backend."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        # metadata last, like when the entry is written
+        for fname in sorted(os.listdir(path), key=lambda f: f == _META_FILE):
+            tar.add(os.path.join(path, fname), arcname=fname)
+    return buffer.getvalue()
+
+
+def unpack_columnar(data: bytes, path: str):
+    """Unpack a tar archive that was created by :func:`pack_columnar` into
+    a new entry directory."""
+    os.makedirs(path)
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r') as tar:
+        for member in tar:
+            # only plain files directly inside the entry directory
+            if (not member.isfile()) \
+                    or (os.path.basename(member.name) != member.name) \
+                    or member.name in ('', '.', '..'):
+                raise ValueError(f"Invalid columnar archive member "
+                                 f"'{member.name}'")
+            with open(os.path.join(path, member.name), 'wb') as fobj:
+                fobj.write(tar.extractfile(member).read())
+
+
+def remove_columnar(path: str):
+    """Remove a columnar cache entry directory and all files in it."""
+    if not os.path.isdir(path):
+        return
+    # metadata first, so that the entry is marked as incomplete immediately
+    for fname in sorted(os.listdir(path), key=lambda f: f != _META_FILE):
+        os.remove(os.path.join(path, fname))
+    os.rmdir(path)
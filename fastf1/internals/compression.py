@@ -0,0 +1,244 @@
+"""Compression of pickled cache entries.
+
+Compressed data starts with a short header that records the codec and the
+compression level::
+
+    b'FF1Z' | header length (uint16, little endian) | json header | data
+
+Data without this header is read as it is, so that uncompressed and
+compressed cache entries can be used side by side.
+
+The codecs ``'zstd'`` and ``'lz4'`` require optional dependencies:
+
+- ``'zstd'``: `zstandard <https://pypi.org/project/zstandard/>`_
+- ``'lz4'``: `lz4 <https://pypi.org/project/lz4/>`_
+
+``'zlib'`` is always available, but slower and less effective.
+"""
+import gzip
+import json
+import pickle
+import struct
+import zlib
+from typing import Any, BinaryIO, Iterator, Optional
+
+
+MAGIC = b'FF1Z'
+
+CODECS = {
+    # codec: (module, default level)
+    'zstd': ('zstandard', 3),
+    'lz4': ('lz4', 0),
+    'zlib': ('zlib', 1),
+}
+
+
+def check_codec(codec: Optional[str]):
+    """Check that a codec is known and that its dependency is installed.
+
+    Raises:
+        ValueError: unknown codec
+        ImportError: missing optional dependency
+    """
+    if codec is None:
+        return
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec '{codec}', supported "
+                         f"codecs are {', '.join(CODECS)}")
+    _import_codec(codec)
+
+
+def _import_codec(codec: str):
+    module = CODECS[codec][0]
+    try:
+        if codec == 'zstd':
+            import zstandard
+            return zstandard
+        elif codec == 'lz4':
+            import lz4.frame
+            return lz4.frame
+        else:
+            return zlib
+    except ImportError:
+        raise ImportError(f"Compression codec '{codec}' requires the "
+                          f"optional dependency '{module}'") from None
+
+
+def compress(data: bytes, codec: str, level: Optional[int] = None) -> bytes:
+    """Compress data and prepend the header.
+
+    Args:
+        data: uncompressed data
+        codec: one of :data:`CODECS`
+        level: compression level, the codec's default level if ``None``
+    """
+    if level is None:
+        level = CODECS[codec][1]
+    lib = _import_codec(codec)
+    if codec == 'zstd':
+        payload = lib.ZstdCompressor(level=level).compress(data)
+    elif codec == 'lz4':
+        payload = lib.compress(data, compression_level=level)
+    else:
+        payload = lib.compress(data, level)
+
+    header = json.dumps({'codec': codec, 'level': level}).encode()
+    return MAGIC + struct.pack('<H', len(header)) + header + payload
+
+
+class IncrementalCompressor:
+    """Compress data that is given in chunks. The concatenated output is
+    in the same format as the output of :func:`compress` and can be read
+    with :func:`iter_decompressed`.
+
+    Args:
+        codec: one of :data:`CODECS`
+        level: compression level, the codec's default level if ``None``
+    """
+    def __init__(self, codec: str, level: Optional[int] = None):
+        if level is None:
+            level = CODECS[codec][1]
+        lib = _import_codec(codec)
+        header = json.dumps({'codec': codec, 'level': level}).encode()
+        self._start = MAGIC + struct.pack('<H', len(header)) + header
+        if codec == 'zstd':
+            self._compressor = lib.ZstdCompressor(level=level).compressobj()
+        elif codec == 'lz4':
+            self._compressor = lib.LZ4FrameCompressor(
+                compression_level=level
+            )
+            self._start += self._compressor.begin()
+        else:
+            self._compressor = lib.compressobj(level)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk of data; returns the next part of the output."""
+        out = self._start + self._compressor.compress(data)
+        self._start = b''
+        return out
+
+    def flush(self) -> bytes:
+        """Return the remaining output after the last chunk."""
+        out = self._start + self._compressor.flush()
+        self._start = b''
+        return out
+
+
+def _parse_header(header: bytes) -> str:
+    codec = json.loads(header)['codec']
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec '{codec}'")
+    return codec
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress data. Data without a compression header is returned
+    unchanged."""
+    if not data.startswith(MAGIC):
+        return data
+    offset = len(MAGIC) + 2
+    header_len, = struct.unpack('<H', data[len(MAGIC):offset])
+    codec = _parse_header(data[offset:offset + header_len])
+    payload = data[offset + header_len:]
+
+    lib = _import_codec(codec)
+    if codec == 'zstd':
+        return lib.ZstdDecompressor().decompress(payload)
+    else:
+        return lib.decompress(payload)
+
+
+def iter_decompressed(fobj: BinaryIO,
+                      chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """Read and decompress a file in chunks, without holding all of its
+    data in memory at once. Data without a compression header is read as
+    it is."""
+    start = fobj.read(len(MAGIC) + 2)
+    if not start.startswith(MAGIC):
+        chunk = start + fobj.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = fobj.read(chunk_size)
+        return
+
+    header_len, = struct.unpack('<H', start[len(MAGIC):])
+    codec = _parse_header(fobj.read(header_len))
+    lib = _import_codec(codec)
+    if codec == 'zstd':
+        yield from lib.ZstdDecompressor().read_to_iter(fobj,
+                                                       read_size=chunk_size)
+        return
+
+    if codec == 'lz4':
+        decompressor = lib.LZ4FrameDecompressor()
+    else:
+        decompressor = lib.decompressobj()
+    while chunk := fobj.read(chunk_size):
+        yield decompressor.decompress(chunk)
+    if codec == 'zlib':
+        yield decompressor.flush()
+
+
+def dump(obj: Any, fobj: BinaryIO, codec: Optional[str] = None,
+         level: Optional[int] = None):
+    """Pickle an object to a file, compressed if a codec is given."""
+    if codec is None:
+        pickle.dump(obj, fobj)
+    else:
+        fobj.write(compress(pickle.dumps(obj), codec, level))
+
+
+def load(fobj: BinaryIO) -> Any:
+    """Unpickle an object from a file that is optionally compressed."""
+    return pickle.loads(decompress(fobj.read()))
+
+
+def stream_writer(fobj: BinaryIO, codec: str,
+                  level: Optional[int] = None) -> BinaryIO:
+    """Return a file object that compresses all data that is written to it
+    and writes it to ``fobj``. Closing the returned object does not close
+    ``fobj``.
+
+    Unlike :func:`compress`, no header is written. The codec is detected
+    from the codec's own frame format by :func:`stream_reader`.
+    """
+    if level is None:
+        level = CODECS[codec][1]
+    lib = _import_codec(codec)
+    if codec == 'zstd':
+        return lib.ZstdCompressor(level=level).stream_writer(fobj,
+                                                             closefd=False)
+    elif codec == 'lz4':
+        return lib.LZ4FrameFile(fobj, mode='wb', compression_level=level)
+    else:
+        return gzip.GzipFile(fileobj=fobj, mode='wb', compresslevel=level)
+
+
+_STREAM_MAGIC = {
+    b'\x28\xb5\x2f\xfd': 'zstd',
+    b'\x04\x22\x4d\x18': 'lz4',
+    b'\x1f\x8b': 'zlib',
+}
+
+
+def stream_reader(fobj: BinaryIO) -> BinaryIO:
+    """Return a file object that reads and decompresses data that was
+    written by :func:`stream_writer`. ``fobj`` needs to be seekable.
+
+    Raises:
+        ValueError: the data is not compressed with a known codec
+    """
+    start = fobj.read(4)
+    fobj.seek(-len(start), 1)
+    for magic, codec in _STREAM_MAGIC.items():
+        if start.startswith(magic):
+            break
+    else:
+        raise ValueError("Data is not compressed with a known codec")
+    lib = _import_codec(codec)
+    if codec == 'zstd':
+        return lib.ZstdDecompressor().stream_reader(fobj, closefd=False)
+    elif codec == 'lz4':
+        return lib.LZ4FrameFile(fobj, mode='rb')
+    else:
+        return gzip.GzipFile(fileobj=fobj, mode='rb')
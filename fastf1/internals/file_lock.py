@@ -0,0 +1,97 @@
+"""Inter-process locks based on lock files.
+
+The lock is held through an OS level lock on an open lock file (``flock`` on
+Unix, ``msvcrt.locking`` on Windows). It is therefore released automatically
+by the OS if the process that holds it exits unexpectedly. The lock files
+themselves are never removed while the lock is used.
+"""
+import os
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock that is shared between processes and threads.
+
+    Can be used as a context manager, in which case the lock is acquired
+    without a timeout.
+
+    Args:
+        path: path of the lock file (will be created if necessary)
+        poll_interval: time in seconds between attempts to acquire the lock
+    """
+    def __init__(self, path: str, poll_interval: float = 0.05):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    @property
+    def is_locked(self) -> bool:
+        """Whether the lock is currently held by this object."""
+        return self._fd is not None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Acquire the lock.
+
+        Args:
+            timeout: maximum time in seconds to wait for the lock; wait
+                indefinitely if ``None``
+
+        Returns:
+            ``True`` if the lock was acquired, ``False`` on timeout
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock '{self.path}' is already acquired")
+        t_start = time.monotonic()
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            while not self._try_lock(fd):
+                if (timeout is not None) \
+                        and (time.monotonic() - t_start >= timeout):
+                    os.close(fd)
+                    return False
+                time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def release(self):
+        """Release the lock."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
@@ -0,0 +1,88 @@
+"""Decoding of JSON data.
+
+All JSON data that FastF1 parses in bulk is decoded through :func:`loads`. By
+default, `orjson <https://pypi.org/project/orjson/>`_ is used if it is
+installed, because it is considerably faster than the :mod:`json` module of
+the standard library. The backend can be selected with
+:func:`set_json_backend`.
+
+The results are identical for both backends. Data that orjson does not
+support (e.g. ``NaN``, integers with more than 64 bits or invalid unicode
+escapes) is decoded by the standard library instead. Errors are always
+raised as :class:`json.JSONDecodeError` (or a subclass of it).
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+from fastf1.internals import internals_logger as logger
+
+
+BACKENDS = ('orjson', 'json')
+"""Supported backends"""
+
+JSONDecodeError = json.JSONDecodeError
+
+_backend: str = 'json'
+_loads: Callable[[Union[str, bytes]], Any] = json.loads
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document using the current backend."""
+    return _loads(data)
+
+
+def get_json_backend() -> str:
+    """Return the name of the backend that is currently used for decoding
+    JSON data."""
+    return _backend
+
+
+def set_json_backend(backend: Optional[str] = None):
+    """Select the backend that is used for decoding JSON data.
+
+    Decoding JSON data is a large part of the time that is needed for parsing
+    data from the F1 live timing API. The results are identical for all
+    backends.
+
+    Args:
+        backend: ``'orjson'`` (requires the optional dependency `orjson
+            <https://pypi.org/project/orjson/>`_), ``'json'`` (standard
+            library) or ``None`` to use orjson if it is installed and the
+            standard library else
+
+    Raises:
+        ValueError: unknown backend
+        ImportError: orjson was selected but is not installed
+    """
+    global _backend, _loads
+
+    if (backend is not None) and (backend not in BACKENDS):
+        raise ValueError(f"Unknown JSON backend '{backend}', supported "
+                         f"backends are {', '.join(BACKENDS)}")
+
+    if backend in (None, 'orjson'):
+        try:
+            import orjson
+        except ImportError:
+            if backend is not None:
+                raise ImportError("JSON backend 'orjson' requires the "
+                                  "optional dependency 'orjson'") from None
+        else:
+            def _loads_orjson(data):
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    # not supported by orjson or invalid; the standard
+                    # library decides, so that results and errors are
+                    # identical
+                    return json.loads(data)
+
+            _backend, _loads = 'orjson', _loads_orjson
+            logger.debug("Using JSON backend 'orjson'")
+            return
+
+    _backend, _loads = 'json', json.loads
+    logger.debug("Using JSON backend 'json'")
+
+
+set_json_backend()
@@ -0,0 +1,143 @@
+"""In-memory LRU cache for parsed API data.
+
+This is used as an additional tier in front of the stage 2 cache, so that
+data which was loaded recently is available without any disk access or
+deserialization.
+
+Values are copied when they are added and when they are returned, because
+the callers may modify the data in place. Only mutable containers and arrays
+are copied (see :func:`copy_value`), immutable objects like strings or
+timestamps are shared, which makes a copy much cheaper than a deep copy.
+"""
+import collections
+import copy
+import datetime
+import sys
+import threading
+from typing import Any, Hashable, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class MemoryCacheInfo(NamedTuple):
+    """Statistics of a :class:`MemoryCache`."""
+    hits: int
+    misses: int
+    items: int
+    size: int
+    max_items: int
+    max_size: Optional[int]
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the memory usage of an object in bytes.
+
+    Python objects that are referenced by DataFrames or arrays of dtype
+    object (usually short, shared strings) are only counted as references.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(index=True, deep=False)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else usage
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+# types of objects which are immutable and therefore never copied
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, type(None),
+                    datetime.date, datetime.time, datetime.timedelta,
+                    np.generic, type(pd.NaT))
+
+
+def copy_value(obj: Any) -> Any:
+    """Copy an object, so that modifying the copy does not modify the
+    original.
+
+    In contrast to :func:`copy.deepcopy`, immutable objects are shared
+    between the original and the copy. DataFrames, Series and arrays are
+    copied including their data, but Python objects that are referenced by
+    them (usually strings) are shared as well. Objects of other types are
+    deep-copied.
+    """
+    if isinstance(obj, _IMMUTABLE_TYPES):
+        return obj
+    if isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+        return obj.copy()
+    if type(obj) is dict:
+        return {k: copy_value(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [copy_value(v) for v in obj]
+    if type(obj) is tuple:
+        return tuple(copy_value(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+class MemoryCache:
+    """Thread-safe LRU cache that is limited by item count and size.
+
+    Args:
+        max_items: maximum number of items
+        max_size: maximum total (estimated) size of all items in bytes,
+            unlimited if ``None``
+    """
+    def __init__(self, max_items: int, max_size: Optional[int] = None):
+        self.max_items = max_items
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached value or ``None`` if the key is not
+        cached."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+        return copy_value(item[0])
+
+    def put(self, key: Hashable, value: Any):
+        """Add a copy of a value to the cache. Values that are larger than
+        the maximum size of the cache are not added."""
+        size = estimate_size(value)
+        if (self.max_items < 1) \
+                or ((self.max_size is not None) and (size > self.max_size)):
+            return
+        value = copy_value(value)
+        with self._lock:
+            if key in self._items:
+                self._size -= self._items.pop(key)[1]
+            self._items[key] = (value, size)
+            self._size += size
+            while (len(self._items) > self.max_items) \
+                    or ((self.max_size is not None)
+                        and (self._size > self.max_size)):
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        """Remove all items. The hit and miss counters are not reset."""
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def info(self) -> MemoryCacheInfo:
+        """Return the current statistics of the cache."""
+        with self._lock:
+            return MemoryCacheInfo(
+                hits=self.hits, misses=self.misses, items=len(self._items),
+                size=self._size, max_items=self.max_items,
+                max_size=self.max_size
+            )
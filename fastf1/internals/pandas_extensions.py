@@ -1,6 +1,6 @@
 from fastf1.internals import internals_logger as logger
 
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
@@ -90,3 +90,82 @@ def _unsafe_create_df_fast(
     df = DataFrame(mgr)
 
     return df
+
+
+def create_df_from_blocks(
+        *,
+        blocks: List[Tuple[np.ndarray, List[int]]],
+        columns: list,
+        length: int,
+        fallback: bool = True
+) -> DataFrame:
+    """Create a DataFrame directly from 2D arrays in pandas' block layout.
+
+    Each block is a 2D array of shape ``(n_columns, length)`` together with
+    the positions of its columns in ``columns``. The arrays are used as
+    they are, without copying or consolidating them. This allows, for
+    example, creating a DataFrame on top of memory-mapped arrays.
+
+    In case of error, this function falls back to the official documented
+    way of creating DataFrames (this will copy the data).
+
+    Args:
+        blocks: list of tuples ``(values, positions)``, where ``values`` is a
+            2D numpy array and ``positions`` are the column indices of the
+            rows of this array
+        columns: list of column names
+        length: number of rows
+        fallback: use Pandas' default method of DataFrame creation in case
+            of errors
+
+    Returns:
+        DataFrame with a default ``RangeIndex``
+    """
+    try:
+        return _unsafe_create_df_from_blocks(blocks, columns, length)
+    except Exception as exc:
+        if not fallback:
+            raise exc
+        logger.warning("Falling back to slow data frame creation!")
+        logger.debug("Error during DataFrame creation from blocks",
+                     exc_info=exc)
+        data = dict()
+        for values, positions in blocks:
+            for row, pos in enumerate(positions):
+                data[pos] = values[row]
+        return DataFrame(
+            {columns[pos]: data[pos] for pos in range(len(columns))}
+        )
+
+
+def _unsafe_create_df_from_blocks(
+        blocks: List[Tuple[np.ndarray, List[int]]],
+        columns: list,
+        length: int
+) -> DataFrame:
+    # Same as `_unsafe_create_df_fast` but takes data that is already
+    # organized in blocks. Blocks are not consolidated, because consolidation
+    # would copy the data. Always use this method through
+    # `create_df_from_blocks`, so that there is a fallback to safe DataFrame
+    # creation in case of an error.
+    index = RangeIndex(0, length)
+    columns = Index._with_infer(
+        list(columns), copy=False, tupleize_cols=False
+    )
+
+    index, columns = _get_axes(
+        len(index), len(columns), index=index, columns=columns
+    )
+
+    block_values = list()
+    for values, positions in blocks:
+        nb = new_block_2d(values, placement=BlockPlacement(list(positions)))
+        block_values.append(nb)
+
+    mgr = create_block_manager_from_blocks(
+            block_values, [columns, index], verify_integrity=False
+    )
+
+    df = DataFrame(mgr)
+
+    return df
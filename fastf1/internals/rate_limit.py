@@ -0,0 +1,121 @@
+"""Rate limiting that is shared between processes.
+
+A limit allows at most ``calls`` calls within any time window of length
+``interval`` (sliding window). The times of the most recent calls are kept
+in a small file that is protected by a :class:`~fastf1.internals.file_lock.
+FileLock`. All processes on the same machine therefore share one budget,
+for example when many worker processes are used. Limits can be used from
+multiple threads and from asyncio code.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from fastf1.internals import internals_logger as logger
+from fastf1.internals.file_lock import FileLock
+
+
+def get_default_state_dir() -> str:
+    """Directory in which the state of rate limits is shared."""
+    return os.path.join(tempfile.gettempdir(), 'fastf1_rate_limits')
+
+
+class SlidingWindowLimit:
+    """Allows at most ``calls`` calls within any window of ``interval``
+    seconds. The state is shared by all processes that use the same name and
+    state directory.
+
+    Args:
+        name: name of the limit, used as name of the state file
+        calls: maximum number of calls within the interval
+        interval: length of the time window in seconds
+        state_dir: directory of the state file, by default a directory in
+            the system's temporary directory
+    """
+    def __init__(self, name: str, calls: int, interval: float,
+                 state_dir: Optional[str] = None):
+        self.name = name
+        self.calls = calls
+        self.interval = interval
+        self._state_dir = state_dir
+        self._lock = threading.Lock()
+        # used if the state file is not accessible
+        self._local_state: Optional[List[float]] = None
+
+    @property
+    def state_dir(self) -> str:
+        return self._state_dir or get_default_state_dir()
+
+    def try_acquire(self) -> float:
+        """Register a call if it is allowed.
+
+        Returns:
+            ``0.0`` if the call was registered, else the time in seconds
+            until the next call is allowed
+        """
+        with self._lock:
+            if self._local_state is not None:
+                wait, self._local_state = self._take(self._local_state)
+                return wait
+            try:
+                return self._try_acquire_shared()
+            except OSError as exc:
+                logger.debug(f"Rate limit state for '{self.name}' is not "
+                             f"accessible, using a per-process state",
+                             exc_info=exc)
+                wait, self._local_state = self._take([])
+                return wait
+
+    def acquire(self, block: bool = True) -> bool:
+        """Register a call, waiting until it is allowed if ``block`` is
+        set.
+
+        Returns:
+            whether the call was registered
+        """
+        while (wait := self.try_acquire()) > 0:
+            if not block:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, block: bool = True) -> bool:
+        """Like :meth:`acquire`, but neither waiting nor accessing the
+        state file blocks the event loop."""
+        loop = asyncio.get_running_loop()
+        while (wait := await loop.run_in_executor(None,
+                                                  self.try_acquire)) > 0:
+            if not block:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+    def _try_acquire_shared(self) -> float:
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = os.path.join(self.state_dir, f'{self.name}.ff1rate')
+        with FileLock(path + '.ff1lock'):
+            state = list()
+            try:
+                with open(path, 'r') as fobj:
+                    state = [float(t) for t in fobj.read().split()]
+            except (OSError, ValueError):
+                pass  # missing or invalid, no previous calls
+            wait, state = self._take(state)
+            if not wait:
+                with open(path, 'w') as fobj:
+                    fobj.write(' '.join(repr(t) for t in state))
+        return wait
+
+    def _take(self, state: List[float]) -> Tuple[float, List[float]]:
+        # register a call if there were less than the maximum number of
+        # calls within the interval; returns the time to wait and the new
+        # state (times of the most recent calls)
+        now = time.time()
+        # times in the future are kept, in case the clock was changed
+        state = [t for t in state if t > now - self.interval][-self.calls:]
+        if len(state) < self.calls:
+            return 0.0, state + [now]
+        return max(state[0] + self.interval - now, 1e-3), state
@@ -0,0 +1,268 @@
+"""Content-addressed store for raw API responses.
+
+This is an alternative to the requests cache (stage 1) for large responses.
+Each response body is compressed and stored in a separate file that is named
+after the SHA-256 hash of the uncompressed body. Identical bodies are
+therefore only stored once. A small SQLite database maps each URL to the hash
+of its current body, together with the information that is required for
+revalidating the response (time of storage, ETag and Last-Modified header).
+
+The files can be read by any number of processes concurrently, without going
+through a database. Bodies that are not referenced by any URL anymore are
+removed with :meth:`RawStore.gc`.
+"""
+import contextlib
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional
+
+from fastf1.internals import compression
+from fastf1.internals import internals_logger as logger
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_digest ON responses (digest);
+"""
+
+
+class RawEntry(NamedTuple):
+    """A stored response."""
+    url: str
+    digest: str
+    size: int
+    """Size of the uncompressed body in bytes"""
+    stored_at: float
+    """Time at which the response was stored or last revalidated"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class RawStore:
+    """Store for raw response bodies.
+
+    Args:
+        directory: path of the store (will be created if necessary)
+        codec: compression codec, see :mod:`fastf1.internals.compression`
+        level: compression level, default level of the codec if ``None``
+    """
+    def __init__(self, directory: str, codec: str = 'zlib',
+                 level: Optional[int] = None):
+        compression.check_codec(codec)
+        self.directory = directory
+        self.codec = codec
+        self.level = level
+        self.db_path = os.path.join(directory, 'index.sqlite')
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # commit on success and always close the connection
+        con = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def object_path(self, digest: str) -> str:
+        """Return the path of the (compressed) file that stores a body."""
+        return os.path.join(self.directory, 'objects', digest[:2],
+                            digest + '.ff1raw')
+
+    def lookup(self, url: str) -> Optional[RawEntry]:
+        """Return the stored entry for a URL or ``None`` if the URL is not
+        stored or its body is missing."""
+        with self._connect() as con:
+            row = con.execute(
+                "SELECT url, digest, size, stored_at, etag, last_modified "
+                "FROM responses WHERE url = ?", (url, )
+            ).fetchone()
+        if (row is None) or not os.path.isfile(self.object_path(row[1])):
+            return None
+        return RawEntry(*row)
+
+    def entries(self) -> Iterator[RawEntry]:
+        """Iterate over all stored entries whose body exists."""
+        with self._connect() as con:
+            rows = con.execute(
+                "SELECT url, digest, size, stored_at, etag, last_modified "
+                "FROM responses ORDER BY url"
+            ).fetchall()
+        for row in rows:
+            if os.path.isfile(self.object_path(row[1])):
+                yield RawEntry(*row)
+
+    def put(self, url: str, content: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> RawEntry:
+        """Store the body of a response for a URL."""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.object_path(digest)
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.ff1tmp"
+            try:
+                with open(tmp_path, 'wb') as fobj:
+                    fobj.write(
+                        compression.compress(content, self.codec, self.level)
+                    )
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
+
+        entry = RawEntry(url, digest, len(content), time.time(), etag,
+                         last_modified)
+        self._insert(entry)
+        return entry
+
+    def add(self, entry: RawEntry, fobj: BinaryIO):
+        """Add a response whose body file was created by another store,
+        for example when a cache is copied. The body file is read from
+        ``fobj`` as it is."""
+        path = self.object_path(entry.digest)
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.ff1tmp"
+            try:
+                with open(tmp_path, 'wb') as tmp_fobj:
+                    shutil.copyfileobj(fobj, tmp_fobj)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
+
+        self._insert(entry)
+
+    def writer(self, url: str, etag: Optional[str] = None,
+               last_modified: Optional[str] = None) -> 'RawWriter':
+        """Store the body of a response for a URL that is written in chunks,
+        for example while it is downloaded. The response is only stored when
+        :meth:`RawWriter.commit` is called."""
+        return RawWriter(self, url, etag, last_modified)
+
+    def _insert(self, entry: RawEntry):
+        with self._connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, digest, size, stored_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)", entry
+            )
+
+    def touch(self, url: str):
+        """Mark the stored response for a URL as revalidated."""
+        with self._connect() as con:
+            con.execute("UPDATE responses SET stored_at = ? WHERE url = ?",
+                        (time.time(), url))
+
+    def iter_content(self, entry: RawEntry,
+                     chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Read the body of a stored response in chunks of uncompressed
+        data."""
+        with open(self.object_path(entry.digest), 'rb') as fobj:
+            yield from compression.iter_decompressed(fobj, chunk_size)
+
+    def delete(self, urls: Iterable[str]):
+        """Remove the responses for some URLs. The bodies are only removed
+        by :meth:`gc`."""
+        with self._connect() as con:
+            con.executemany("DELETE FROM responses WHERE url = ?",
+                            [(url, ) for url in urls])
+
+    def gc(self, max_age: Optional[float] = None) -> int:
+        """Remove bodies which are not referenced by any URL anymore.
+
+        Args:
+            max_age: additionally remove all responses which were stored or
+                revalidated more than this many seconds ago
+
+        Returns:
+            number of removed bodies
+        """
+        with self._connect() as con:
+            if max_age is not None:
+                con.execute("DELETE FROM responses WHERE stored_at < ?",
+                            (time.time() - max_age, ))
+            referenced = {row[0] for row in
+                          con.execute("SELECT DISTINCT digest FROM responses")}
+
+        removed = 0
+        objects_dir = os.path.join(self.directory, 'objects')
+        for dirpath, _, filenames in os.walk(objects_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                digest, ext = os.path.splitext(filename)
+                if (ext == '.ff1raw') and (digest in referenced):
+                    continue
+                if (ext == '.ff1tmp') \
+                        and (os.path.getmtime(path) > time.time() - 3600):
+                    continue  # possibly still being written
+                # unreferenced bodies and leftover temporary files
+                os.remove(path)
+                removed += 1
+        logger.debug(f"Removed {removed} unreferenced raw responses")
+        return removed
+
+
+class RawWriter:
+    """Writes the body of a response to a :class:`RawStore` in chunks.
+
+    The body is compressed and hashed while it is written to a temporary
+    file. The file is renamed after its hash when the writer is committed.
+    """
+    def __init__(self, store: RawStore, url: str, etag: Optional[str],
+                 last_modified: Optional[str]):
+        self._store = store
+        self._entry = (url, etag, last_modified)
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._compressor = compression.IncrementalCompressor(store.codec,
+                                                             store.level)
+        self._tmp_path = os.path.join(
+            store.directory, 'objects',
+            f"{os.getpid()}-{threading.get_ident()}-{id(self)}.ff1tmp"
+        )
+        self._fobj = open(self._tmp_path, 'wb')
+
+    def write(self, chunk: bytes):
+        """Add the next chunk of the body."""
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        self._fobj.write(self._compressor.compress(chunk))
+
+    def commit(self) -> RawEntry:
+        """Store the response after the complete body was written."""
+        try:
+            self._fobj.write(self._compressor.flush())
+            self._fobj.close()
+            digest = self._hash.hexdigest()
+            path = self._store.object_path(digest)
+            if not os.path.isfile(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(self._tmp_path, path)
+        finally:
+            self.abort()
+        url, etag, last_modified = self._entry
+        entry = RawEntry(url, digest, self._size, time.time(), etag,
+                         last_modified)
+        self._store._insert(entry)
+        return entry
+
+    def abort(self):
+        """Discard the response, e.g. if it was not received completely."""
+        self._fobj.close()
+        if os.path.isfile(self._tmp_path):
+            os.remove(self._tmp_path)
@@ -3,9 +3,9 @@ Data object for livetiming data
 """
 
 from datetime import timedelta
-import json
 import hashlib
 
+from fastf1.internals import json_backend
 from fastf1.logger import get_logger
 from fastf1.utils import to_datetime, recursive_dict_get
 
@@ -113,8 +113,8 @@ class LiveTimingData:
         # load the three parts of each data element
         elem = self._fix_json(elem)
         try:
-            cat, msg, dt_str = json.loads(elem)
-        except (json.JSONDecodeError, ValueError):
+            cat, msg, dt_str = json_backend.loads(elem)
+        except (json_backend.JSONDecodeError, ValueError):
             self.errorcount += 1
             return
 
@@ -217,8 +217,8 @@ class LiveTimingData:
         # decode matching line
         elem = self._fix_json(elem)
         try:
-            cat, msg, dt = json.loads(elem)
-        except (json.JSONDecodeError, ValueError):
+            cat, msg, dt = json_backend.loads(elem)
+        except (json_backend.JSONDecodeError, ValueError):
             _logger.error("Error while trying to set correct "
                           "session start date!")
             return
@@ -18,25 +18,61 @@ When rate limits are exceeded, FastF1 will either...
 
 - raise a :class:`fastf1.RateLimitExceededError` (hard rate limit)
 
+Requests that fail because of a temporary problem (connection errors,
+timeouts and some server errors) are retried with an increasing delay, see
+:func:`fastf1.Cache.set_retry_policy`.
+
+Rate limits are shared by all processes that run FastF1 on the same machine,
+for example when data is loaded by multiple worker processes.
+
 """
 
-import collections
+import atexit
 import datetime
+import fnmatch
 import functools
+import hashlib
 import math
 import os
+import random
 import re
-import pickle
+import shutil
 import sys
+import tarfile
+import threading
 import time
-from typing import Optional
+import urllib.parse
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
 
 import requests
+import requests.adapters
 from requests_cache import CacheMixin
 
+from fastf1.internals import columnar, compression
+from fastf1.internals.cache_index import CacheIndex, INDEX_FILE_NAME
+from fastf1.internals.cache_stats import CacheStats, StatsRecorder
+from fastf1.internals.compression import check_codec
+from fastf1.internals.file_lock import FileLock
+from fastf1.internals.memory_cache import MemoryCache, MemoryCacheInfo
+from fastf1.internals.rate_limit import SlidingWindowLimit
+from fastf1.internals.raw_store import RawStore
 from fastf1.logger import get_logger
 
 
+if TYPE_CHECKING:
+    from fastf1.cache.backends import CacheBackend
+    from fastf1.cache.bundle import BundleSummary
+
+
 _logger = get_logger(__name__)
 
 
@@ -67,36 +103,73 @@ class _MinIntervalLimitDelay:
     """Ensure that there is at least a minimum delay between each request.
 
     Sleeps for the remaining amount of time if the last request was more recent
-    than allowed by the minimum interval rule.
+    than allowed by the minimum interval rule. The limit is shared by all
+    processes on the same machine.
     """
-    def __init__(self, interval: float):
-        self._interval: float = interval
-        self._t_last: float = 0.0
+    def __init__(self, name: str, interval: float):
+        self._window = SlidingWindowLimit(name, calls=1, interval=interval)
 
     def limit(self):
-        t_now = time.time()
-        if (delta := (t_now - self._t_last)) < self._interval:
-            time.sleep(self._interval - delta)
-        self._t_last = t_now
+        self._window.acquire()
+
+    async def limit_async(self):
+        await self._window.acquire_async()
 
 
 class _CallsPerIntervalLimitRaise:
-    """Ensures that there is a maximum number of requests within a fixed
-    interval of time.
+    """Ensures that there is a maximum number of requests within any interval
+    of time.
 
     If the maximum number of allowed requests within this interval is exceeded,
-    a :class:`RateLimitExceeded` exception is raised.
+    a :class:`RateLimitExceeded` exception is raised. The limit is shared by
+    all processes on the same machine.
     """
-    def __init__(self, calls: int, interval: float, info: str):
-        self._interval: float = interval
-        self._timestamps = collections.deque(maxlen=calls)
+    def __init__(self, name: str, calls: int, interval: float, info: str):
+        self._window = SlidingWindowLimit(name, calls=calls,
+                                          interval=interval)
         self._info = info
 
     def limit(self):
-        self._timestamps.append(time.time())
-        if len(self._timestamps) == self._timestamps.maxlen:
-            if self._timestamps[0] > (time.time() - self._interval):
-                raise RateLimitExceededError(self._info)
+        if not self._window.acquire(block=False):
+            raise RateLimitExceededError(self._info)
+
+    async def limit_async(self):
+        if not await self._window.acquire_async(block=False):
+            raise RateLimitExceededError(self._info)
+
+
+class _RetryPolicy:
+    """Retry failed requests with jittered exponential backoff.
+
+    Requests that fail with a connection error, a timeout or a status code
+    that indicates a temporary problem are retried. Before each retry, a
+    random time between zero and an exponentially growing upper bound is
+    waited. Requests are not retried anymore if the total time for all
+    attempts would exceed the timeout budget. Only requests with an
+    idempotent method are retried.
+    """
+    RETRY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int, backoff: float, max_backoff: float,
+                 timeout: Optional[float], total_timeout: Optional[float]):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+
+    def delay(self, attempt: int, response=None) -> float:
+        # wait time before retrying after the given (zero-based) attempt
+        delay = random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt)
+        )
+        if response is not None:
+            # servers may request a minimum wait time
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.max_backoff))
+        return delay
 
 
 class _SessionWithRateLimiting(requests.Session):
@@ -105,23 +178,94 @@ class _SessionWithRateLimiting(requests.Session):
     _RATE_LIMITS = {
         # limits on ergast.com
         re.compile(r"^https?://(\w+\.)?ergast\.com.*"): [
-            _MinIntervalLimitDelay(0.25),
+            _MinIntervalLimitDelay('ergast_soft', 0.25),
             # soft limit 4 calls/sec
-            _CallsPerIntervalLimitRaise(200, 60*60, "ergast.com: 200 calls/h")
+            _CallsPerIntervalLimitRaise('ergast_hard', 200, 60*60,
+                                        "ergast.com: 200 calls/h")
             # hard limit 200 calls/h
         ]
     }
+    # persistent (keep-alive) connections are shared by all sessions, see
+    # `Cache.set_connection_pool`
+    _connection_pool = requests.adapters.HTTPAdapter(pool_connections=10,
+                                                     pool_maxsize=10)
+    # see `Cache.set_retry_policy`
+    _retry_policy = _RetryPolicy(max_retries=3, backoff=0.5, max_backoff=30,
+                                 timeout=30, total_timeout=120)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_connection_pool()
+
+    def use_connection_pool(self):
+        for prefix in ('https://', 'http://'):
+            self.mount(prefix, self._connection_pool)
 
     def send(self, request, **kwargs):
-        # patches rate limiting into `requests.send`
-        for pattern, limiters in self._RATE_LIMITS.items():
-            # match url pattern
-            if pattern.match(request.url):
-                for lim in limiters:
-                    # apply all defined limiters
-                    lim.limit()
+        # patches rate limiting, retries and timeouts into `requests.send`
+        policy = self._retry_policy
+        endpoint = urllib.parse.urlsplit(request.url).hostname or ''
+        # a timeout that is set explicitly is used for each attempt
+        timeout = kwargs.pop('timeout', None)
+        t_start = time.monotonic()
+        attempt = 0
+        while True:
+            for pattern, limiters in self._RATE_LIMITS.items():
+                # match url pattern
+                if pattern.match(request.url):
+                    for lim in limiters:
+                        # apply all defined limiters
+                        lim.limit()
+
+            elapsed = time.monotonic() - t_start
+            attempt_timeout = timeout
+            if attempt_timeout is None:
+                attempt_timeout = policy.timeout
+                if policy.total_timeout is not None:
+                    remaining = max(policy.total_timeout - elapsed, 0.1)
+                    attempt_timeout = min(attempt_timeout or remaining,
+                                          remaining)
+
+            response = exc = error = None
+            t_attempt = time.monotonic()
+            try:
+                response = super().send(request, timeout=attempt_timeout,
+                                        **kwargs)
+            except requests.Timeout as timeout_exc:
+                error, exc = 'timeout', timeout_exc
+            except requests.ConnectionError as connection_exc:
+                error, exc = 'connection', connection_exc
+            else:
+                if response.status_code >= 400:
+                    error = f'http_{response.status_code}'
+            latency = time.monotonic() - t_attempt
+
+            retry = False
+            # other requests may not be repeated safely
+            if (request.method in policy.RETRY_METHODS) and (
+                    (exc is not None)
+                    or (response.status_code in policy.RETRY_STATUS_CODES)):
+                delay = policy.delay(attempt, response)
+                retry = (attempt < policy.max_retries) and (
+                    (policy.total_timeout is None)
+                    or (time.monotonic() - t_start + delay
+                        < policy.total_timeout)
+                )
+            Cache._stats.record_request(
+                endpoint, latency, error, retry=retry,
+                failure=(error is not None) and not retry
+            )
+            if not retry:
+                if exc is not None:
+                    raise exc
+                return response
 
-        return super().send(request, **kwargs)
+            _logger.debug(f"Request to {request.url} failed ({error}), "
+                          f"retrying in {delay:.1f}s")
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
 
 
 class _CachedSessionWithRateLimiting(CacheMixin, _SessionWithRateLimiting):
@@ -157,6 +301,12 @@ class Cache:
         fastf1.Cache.set_disabled
         fastf1.Cache.set_enabled
         fastf1.Cache.offline_mode
+        fastf1.Cache.set_connection_pool
+        fastf1.Cache.set_retry_policy
+        fastf1.Cache.stats
+        fastf1.Cache.collect_stats
+        fastf1.Cache.export_bundle
+        fastf1.Cache.import_bundle
 
     The parsed API data will be saved as a pickled object.
     Raw GET and POST requests are cached in a sqlite db using the
@@ -169,6 +319,10 @@ class Cache:
 
     - Stage 1: Caching of raw GET requests. This works for all requests.
       Cache control is employed to refresh the cached data periodically.
+      Data of the current season is refreshed after 12 hours and data of
+      past seasons after 30 days. Responses are revalidated with conditional
+      requests (ETag and Last-Modified), so that unchanged data is not
+      downloaded again.
     - Stage 2: Caching of the parsed data. This saves a lot of time when
       running your scripts,  as parsing of the data is computationally
       expensive. Stage 2 caching is only used for some api functions.
@@ -197,10 +351,32 @@ class Cache:
     need which will lead to reduced performance.
     """
     _CACHE_DIR = None
-    # version of the api parser code (unrelated to release version number)
+    # version of the api parser core code and of the cache format (unrelated
+    # to release version number); each api function additionally has its own
+    # parser version, see `api_request_wrapper`
     _API_CORE_VERSION = 11
     _IGNORE_VERSION = False
     _FORCE_RENEW = False
+    _COLUMNAR_TELEMETRY = False
+    _COMPRESSION: Optional[str] = None
+    _COMPRESSION_LEVEL: Optional[int] = None
+    _MAX_SIZE: Optional[int] = None
+
+    _index: Optional[CacheIndex] = None
+    _maintenance_thread: Optional[threading.Thread] = None
+    _maintenance_lock = threading.Lock()
+    _maintenance_wakeup = threading.Event()
+    _maintenance_tasks: Set[str] = set()
+    _pending_accesses: Dict[str, float] = dict()
+    _ACCESS_FLUSH_DELAY = 2.0  # seconds
+    _memory_cache: Optional[MemoryCache] = None
+    _raw_store: Optional[RawStore] = None
+    _RAW_STORE_DIR = 'fastf1_raw_store'
+    _backend: Optional['CacheBackend'] = None
+    # cached responses are revalidated after this time; data of past seasons
+    # rarely changes and is revalidated less often
+    _EXPIRE_AFTER = datetime.timedelta(hours=12)
+    _EXPIRE_AFTER_HISTORICAL = datetime.timedelta(days=30)
 
     _requests_session_cached: Optional[_CachedSessionWithRateLimiting] = None
     _requests_session: requests.Session = _SessionWithRateLimiting()
@@ -209,6 +385,7 @@ class Cache:
     _ci_mode = False
 
     _request_counter = 0  # count uncached requests for debugging purposes
+    _stats = StatsRecorder()
 
     def __repr__(self):
         return "ahaha"
@@ -217,7 +394,13 @@ class Cache:
     def enable_cache(
             cls, cache_dir: str, ignore_version: bool = False,
             force_renew: bool = False,
-            use_requests_cache: bool = True):
+            use_requests_cache: bool = True,
+            columnar_telemetry: bool = False,
+            max_size: Optional[Union[int, str]] = None,
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            raw_store: bool = False,
+            backend: Optional['CacheBackend'] = None):
         """Enables the API cache.
 
         Args:
@@ -230,7 +413,52 @@ class Cache:
             force_renew: Ignore existing cached data. Download data and update
                 the cache instead.
             use_requests_cache: Do caching of the raw GET and POST requests.
+            columnar_telemetry: Store parsed car data and position data in
+                a columnar format (one ``.npy`` file per driver and dtype)
+                instead of a single pickle file. This data is opened with
+                memory mapping when it is loaded from the cache, which is
+                considerably faster and allows multiple processes to share
+                the same memory pages. Only the data of the requested drivers
+                is read from it. Existing cached data in the pickle format
+                remains usable.
+            max_size: Maximum size of the parsed data in the cache (stage 2),
+                either in bytes or as a string like ``'10 GB'``. When the
+                cache grows larger than this, the least recently used
+                sessions are removed in the background. Their raw responses
+                are removed from the requests cache (stage 1) as well.
+            compression: Compress parsed data in the cache (stage 2) using
+                the codec ``'zstd'``, ``'lz4'`` or ``'zlib'``. The first two
+                require the optional dependency `zstandard` or `lz4`
+                respectively. Compressed data
+                is considerably smaller and usually faster to read from slow
+                or network storage. Data is decompressed transparently when
+                it is loaded and existing uncompressed data remains usable.
+                Columnar telemetry data is not compressed, because it is
+                memory mapped.
+            compression_level: Compression level for the selected codec. The
+                codec's default level is used if this is not specified.
+            raw_store: Store the raw responses of the live timing API's data
+                streams in compressed files instead of the requests cache.
+                Each file is named after the hash of its content and can be
+                read without going through the requests cache database. This
+                keeps the requests cache small and allows multiple processes
+                to read raw data concurrently. The ``compression`` codec is
+                used, or ``'zlib'`` if compression is not enabled. Existing
+                responses in the requests cache are not moved to the raw
+                store. See also :func:`gc_raw_store`.
+            backend: A shared storage backend (see
+                :mod:`fastf1.cache.backends`), for example a directory on a
+                network file system or an HTTP object store. Parsed data and
+                raw responses of the live timing API's data streams that are
+                not cached locally are copied from the backend if possible,
+                before they are downloaded and parsed. Data that is
+                downloaded and parsed locally is added to the backend,
+                unless it is read-only. This allows to share one warm cache
+                between many machines.
         """
+        # fail early if the codec is unknown or its dependency is missing
+        check_codec(compression)
+
         # Allow users to use paths such as %LOCALAPPDATA%
         cache_dir = os.path.expandvars(cache_dir)
 
@@ -243,18 +471,59 @@ class Cache:
         cls._CACHE_DIR = cache_dir
         cls._IGNORE_VERSION = ignore_version
         cls._FORCE_RENEW = force_renew
+        cls._COLUMNAR_TELEMETRY = columnar_telemetry
+        cls._COMPRESSION = compression
+        cls._COMPRESSION_LEVEL = compression_level
+        cls._MAX_SIZE = cls._parse_size(max_size)
+        cls._backend = backend
+        if cls._memory_cache is not None:
+            cls._memory_cache.clear()
+        cls._index = None
+        if cls._MAX_SIZE is not None:
+            # the index is only needed for enforcing the size limit; entries
+            # that were written while no limit was set are added to it first
+            cls._index = CacheIndex(cache_dir)
+            cls._start_maintenance(rebuild_index=True)
+
+        cls._raw_store = None
+        if raw_store:
+            cls._raw_store = RawStore(
+                os.path.join(cache_dir, cls._RAW_STORE_DIR),
+                codec=compression or 'zlib', level=compression_level
+            )
+
         if use_requests_cache:
             cls._requests_session_cached = _CachedSessionWithRateLimiting(
                 cache_name=os.path.join(cache_dir, 'fastf1_http_cache'),
                 backend='sqlite',
                 allowable_methods=('GET', 'POST'),
-                expire_after=datetime.timedelta(hours=12),
+                expire_after=cls._EXPIRE_AFTER,
+                urls_expire_after=cls._get_expiration_patterns(),
                 cache_control=True,
                 stale_if_error=True,
                 filter_fn=cls._custom_cache_filter
             )
             if force_renew:
                 cls._requests_session_cached.cache.clear()
+        if force_renew and (cls._raw_store is not None):
+            cls._raw_store.gc(max_age=0)
+
+    @classmethod
+    def _get_config(cls) -> dict:
+        # keyword arguments for `enable_cache` that enable the cache with the
+        # current configuration, e.g. in a worker process; existing data is
+        # never renewed again
+        return dict(
+            cache_dir=cls._CACHE_DIR,
+            ignore_version=cls._IGNORE_VERSION,
+            use_requests_cache=cls._requests_session_cached is not None,
+            columnar_telemetry=cls._COLUMNAR_TELEMETRY,
+            max_size=cls._MAX_SIZE,
+            compression=cls._COMPRESSION,
+            compression_level=cls._COMPRESSION_LEVEL,
+            raw_store=cls._raw_store is not None,
+            backend=cls._backend
+        )
 
     @classmethod
     def requests_get(cls, *args, **kwargs):
@@ -266,9 +535,12 @@ class Cache:
         caching.
         """
         cls._enable_default_cache()
+        t_start = time.perf_counter()
         if (cls._requests_session_cached is None) or cls._tmp_disabled:
             cls._request_counter += 1
-            return cls._requests_session.get(*args, **kwargs)
+            return cls._record_response(
+                cls._requests_session.get(*args, **kwargs), t_start
+            )
 
         if cls._ci_mode:
             # try to return a cached response first
@@ -276,10 +548,12 @@ class Cache:
                 *args, only_if_cached=True, **kwargs)
             # 504 indicates that no cached response was found
             if resp.status_code != 504:
-                return resp
+                return cls._record_response(resp, t_start)
 
         cls._request_counter += 1
-        return cls._requests_session_cached.get(*args, **kwargs)
+        return cls._record_response(
+            cls._requests_session_cached.get(*args, **kwargs), t_start
+        )
 
     @classmethod
     def requests_post(cls, *args, **kwargs):
@@ -291,9 +565,12 @@ class Cache:
         caching.
         """
         cls._enable_default_cache()
+        t_start = time.perf_counter()
         if (cls._requests_session_cached is None) or cls._tmp_disabled:
             cls._request_counter += 1
-            return cls._requests_session.post(*args, **kwargs)
+            return cls._record_response(
+                cls._requests_session.post(*args, **kwargs), t_start
+            )
 
         if cls._ci_mode:
             # try to return a cached response first
@@ -301,10 +578,211 @@ class Cache:
                 *args, only_if_cached=True, **kwargs)
             # 504 indicates that no cached response was found
             if resp.status_code != 504:
-                return resp
+                return cls._record_response(resp, t_start)
 
         cls._request_counter += 1
-        return cls._requests_session_cached.post(*args, **kwargs)
+        return cls._record_response(
+            cls._requests_session_cached.post(*args, **kwargs), t_start
+        )
+
+    @classmethod
+    def requests_get_stream(cls, url, **kwargs) -> Optional[Iterator[bytes]]:
+        """Perform a GET request and return the response body in chunks.
+
+        If the raw store is enabled (see :func:`enable_cache`), the response
+        is served from and stored in the raw store instead of the requests
+        cache. Stored responses are revalidated when they expire. Downloaded
+        responses are read from the network in chunks and are stored while
+        they are read, so that the complete body is never held in memory.
+        Otherwise, this is equivalent to :func:`requests_get`.
+
+        Returns:
+            An iterator over chunks of the response body or ``None`` if the
+            request was not successful.
+        """
+        return cls._get_stream(url, **kwargs)[1]
+
+    @classmethod
+    def _get_stream(cls, url, **kwargs) \
+            -> Tuple[int, Optional[Iterator[bytes]]]:
+        # implementation of requests_get_stream, additionally returns the
+        # status code (200 if the response is served from a cache)
+        cls._enable_default_cache()
+        store = cls._raw_store
+        if (store is None) or cls._tmp_disabled:
+            if (cls._backend is not None) and not cls._tmp_disabled \
+                    and not cls._has_cached_response(url):
+                content = cls._fetch_response_from_backend(url)
+                if content is not None:
+                    return 200, iter((content, ))
+            r = cls.requests_get(url, **kwargs)
+            if r.status_code != 200:
+                return r.status_code, None
+            if not getattr(r, 'from_cache', False):
+                cls._push_response_to_backend(url, r.content)
+            return 200, iter((r.content, ))
+
+        t_start = time.perf_counter()
+        offline = (cls._requests_session_cached is not None) \
+            and cls._requests_session_cached.settings.only_if_cached
+        entry = store.lookup(url)
+        if (entry is not None) and (
+                cls._ci_mode or offline
+                or (time.time() - entry.stored_at
+                    < cls._get_expire_after(url).total_seconds())):
+            return 200, cls._stream_stored(entry, t_start)
+        if entry is None:
+            content = cls._fetch_response_from_backend(url)
+            if content is not None:
+                store.put(url, content)
+                return 200, iter((content, ))
+        if offline:
+            # like requests-cache for uncached responses in offline mode
+            return 504, None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            # conditional request, the stored body is reused if unchanged
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        cls._request_counter += 1
+        try:
+            r = cls._requests_session.get(url, headers=headers, stream=True,
+                                          **kwargs)
+        except requests.RequestException:
+            if entry is None:
+                raise
+            _logger.warning(f"Request failed, using stale data for {url}")
+            return 200, cls._stream_stored(entry, t_start)
+
+        if r.status_code != 200:
+            r.close()
+            if (r.status_code == 304) and (entry is not None):
+                store.touch(url)
+                return 200, cls._stream_stored(entry, t_start)
+            if (entry is not None) and (r.status_code >= 500):
+                _logger.warning(f"Request failed, using stale data for "
+                                f"{url}")
+                return 200, cls._stream_stored(entry, t_start)
+            return r.status_code, None
+
+        return 200, cls._stream_response(url, r, t_start)
+
+    @classmethod
+    def _stream_response(cls, url, response, t_start):
+        # Read the body of a response in chunks and store it in the raw store
+        # at the same time. It is only stored if it was read completely.
+        writer = cls._raw_store.writer(
+            url, etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        # the backend only accepts complete bodies
+        chunks = list() if (cls._backend is not None) \
+            and not cls._backend.read_only else None
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                writer.write(chunk)
+                size += len(chunk)
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+            writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            response.close()
+
+        cls._stats.record('requests', misses=1, bytes_written=size,
+                          read_time=time.perf_counter() - t_start)
+        if chunks is not None:
+            cls._push_response_to_backend(url, b''.join(chunks))
+
+    @classmethod
+    def _stream_stored(cls, entry, t_start):
+        # the time for reading the body is not included, it is read lazily
+        cls._stats.record('requests', hits=1, bytes_read=entry.size,
+                          read_time=time.perf_counter() - t_start)
+        return cls._raw_store.iter_content(entry)
+
+    @classmethod
+    def _record_response(cls, response, t_start):
+        # count a response towards the statistics and return it
+        if getattr(response, 'from_cache', False):
+            cls._stats.record('requests', hits=1,
+                              bytes_read=len(response.content),
+                              read_time=time.perf_counter() - t_start)
+        else:
+            cls._stats.record('requests', misses=1,
+                              bytes_written=len(response.content),
+                              read_time=time.perf_counter() - t_start)
+        return response
+
+    @classmethod
+    def _has_cached_response(cls, url):
+        return (cls._requests_session_cached is not None) \
+            and cls._requests_session_cached.cache.contains(url=url)
+
+    @classmethod
+    def _has_fresh_response(cls, url):
+        # Check whether a response is cached and would be used without
+        # revalidating it, like in `requests_get` and `requests_get_stream`.
+        if cls._raw_store is not None:
+            entry = cls._raw_store.lookup(url)
+            if entry is not None:
+                return cls._ci_mode or (
+                    time.time() - entry.stored_at
+                    < cls._get_expire_after(url).total_seconds()
+                )
+        if cls._requests_session_cached is None:
+            return False
+        cache = cls._requests_session_cached.cache
+        response = cache.get_response(
+            cache.create_key(requests.Request('GET', url))
+        )
+        return (response is not None) \
+            and (cls._ci_mode or not response.is_expired)
+
+    @classmethod
+    def _call_backend(cls, method, key, *args):
+        # the backend is optional, errors are logged and the data is then
+        # downloaded or parsed locally instead
+        try:
+            return getattr(cls._backend, method)(key, *args)
+        except Exception as exc:
+            _logger.warning(f"Cache backend {cls._backend!r} failed "
+                            f"({method} '{key}'): {exc!r}")
+            return None
+
+    @staticmethod
+    def _get_response_key(url):
+        return 'raw/' + hashlib.sha256(url.encode()).hexdigest()
+
+    @classmethod
+    def _fetch_response_from_backend(cls, url):
+        if cls._backend is None:
+            return None
+        t_start = time.perf_counter()
+        content = cls._call_backend('get', cls._get_response_key(url))
+        if content is None:
+            cls._stats.record('remote', misses=1)
+        else:
+            cls._stats.record('remote', hits=1, bytes_read=len(content),
+                              read_time=time.perf_counter() - t_start)
+        return content
+
+    @classmethod
+    def _push_response_to_backend(cls, url, content):
+        if (cls._backend is None) or cls._backend.read_only:
+            return
+        t_start = time.perf_counter()
+        cls._call_backend('put', cls._get_response_key(url), content)
+        cls._stats.record('remote', bytes_written=len(content),
+                          write_time=time.perf_counter() - t_start)
 
     @classmethod
     def delete_response(cls, url):
@@ -312,6 +790,34 @@ class Cache:
         enabled. If caching is not enabled, this call is ignored."""
         if cls._requests_session_cached is not None:
             cls._requests_session_cached.cache.delete(urls=[url])
+        if cls._raw_store is not None:
+            cls._raw_store.delete([url])
+
+    @classmethod
+    def _get_expiration_patterns(cls):
+        # Glob patterns for the URLs of season specific data and the time
+        # after which cached responses are revalidated. The first matching
+        # pattern applies. Responses with an ETag or Last-Modified header are
+        # revalidated with a conditional request, so that the body is only
+        # downloaded again if it has changed.
+        year = datetime.datetime.now().year
+        current = (f'*/static/{year}/', f'*/schedule_{year}.json',
+                   f'*/api/f1/{year}', '*/api/f1/current')
+        historical = ('*/static/19', '*/static/20', '*/schedule_*.json',
+                      '*/api/f1/19', '*/api/f1/20')
+        patterns = {pattern: cls._EXPIRE_AFTER for pattern in current}
+        patterns.update({pattern: cls._EXPIRE_AFTER_HISTORICAL
+                         for pattern in historical})
+        return patterns
+
+    @classmethod
+    def _get_expire_after(cls, url):
+        # same matching as in requests-cache
+        url = url.split('://')[-1]
+        for pattern, expire_after in cls._get_expiration_patterns().items():
+            if fnmatch.fnmatch(url, pattern.rstrip('*') + '**'):
+                return expire_after
+        return cls._EXPIRE_AFTER
 
     @staticmethod
     def _custom_cache_filter(response: requests.Response):
@@ -361,62 +867,120 @@ class Cache:
             raise NotADirectoryError("Cache directory does not exist!")
 
         for dirpath, dirnames, filenames in os.walk(cache_dir):
+            if cls._RAW_STORE_DIR in dirnames:
+                # raw responses are only removed when clearing deep
+                dirnames.remove(cls._RAW_STORE_DIR)
             for filename in filenames:
-                if filename.endswith('.ff1pkl'):
+                if filename.endswith(('.ff1pkl', '.ff1lock', '.ff1tmp')):
                     os.remove(os.path.join(dirpath, filename))
+            for dirname in list(dirnames):
+                if dirname.endswith((columnar.COLUMNAR_SUFFIX, '.ff1tmp')):
+                    columnar.remove_columnar(os.path.join(dirpath, dirname))
+                    dirnames.remove(dirname)
+
+        if os.path.exists(os.path.join(cache_dir, INDEX_FILE_NAME)):
+            CacheIndex(cache_dir).clear()
+
+        if cls._memory_cache is not None:
+            cls._memory_cache.clear()
 
         if deep:
             cache_db_path = os.path.join(cache_dir, 'fastf1_http_cache.sqlite')
             if os.path.exists(cache_db_path):
                 os.remove(cache_db_path)
+            shutil.rmtree(os.path.join(cache_dir, cls._RAW_STORE_DIR),
+                          ignore_errors=True)
 
     @classmethod
-    def api_request_wrapper(cls, func):
+    def api_request_wrapper(cls, func=None, *, parser_version: int = 1):
         """Wrapper function for adding stage 2 caching to api functions.
 
+        Can be used as a decorator with or without arguments::
+
+            @Cache.api_request_wrapper(parser_version=2)
+            def car_data(path, response=None, livedata=None):
+                ...
+
+        Cached data is only used if it was created with the same parser
+        version. The parser version of a function needs to be increased
+        whenever a change of the function modifies the data it returns, so
+        that only the cached data of this function is created again. Cached
+        data that was created before parser versions were introduced has
+        parser version 1.
+
+        If the wrapped function accepts a ``drivers`` keyword argument, its
+        data is always parsed and cached for all drivers. Only the data for
+        the requested drivers is then read from the cache and returned.
+
         Args:
             func: function to be wrapped
+            parser_version: version of the parser code of this function
 
         Returns:
             The wrapped function
         """
+        if func is None:
+            return functools.partial(cls.api_request_wrapper,
+                                     parser_version=parser_version)
 
         @functools.wraps(func)
         def _cached_api_request(api_path, **func_kwargs):
+            # all statistics are attributed to this function, including
+            # those of requests that are made by it
+            with cls._stats.function(func.__name__):
+                return _load(api_path, **func_kwargs)
+
+        def _load(api_path, **func_kwargs):
             if cls._CACHE_DIR and not cls._tmp_disabled:
                 # caching is enabled
                 func_name = str(func.__name__)
+                drivers = func_kwargs.pop('drivers', None)
+
+                memory_key = None
+                if (cls._memory_cache is not None) and not cls._ci_mode:
+                    # the in-memory cache is checked before any disk access
+                    memory_key = (api_path, func_name,
+                                  None if drivers is None else tuple(drivers))
+                    data = cls._memory_cache.get(memory_key)
+                    if data is not None:
+                        cls._stats.record('memory', hits=1)
+                        _logger.info(f"Using cached data for {func_name} "
+                                     f"(memory)")
+                        return data
+                    cls._stats.record('memory', misses=1)
+
                 cache_file_path = cls._get_cache_file_path(api_path, func_name)
 
-                if os.path.isfile(cache_file_path):
+                if cls._cache_entry_exists(cache_file_path):
                     if cls._ci_mode:
                         # skip pickle cache in ci mode so that API parser code
                         # is always executed. Only http cache is active
-                        return func(api_path, **func_kwargs)
+                        return cls._select_drivers(
+                            cls._parse(func, api_path, func_kwargs), drivers
+                        )
 
                     # file exists already, try to load it
-                    try:
-                        cached = pickle.load(open(cache_file_path, 'rb'))
-                    except:  # noqa: E722 (bare except)
-                        # don't like the bare exception clause but who knows
-                        # which dependency will raise which internal exception
-                        # after it was updated
-                        cached = None
-
-                    if (cached is not None) and cls._data_ok_for_use(cached):
+                    cached = cls._read_cache(cache_file_path, drivers=drivers)
+
+                    if (cached is not None) \
+                            and cls._data_ok_for_use(cached, parser_version):
                         # cached data is ok for use, return it
+                        cls._stats.record('parsed', hits=1)
                         _logger.info(f"Using cached data for {func_name}")
-                        return cached['data']
+                        return cls._remember(memory_key, cached['data'])
 
                     else:
+                        cls._stats.record('parsed', misses=1, stale=1)
                         # cached data needs to be downloaded again and updated
                         _logger.info(f"Updating cache for {func_name}...")
-                        data = func(api_path, **func_kwargs)
+                        data = cls._update_cache(
+                            func, api_path, func_kwargs, cache_file_path,
+                            drivers, parser_version
+                        )
 
                         if data is not None:
-                            cls._write_cache(data, cache_file_path)
                             _logger.info("Cache updated!")
-                            return data
+                            return cls._remember(memory_key, data)
 
                         _logger.critical(
                             "A cache update is required but the data failed "
@@ -428,13 +992,16 @@ class Cache:
                         exit()
 
                 else:  # cached data does not yet exist for this api request
+                    cls._stats.record('parsed', misses=1)
                     _logger.info(f"No cached data found for {func_name}. "
                                  f"Loading data...")
-                    data = func(api_path, **func_kwargs)
+                    data = cls._update_cache(
+                        func, api_path, func_kwargs, cache_file_path, drivers,
+                        parser_version
+                    )
                     if data is not None:
-                        cls._write_cache(data, cache_file_path)
                         _logger.info("Data has been written to cache!")
-                        return data
+                        return cls._remember(memory_key, data)
 
                     _logger.critical("Failed to load data!")
                     exit()
@@ -442,8 +1009,11 @@ class Cache:
             else:  # cache was not enabled
                 if not cls._tmp_disabled:
                     cls._enable_default_cache()
-                return func(api_path, **func_kwargs)
+                return cls._parse(func, api_path, func_kwargs)
 
+        # used for checking cached data without loading it, see
+        # `_cache_entry_ok_for_use`
+        _cached_api_request.parser_version = parser_version
         return _cached_api_request
 
     @classmethod
@@ -451,33 +1021,424 @@ class Cache:
         # extend the cache dir path using the api path and a file name
         # leading '/static/' is dropped form api path
         cache_dir_path = os.path.join(cls._CACHE_DIR, api_path[8:])
-        if not os.path.exists(cache_dir_path):
-            # create subfolders if they don't yet exist
-            os.makedirs(cache_dir_path)
+        # create subfolders if they don't yet exist; other processes may do
+        # the same concurrently
+        os.makedirs(cache_dir_path, exist_ok=True)
 
         file_name = name + '.ff1pkl'
         cache_file_path = os.path.join(cache_dir_path, file_name)
         return cache_file_path
 
     @classmethod
-    def _data_ok_for_use(cls, cached):
+    def _cache_entry_exists(cls, cache_file_path):
+        return (os.path.isfile(cache_file_path)
+                or os.path.isdir(cls._get_columnar_path(cache_file_path)))
+
+    @staticmethod
+    def _get_columnar_path(cache_file_path):
+        return os.path.splitext(cache_file_path)[0] + columnar.COLUMNAR_SUFFIX
+
+    @classmethod
+    def _read_cache(cls, cache_file_path, drivers=None):
+        # load a cache entry, partitioned data is preferred if it exists;
+        # only the partitions for the given drivers are read from it
+        t_start = time.perf_counter()
+        try:
+            columnar_path = cls._get_columnar_path(cache_file_path)
+            if os.path.isdir(columnar_path):
+                meta = columnar.read_columnar_meta(columnar_path)
+                if meta is not None:
+                    data = columnar.read_columnar(columnar_path, meta=meta,
+                                                  keys=drivers)
+                    cls._stats.record(
+                        'parsed', read_time=time.perf_counter() - t_start,
+                        bytes_read=columnar.get_size(columnar_path, meta,
+                                                     keys=drivers)
+                    )
+                    cls._record_access(columnar_path)
+                    return {'version': meta['version'],
+                            'parser_version': meta.get('parser_version', 1),
+                            'data': data}
+            with open(cache_file_path, 'rb') as cache_file_obj:
+                cached = compression.load(cache_file_obj)
+                size = cache_file_obj.tell()
+            cls._stats.record('parsed', bytes_read=size,
+                              read_time=time.perf_counter() - t_start)
+            cls._record_access(cache_file_path)
+            cached['data'] = cls._select_drivers(cached['data'], drivers)
+            return cached
+        except:  # noqa: E722 (bare except)
+            # don't like the bare exception clause but who knows
+            # which dependency will raise which internal exception
+            # after it was updated
+            return None
+
+    @staticmethod
+    def _select_drivers(data, drivers):
+        # reduce per-driver data to the requested drivers
+        if (drivers is None) or not isinstance(data, dict):
+            return data
+        return {drv: data[drv] for drv in drivers if drv in data}
+
+    @classmethod
+    def _data_ok_for_use(cls, cached, parser_version=1):
         # check if cached data is ok or needs to be downloaded again
         if cls._FORCE_RENEW:
             return False
         elif cls._IGNORE_VERSION:
             return True
-        elif cached['version'] == cls._API_CORE_VERSION:
+        elif (cached['version'] == cls._API_CORE_VERSION) \
+                and (cached.get('parser_version', 1) == parser_version):
             return True
         return False
 
+    @classmethod
+    def _cache_entry_ok_for_use(cls, api_path, func):
+        # Check whether the cached data of an api function (wrapped by
+        # `api_request_wrapper`) would be used as it is, instead of being
+        # parsed again. Only the metadata of partitioned data is read.
+        cache_file_path = cls._get_cache_file_path(api_path, func.__name__)
+        if cls._ci_mode or not cls._cache_entry_exists(cache_file_path):
+            return False
+        cached = cls._read_cache(cache_file_path, drivers=[])
+        return (cached is not None) \
+            and cls._data_ok_for_use(cached, func.parser_version)
+
+    @classmethod
+    def _remember(cls, memory_key, data):
+        # add data to the in-memory cache (if enabled) and return it
+        if (memory_key is not None) and (cls._memory_cache is not None):
+            cls._memory_cache.put(memory_key, data)
+        return data
+
+    @classmethod
+    def _update_cache(cls, func, api_path, func_kwargs, cache_file_path,
+                      drivers, parser_version):
+        # Parse and cache data while holding the lock for this cache entry.
+        # If the same data is requested concurrently by multiple processes,
+        # only one of them parses it. The others wait for the lock and then
+        # read the data from the cache.
+        lock = FileLock(os.path.splitext(cache_file_path)[0] + '.ff1lock')
+        try:
+            lock.acquire()
+        except OSError as exc:
+            # locking is not possible, continue without the lock
+            _logger.debug("Failed to lock cache entry", exc_info=exc)
+
+        try:
+            if cls._cache_entry_exists(cache_file_path):
+                cached = cls._read_cache(cache_file_path, drivers=drivers)
+                if (cached is not None) \
+                        and cls._data_ok_for_use(cached, parser_version):
+                    # written by another process in the meantime
+                    return cached['data']
+
+            if cls._fetch_entry_from_backend(cache_file_path):
+                cached = cls._read_cache(cache_file_path, drivers=drivers)
+                if (cached is not None) \
+                        and cls._data_ok_for_use(cached, parser_version):
+                    return cached['data']
+
+            data = cls._parse(func, api_path, func_kwargs)
+            if data is not None:
+                cls._write_cache(data, cache_file_path,
+                                 parser_version=parser_version)
+                cls._push_entry_to_backend(cache_file_path)
+            return cls._select_drivers(data, drivers)
+        finally:
+            lock.release()
+
     @classmethod
     def _write_cache(cls, data, cache_file_path, **kwargs):
+        # Data is written to a temporary file or directory first which is
+        # then renamed, so that incomplete entries are never visible.
+        t_start = time.perf_counter()
+        columnar_path = cls._get_columnar_path(cache_file_path)
+        # remove outdated data first, so that a stale entry in the other
+        # format can not be used in place of this one
+        columnar.remove_columnar(columnar_path)
+        if os.path.isfile(cache_file_path):
+            os.remove(cache_file_path)
+
+        if cls._COLUMNAR_TELEMETRY and columnar.is_columnar_compatible(data):
+            # per-driver data is partitioned by driver
+            tmp_path = cls._get_temp_path(columnar_path)
+            try:
+                columnar.write_columnar(
+                    data, tmp_path,
+                    compression_codec=cls._COMPRESSION,
+                    compression_level=cls._COMPRESSION_LEVEL,
+                    version=cls._API_CORE_VERSION, **kwargs
+                )
+                os.replace(tmp_path, columnar_path)
+            finally:
+                columnar.remove_columnar(tmp_path)
+            cls._stats.record('parsed', bytes_written=cls._get_size(
+                columnar_path), write_time=time.perf_counter() - t_start)
+            cls._record_write(columnar_path, kwargs.get('parser_version'))
+            return
+
         new_cached = dict(
             **{'version': cls._API_CORE_VERSION, 'data': data},
             **kwargs
         )
-        with open(cache_file_path, 'wb') as cache_file_obj:
-            pickle.dump(new_cached, cache_file_obj)
+        tmp_path = cls._get_temp_path(cache_file_path)
+        try:
+            with open(tmp_path, 'wb') as cache_file_obj:
+                compression.dump(new_cached, cache_file_obj,
+                                 cls._COMPRESSION, cls._COMPRESSION_LEVEL)
+                size = cache_file_obj.tell()
+            os.replace(tmp_path, cache_file_path)
+        finally:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+        cls._stats.record('parsed', bytes_written=size,
+                          write_time=time.perf_counter() - t_start)
+        cls._record_write(cache_file_path, kwargs.get('parser_version'))
+
+    @classmethod
+    def _parse(cls, func, api_path, func_kwargs):
+        # call an api function and count it towards the statistics
+        t_start = time.perf_counter()
+        try:
+            return func(api_path, **func_kwargs)
+        finally:
+            cls._stats.record('parser', parse_calls=1,
+                              parse_time=time.perf_counter() - t_start)
+
+    @classmethod
+    def _get_entry_keys(cls, cache_file_path):
+        # backend keys of the pickled and the columnar format of an entry
+        rel_path = os.path.relpath(cache_file_path, cls._CACHE_DIR)
+        key = 'parsed/' + '/'.join(rel_path.split(os.sep))
+        return key, os.path.splitext(key)[0] + columnar.COLUMNAR_SUFFIX \
+            + '.tar'
+
+    @classmethod
+    def _fetch_entry_from_backend(cls, cache_file_path):
+        # copy a stage 2 entry from the backend into the cache directory,
+        # replacing the local entry; returns True if the entry was found
+        if cls._backend is None:
+            return False
+        t_start = time.perf_counter()
+        pickle_key, columnar_key = cls._get_entry_keys(cache_file_path)
+        columnar_path = cls._get_columnar_path(cache_file_path)
+        for key, path in ((columnar_key, columnar_path),
+                          (pickle_key, cache_file_path)):
+            content = cls._call_backend('get', key)
+            if content is None:
+                continue
+
+            columnar.remove_columnar(columnar_path)
+            if os.path.isfile(cache_file_path):
+                os.remove(cache_file_path)
+            tmp_path = cls._get_temp_path(path)
+            try:
+                if path == columnar_path:
+                    columnar.unpack_columnar(content, tmp_path)
+                else:
+                    with open(tmp_path, 'wb') as fobj:
+                        fobj.write(content)
+                os.replace(tmp_path, path)
+            except (OSError, ValueError, tarfile.TarError) as exc:
+                _logger.warning(f"Invalid cache entry '{key}' in backend: "
+                                f"{exc!r}")
+                return False
+            finally:
+                columnar.remove_columnar(tmp_path)
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
+
+            cls._stats.record('remote', hits=1, bytes_read=len(content),
+                              read_time=time.perf_counter() - t_start)
+            cls._record_write(path)
+            return True
+
+        cls._stats.record('remote', misses=1)
+        return False
+
+    @classmethod
+    def _push_entry_to_backend(cls, cache_file_path):
+        # add a stage 2 entry to the backend after it was written locally
+        if (cls._backend is None) or cls._backend.read_only:
+            return
+        t_start = time.perf_counter()
+        pickle_key, columnar_key = cls._get_entry_keys(cache_file_path)
+        columnar_path = cls._get_columnar_path(cache_file_path)
+        try:
+            if os.path.isdir(columnar_path):
+                key, outdated_key = columnar_key, pickle_key
+                content = columnar.pack_columnar(columnar_path)
+            else:
+                key, outdated_key = pickle_key, columnar_key
+                with open(cache_file_path, 'rb') as fobj:
+                    content = fobj.read()
+        except OSError as exc:
+            _logger.debug("Failed to read cache entry", exc_info=exc)
+            return
+        cls._call_backend('put', key, content)
+        # an outdated entry in the other format would take precedence
+        cls._call_backend('delete', outdated_key)
+        cls._stats.record('remote', bytes_written=len(content),
+                          write_time=time.perf_counter() - t_start)
+
+    @staticmethod
+    def _get_temp_path(path):
+        # unique per process and thread
+        return f"{path}.{os.getpid()}-{threading.get_ident()}.ff1tmp"
+
+    @classmethod
+    def _record_write(cls, path, parser_version=None):
+        if cls._index is None:
+            return
+        try:
+            cls._index.record_write(path, parser_version=parser_version)
+        except Exception as exc:
+            # the index is not critical, caching works without it
+            _logger.debug("Failed to update cache index", exc_info=exc)
+            return
+        cls._start_maintenance()
+
+    @classmethod
+    def _record_access(cls, path):
+        # accesses are collected and written to the index in batches by the
+        # maintenance thread
+        if cls._index is None:
+            return
+        with cls._maintenance_lock:
+            cls._pending_accesses[path] = time.time()
+            cls._ensure_maintenance_thread()
+
+    @classmethod
+    def _start_maintenance(cls, rebuild_index=False):
+        # request indexing and eviction from the maintenance thread
+        with cls._maintenance_lock:
+            if rebuild_index:
+                cls._maintenance_tasks.add('rebuild')
+            cls._maintenance_tasks.add('evict')
+            cls._ensure_maintenance_thread()
+        cls._maintenance_wakeup.set()
+
+    @classmethod
+    def _ensure_maintenance_thread(cls):
+        # start the maintenance thread if it is not running; it exits once
+        # there is no more work; requires the maintenance lock
+        if cls._maintenance_thread is not None:
+            return
+        cls._maintenance_thread = threading.Thread(
+            target=cls._run_maintenance,
+            name='fastf1-cache-maintenance', daemon=True
+        )
+        cls._maintenance_thread.start()
+
+    @classmethod
+    def _wait_for_maintenance(cls):
+        # block until all pending maintenance work is done
+        with cls._maintenance_lock:
+            thread = cls._maintenance_thread
+        if thread is not None:
+            cls._maintenance_wakeup.set()
+            thread.join()
+
+    @classmethod
+    def _run_maintenance(cls):
+        while True:
+            if not cls._maintenance_tasks:
+                # only accesses are pending, wait for more of them so that
+                # they are written to the index together
+                cls._maintenance_wakeup.wait(cls._ACCESS_FLUSH_DELAY)
+            with cls._maintenance_lock:
+                cls._maintenance_wakeup.clear()
+                tasks, cls._maintenance_tasks = cls._maintenance_tasks, set()
+                accesses = cls._pending_accesses
+                cls._pending_accesses = dict()
+                index = cls._index
+                if (not tasks and not accesses) or (index is None):
+                    cls._maintenance_thread = None
+                    return
+            try:
+                if 'rebuild' in tasks:
+                    index.rebuild(
+                        entry_suffixes=('.ff1pkl', columnar.COLUMNAR_SUFFIX)
+                    )
+                if accesses:
+                    index.record_accesses(accesses)
+                if ('evict' in tasks) and (cls._MAX_SIZE is not None):
+                    cls._evict_lru(cls._MAX_SIZE)
+            except Exception as exc:
+                _logger.warning("Cache maintenance failed!")
+                _logger.debug("Traceback for cache maintenance failure",
+                              exc_info=exc)
+
+    @classmethod
+    def _flush_accesses(cls):
+        # write pending accesses to the index immediately (at exit)
+        with cls._maintenance_lock:
+            accesses = cls._pending_accesses
+            cls._pending_accesses = dict()
+            index = cls._index
+        if accesses and (index is not None):
+            try:
+                index.record_accesses(accesses)
+            except Exception as exc:
+                _logger.debug("Failed to update cache index", exc_info=exc)
+
+    @classmethod
+    def _evict_lru(cls, max_size):
+        # remove the least recently used sessions until the size of the
+        # cache is below the limit; the most recently used session is never
+        # removed, as it is likely still in use
+        total = cls._index.total_size()
+        if total <= max_size:
+            return
+        sessions = cls._index.sessions_by_last_access()
+        for session, size, _ in sessions[:-1]:
+            if total <= max_size:
+                break
+            cls._remove_session(session)
+            total -= size
+            _logger.info(f"Removed session '{session}' from cache "
+                         f"({cls._convert_size(size)})")
+
+    @classmethod
+    def _remove_session(cls, session):
+        for path in cls._index.session_entries(session):
+            if os.path.isdir(path):
+                columnar.remove_columnar(path)
+            elif os.path.isfile(path):
+                os.remove(path)
+        cls._index.remove_session(session)
+
+        session_dir = os.path.join(cls._CACHE_DIR, *session.split('/'))
+        try:
+            for entry in os.scandir(session_dir):
+                if entry.name.endswith('.ff1lock'):
+                    os.remove(entry.path)
+            os.rmdir(session_dir)
+        except OSError:
+            pass  # not empty or already removed
+
+        # remove the raw responses of this session from the requests cache
+        # and from the raw store
+        from fastf1._api import base_url, pages
+        urls = [f"{base_url}/static/{session}/{page}"
+                for page in pages.values()]
+        if cls._requests_session_cached is not None:
+            cls._requests_session_cached.cache.delete(urls=urls)
+        if cls._raw_store is not None:
+            cls._raw_store.delete(urls)
+            cls._raw_store.gc()
+
+    @staticmethod
+    def _parse_size(size):
+        # convert a size given as string, e.g. '10 GB', to bytes
+        if (size is None) or isinstance(size, int):
+            return size
+        match = re.match(r"^\s*([\d.]+)\s*([KMGT]?)I?B?\s*$", size.upper())
+        if not match:
+            raise ValueError(f"Invalid cache size '{size}'")
+        exponent = ' KMGT'.index(match.group(2) or ' ')
+        return int(float(match.group(1)) * 1024 ** exponent)
 
     @classmethod
     def get_default_cache_path(cls):
@@ -619,6 +1580,234 @@ class Cache:
         """
         cls._ci_mode = enabled
 
+    @classmethod
+    def set_connection_pool(cls, max_hosts: int = 10,
+                            max_per_host: int = 10, block: bool = False):
+        """Configure the pool of persistent HTTP connections.
+
+        Connections are kept open and reused for subsequent requests to the
+        same host. The pool is shared by all requests that FastF1 makes to
+        the F1 live timing API, Ergast and MultiViewer, with or without
+        caching. Existing connections are closed when the pool is configured.
+
+        Args:
+            max_hosts: Maximum number of hosts for which connections are
+                kept open.
+            max_per_host: Maximum number of connections that are kept open
+                for each host. This limits the number of idle connections,
+                not the number of concurrent requests, unless ``block`` is
+                set.
+            block: Wait for a free connection if ``max_per_host``
+                connections to a host are in use already, instead of opening
+                an additional connection that is closed after the request.
+        """
+        old_pool = _SessionWithRateLimiting._connection_pool
+        _SessionWithRateLimiting._connection_pool \
+            = requests.adapters.HTTPAdapter(pool_connections=max_hosts,
+                                            pool_maxsize=max_per_host,
+                                            pool_block=block)
+        cls._requests_session.use_connection_pool()
+        if cls._requests_session_cached is not None:
+            cls._requests_session_cached.use_connection_pool()
+        old_pool.close()
+
+    @classmethod
+    def set_retry_policy(cls, max_retries: int = 3, backoff: float = 0.5,
+                         max_backoff: float = 30.0,
+                         timeout: Optional[float] = 30.0,
+                         total_timeout: Optional[float] = 120.0):
+        """Configure how failed requests are retried.
+
+        Requests that fail because of a connection error or a timeout, or
+        because the server responds with status code 429, 500, 502, 503 or
+        504 are retried. Before each retry, a random time between zero and
+        ``backoff * 2 ** n`` seconds is waited, where ``n`` is the number of
+        the failed attempt (starting at zero). Retries count towards the
+        rate limits like any other request. Only GET, HEAD and OPTIONS
+        requests are retried, because other requests may not be repeated
+        safely.
+
+        The latency and the errors of all attempts are recorded for each
+        server, see :attr:`~fastf1.internals.cache_stats.CacheStats.endpoints`
+        in :func:`stats`.
+
+        Args:
+            max_retries: Maximum number of retries for each request; set to
+                zero to disable retries.
+            backoff: Initial upper bound for the wait time in seconds.
+            max_backoff: Maximum wait time between two attempts in seconds.
+            timeout: Timeout in seconds for connecting to the server and
+                for receiving data during each attempt, ``None`` to wait
+                indefinitely.
+            total_timeout: Time budget in seconds for all attempts of a
+                request. The timeout of each attempt is reduced to the
+                remaining budget and no retry is made if the budget would
+                be exceeded. ``None`` for an unlimited budget.
+        """
+        _SessionWithRateLimiting._retry_policy = _RetryPolicy(
+            max_retries=max_retries, backoff=backoff, max_backoff=max_backoff,
+            timeout=timeout, total_timeout=total_timeout
+        )
+
+    @classmethod
+    def enable_memory_cache(cls, max_items: int = 64,
+                            max_size: Optional[Union[int, str]] = '2 GB'):
+        """Enable an additional in-memory cache for parsed API data.
+
+        The in-memory cache is checked before the stage 2 cache. Recently
+        loaded data is then available without reading or unpickling any
+        files, which is useful for long-running processes that load the same
+        sessions repeatedly. The least recently used data is removed when
+        one of the limits is exceeded.
+
+        The in-memory cache is only used while caching is enabled. Data is
+        copied when it is returned from the in-memory cache, so that it can
+        safely be modified. Only containers and arrays are copied, which
+        takes about half as long as unpickling the same data from an
+        in-memory buffer (without any disk access or decompression).
+
+        Args:
+            max_items: Maximum number of cached API responses (each
+                session consists of about ten responses).
+            max_size: Maximum estimated size of all cached data, either in
+                bytes or as a string like ``'2 GB'``. Unlimited if ``None``.
+        """
+        cls._memory_cache = MemoryCache(max_items=max_items,
+                                        max_size=cls._parse_size(max_size))
+
+    @classmethod
+    def disable_memory_cache(cls):
+        """Disable the in-memory cache and discard all data in it."""
+        cls._memory_cache = None
+
+    @classmethod
+    def memory_cache_info(cls) -> Optional[MemoryCacheInfo]:
+        """Return statistics for the in-memory cache.
+
+        Returns:
+            A named tuple with the number of ``hits`` and ``misses``, the
+            current number of ``items`` and their ``size`` in bytes and the
+            configured limits ``max_items`` and ``max_size``. ``None`` if the
+            in-memory cache is not enabled.
+        """
+        if cls._memory_cache is None:
+            return None
+        return cls._memory_cache.info()
+
+    @classmethod
+    def stats(cls) -> CacheStats:
+        """Return statistics about the use of the cache since the start of
+        the program (or since :func:`reset_stats` was called).
+
+        The statistics include the hits and misses of each stage of the
+        cache, the number of bytes that were read and written and the time
+        spent on requests, on reading and writing parsed data and on
+        parsing. They are available in total and for each API function.
+
+        Returns:
+            A :class:`~fastf1.internals.cache_stats.CacheStats` object.
+            Use its ``to_dict()`` method to export the statistics, e.g. to a
+            metrics system.
+        """
+        return cls._stats.total()
+
+    @classmethod
+    def reset_stats(cls):
+        """Reset the statistics that are returned by :func:`stats`."""
+        cls._stats.reset()
+
+    @classmethod
+    def collect_stats(cls) -> ContextManager[CacheStats]:
+        """Collect statistics about the use of the cache while the context
+        is active, for example for loading a single session::
+
+            with fastf1.Cache.collect_stats() as stats:
+                session.load()
+            print(stats.parsed.hit_rate, stats.parse_time)
+
+        The collected statistics include all threads. See :func:`stats` for
+        the available statistics.
+        """
+        return cls._stats.collect()
+
+    @classmethod
+    def gc_raw_store(cls, max_age: Optional[datetime.timedelta] = None):
+        """Remove response bodies from the raw store that are not used
+        anymore.
+
+        Args:
+            max_age: Additionally remove all responses that were not stored or
+                revalidated within this time. They are downloaded again when
+                they are requested next time.
+        """
+        if cls._raw_store is None:
+            return
+        cls._raw_store.gc(
+            max_age=None if max_age is None else max_age.total_seconds()
+        )
+
+    @classmethod
+    def export_bundle(cls, year: int, path: str, *,
+                      compression: str = 'zlib',
+                      compression_level: Optional[int] = None) \
+            -> 'BundleSummary':
+        """Pack all cached data of one season into a single bundle file.
+
+        The bundle contains the parsed data (stage 2) and the raw responses
+        from the requests cache and the raw store (stage 1) in one
+        compressed and indexed archive. It can be imported into another
+        cache directory with :func:`import_bundle`, for example on a
+        machine without internet access. See :mod:`fastf1.cache.bundle`.
+
+        Args:
+            year: Championship year
+            path: Path of the bundle file. An existing file is replaced.
+            compression: Compression codec of the bundle, ``'zlib'``,
+                ``'zstd'`` or ``'lz4'`` (see ``compression`` in
+                :func:`enable_cache`).
+            compression_level: Compression level for the selected codec.
+
+        Returns:
+            A :class:`~fastf1.cache.bundle.BundleSummary` of the exported
+            data.
+        """
+        from fastf1.cache.bundle import export_bundle
+        cls._enable_default_cache()
+        if cls._CACHE_DIR is None:
+            raise RuntimeError("The cache needs to be enabled for using "
+                               "bundles")
+        return export_bundle(year, path, cls._CACHE_DIR, codec=compression,
+                             level=compression_level)
+
+    @classmethod
+    def import_bundle(cls, path: str) -> 'BundleSummary':
+        """Unpack a bundle that was created by :func:`export_bundle` into
+        the cache directory.
+
+        All data in the bundle is verified before it is added to the cache.
+        Existing cached data for the same sessions and requests is
+        replaced.
+
+        Args:
+            path: Path of the bundle file
+
+        Returns:
+            A :class:`~fastf1.cache.bundle.BundleSummary` of the imported
+            data.
+
+        Raises:
+            ValueError: The file is not a valid bundle or it is damaged.
+        """
+        from fastf1.cache.bundle import import_bundle
+        cls._enable_default_cache()
+        if cls._CACHE_DIR is None:
+            raise RuntimeError("The cache needs to be enabled for using "
+                               "bundles")
+        summary = import_bundle(path, cls._CACHE_DIR)
+        if cls._memory_cache is not None:
+            cls._memory_cache.clear()
+        return summary
+
     @classmethod
     def _convert_size(cls, size_bytes):  # https://stackoverflow.com/questions/5194057/better-way-to-convert-file-sizes-in-python # noqa: E501
         if size_bytes == 0:
@@ -642,6 +1831,10 @@ class Cache:
         return total_size
 
 
+# access times that are not yet written to the cache index would be lost
+atexit.register(Cache._flush_accesses)
+
+
 class _NoCacheContext:
     def __enter__(self):
         Cache.set_disabled()
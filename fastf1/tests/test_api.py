@@ -1,6 +1,9 @@
 import pytest
 
+import base64
 import datetime
+import json
+import zlib
 
 import numpy as np
 import pandas as pd
@@ -9,6 +12,161 @@ from fastf1 import Cache
 import fastf1._api
 
 
+def _make_z_record(ts, content):
+    # compress a record like the '.z' pages of the live timing api
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    data = compressor.compress(json.dumps(content).encode())
+    data += compressor.flush()
+    return ts + '"' + base64.b64encode(data).decode() + '"'
+
+
+def test_parallel_telemetry_decoding(monkeypatch):
+    car_records = list()
+    pos_records = list()
+    for i in range(40):
+        ts = f"00:00:{i // 4:02d}.{i % 4 * 250:03d}"
+        utc = f"2020-08-08T09:45:{i // 4:02d}.{i % 4 * 250:03d}Z"
+        car_records.append(_make_z_record(ts, {'Entries': [{
+            'Utc': utc,
+            'Cars': {drv: {'Channels': {'0': 10000 + i, '2': 200 + int(drv),
+                                        '3': 5, '4': 100, '5': 0, '45': 8}}
+                     for drv in ('1', '44') if (drv == '1') or (i > 10)}
+        }]}))
+        pos_records.append(_make_z_record(ts, {'Position': [{
+            'Timestamp': utc,
+            'Entries': {drv: {'Status': 'OnTrack', 'X': i, 'Y': -i, 'Z': 1}
+                        for drv in ('1', '44')}
+        }]}))
+    car_records[5] = car_records[5][:20]  # cannot be decoded
+
+    with Cache.disabled():
+        car_serial = fastf1._api.car_data('api/path', response=car_records)
+        pos_serial = fastf1._api.position_data('api/path',
+                                               response=pos_records)
+        monkeypatch.setattr(fastf1._api, '_MIN_PARALLEL_RECORDS', 10)
+        car_parallel = fastf1._api.car_data('api/path',
+                                            response=iter(car_records),
+                                            workers=3)
+        pos_parallel = fastf1._api.position_data('api/path',
+                                                 response=pos_records,
+                                                 workers=3)
+
+    assert list(car_parallel) == list(car_serial) == ['1', '44']
+    assert len(car_serial['1']) == 39
+    assert (car_serial['1'].dtypes == [
+        'timedelta64[ns]', 'datetime64[ns]', 'int64', 'int64', 'int64',
+        'int64', 'bool', 'int64', 'object']).all()
+    assert (pos_serial['1'].dtypes == [
+        'timedelta64[ns]', 'datetime64[ns]', 'object',
+        'int64', 'int64', 'int64', 'object']).all()
+    for drv in car_serial:
+        pd.testing.assert_frame_equal(car_parallel[drv], car_serial[drv])
+    assert list(pos_parallel) == list(pos_serial)
+    for drv in pos_serial:
+        pd.testing.assert_frame_equal(pos_parallel[drv], pos_serial[drv])
+
+
+def test_telemetry_date_offsets(monkeypatch):
+    # the offsets are determined for all drivers, independent of any
+    # selection of drivers, and the latest offset of both sources is used
+    car_records = list()
+    pos_records = list()
+    for i in range(8):
+        ts = f"00:00:{i:02d}.000"
+        car_records.append(_make_z_record(ts, {'Entries': [{
+            'Utc': f"2020-08-08T09:45:{i:02d}.100Z",
+            'Cars': {drv: {'Channels': {'0': 10000, '2': 200, '3': 5,
+                                        '4': 100, '5': 0, '45': 8}}
+                     for drv in ('1', '44')}
+        }]}))
+        pos_records.append(_make_z_record(ts, {'Position': [{
+            'Timestamp': f"2020-08-08T09:45:{i:02d}.300Z",
+            'Entries': {'44': {'Status': 'OnTrack', 'X': i, 'Y': -i, 'Z': 1}}
+        }]}))
+
+    with Cache.disabled():
+        car = fastf1._api.car_data('api/path', response=car_records)
+        pos = fastf1._api.position_data('api/path', response=pos_records)
+        monkeypatch.setattr(fastf1._api, 'car_data',
+                            lambda *args, **kwargs: car)
+        monkeypatch.setattr(fastf1._api, 'position_data',
+                            lambda *args, **kwargs: pos)
+        offsets = fastf1._api.telemetry_date_offsets('api/path')
+
+    assert offsets == {
+        '1': fastf1._api.latest_date_offset(car['1']),
+        '44': fastf1._api.latest_date_offset(pos['44'])
+    }
+    assert offsets['44'] > offsets['1']
+
+
+def _decode_backend_name(records, is_livedata):
+    from fastf1.internals import json_backend
+    return {json_backend.get_json_backend(): list()}, 0, len(records)
+
+
+def test_parallel_decoding_json_backend(monkeypatch):
+    # without the initializer, spawned workers would use the default backend
+    pytest.importorskip('orjson')
+    import concurrent.futures
+    import functools
+    import multiprocessing
+
+    from fastf1.internals import json_backend
+
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor',
+                        functools.partial(
+                            concurrent.futures.ProcessPoolExecutor,
+                            mp_context=multiprocessing.get_context('spawn')
+                        ))
+    monkeypatch.setattr(fastf1._api, '_MIN_PARALLEL_RECORDS', 1)
+    try:
+        json_backend.set_json_backend('json')
+        data, _, count = fastf1._api._decode_records(
+            _decode_backend_name, ['a', 'b'], False, 2
+        )
+    finally:
+        json_backend.set_json_backend()
+    assert list(data) == ['json']
+    assert count == 2
+
+
+def test_telemetry_decoding_invalid_values(caplog):
+    channels = {'0': 10000, '2': 200, '3': 5, '4': 100, '5': 0, '45': 8}
+    car_records = [
+        _make_z_record("00:00:00.000", {'Entries': [{
+            'Utc': "2020-08-08T09:45:00.000Z",
+            'Cars': {'1': {'Channels': channels},
+                     '44': {'Channels': {**channels, '2': None}}}
+        }]}),
+        _make_z_record("00:00:00.250", {'Entries': [{
+            'Utc': "2020-08-08T09:45:00.250Z",
+            'Cars': {'1': {'Channels': {**channels, '0': 'x'}},
+                     '44': {'Channels': channels}}
+        }]}),
+    ]
+    pos_records = [_make_z_record("00:00:00.000", {'Position': [{
+        'Timestamp': "2020-08-08T09:45:00.000Z",
+        'Entries': {'1': {'Status': 'OnTrack', 'X': 1, 'Y': None, 'Z': 3},
+                    '44': {'Status': 'OnTrack', 'X': 4, 'Y': 5, 'Z': 6}}
+    }]})]
+
+    with Cache.disabled():
+        car = fastf1._api.car_data('api/path', response=car_records)
+        pos = fastf1._api.position_data('api/path', response=pos_records)
+    assert "failed to decode" not in caplog.text
+
+    # an invalid value only replaces this value, the rest of the record and
+    # of the sample is kept
+    assert car['1']['RPM'].to_list() == [10000, 0]
+    assert car['1']['Speed'].to_list() == [200, 200]
+    assert car['44']['RPM'].to_list() == [10000, 10000]
+    assert car['44']['Speed'].to_list() == [0, 200]
+    assert car['44']['nGear'].to_list() == [5, 5]
+    assert pos['1'][['X', 'Y', 'Z']].values.tolist() == [[1, 0, 3]]
+    assert pos['44'][['X', 'Y', 'Z']].values.tolist() == [[4, 5, 6]]
+
+
 def test_timing_data():
     response = list()
     tl = 12  # length of timestamp: len('00:00:00:000')
@@ -66,6 +224,70 @@ def test_timing_data():
         .isna().any().any()
 
 
+def test_laps_data_driver_look_ahead():
+    driver_raw = [
+        # more than 5 minutes before the end of the first lap, ignored
+        ('00:00:00.000', {'Speeds': {'I1': {'Value': '200'}}}),
+        ('00:04:10.000', {'InPit': False}),
+        ('00:06:00.000', {'NumberOfLaps': 1}),
+        # less than 5 seconds late, belongs to the previous lap
+        ('00:06:02.000', {'LastLapTime': {'Value': '1:50.000'}}),
+        ('00:07:50.000', {'InPit': True}),
+        # less than 5 seconds before a new lap starts, belongs to the new lap
+        ('00:08:30.000', {'InPit': False}),
+        ('00:08:33.000', {'NumberOfLaps': 2}),
+        ('00:10:30.000', {'NumberOfLaps': 3,
+                          'LastLapTime': {'Value': '1:57.000'}}),
+    ]
+    laps, split_times = fastf1._api._laps_data_driver(
+        driver_raw, fastf1._api.EMPTY_LAPS, '1'
+    )
+
+    def td(seconds):
+        return datetime.timedelta(seconds=seconds)
+
+    assert laps['Time'] == [td(360), td(513), td(630)]
+    assert laps['NumberOfLaps'] == [1, 2, 3]
+    assert laps['NumberOfPitStops'] == [0, 1, 1]
+    assert laps['LapTime'][0] == td(110)
+    assert laps['LapTime'][2] == td(117)
+    assert laps['PitOutTime'][0] == td(250)
+    assert pd.isna(laps['PitOutTime'][1])
+    assert laps['PitOutTime'][2] == td(510)
+    assert laps['PitInTime'][1] == td(470)
+    assert pd.isna(laps['SpeedI1']).all()
+    assert split_times == [td(0)]
+
+    # no data at all
+    assert fastf1._api._laps_data_driver(
+        [], fastf1._api.EMPTY_LAPS, '1'
+    ) == (None, None)
+
+
+def test_align_laps():
+    def td(seconds):
+        return pd.Timedelta(seconds=seconds)
+
+    laps_data = pd.DataFrame({
+        'Time': [td(100), td(101), td(103), td(190), td(192), td(195)],
+        'Driver': ['1', '2', '3', '1', '2', '3'],
+        'NumberOfLaps': [1, 1, 1, 2, 2, 2],
+        'PitInTime': [pd.NaT] * 6
+    })
+    stream_data = pd.DataFrame({
+        'Time': [td(98), td(100.1), td(101.2), td(103), td(104)],
+        'Driver': ['2', '1', '2', '3', '2'],
+        'GapToLeader': ['+9.000', 'LAP 1', '+1.500', '+2.500', '+0.100']
+    })
+    fastf1._api._align_laps(laps_data, stream_data)
+
+    # the gaps at the end of the first lap match the gaps to the leader of
+    # the sample which is closest to the end of the lap
+    assert laps_data['Time'].to_list() == [
+        td(100), td(101.5), td(102.5), td(190), td(192.5), td(194.5)
+    ]
+
+
 def test_timing_app_data():
     response = list()
     tl = 12  # length of timestamp: len('00:00:00:000')
@@ -159,6 +381,13 @@ def test_track_status_data():
         assert isinstance(col[0], dtype)
         assert len(col) == 7
 
+    # timestamps that cannot be parsed are None
+    data = fastf1._api.track_status_data(
+        'api/path', response=[['invalid', {'Status': '1', 'Message': ''}],
+                              ['00:00:01.5', {'Status': '2', 'Message': ''}]]
+    )
+    assert data['Time'] == [None, datetime.timedelta(seconds=1.5)]
+
 
 def test_session_status_data():
     response = list()
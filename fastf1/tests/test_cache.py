@@ -1,8 +1,11 @@
 import logging
 import os
 
+import pytest
+
 import fastf1._api
 from fastf1 import Cache
+from fastf1.internals.cache_index import INDEX_FILE_NAME
 from fastf1.logger import LoggingManager
 import fastf1.testing
 
@@ -95,7 +98,9 @@ def _test_cache_used_and_clear(tmpdir):
 
         # check cache directory, pickled results should now exist
         cache_dir_path = os.path.join(tmpdir, session.api_path[8:])
-        dir_list = os.listdir(cache_dir_path)
+        # ignore lock files, one exists for each entry
+        dir_list = [name for name in os.listdir(cache_dir_path)
+                    if not name.endswith('.ff1lock')]
         expected_dir_list = ['car_data.ff1pkl', 'position_data.ff1pkl',
                              'driver_info.ff1pkl',
                              'session_status_data.ff1pkl',
@@ -118,3 +123,1015 @@ def _test_cache_used_and_clear(tmpdir):
 
         Cache.clear_cache(tmpdir)  # should delete pickle files
         assert os.listdir(cache_dir_path) == []
+
+
+def test_columnar_telemetry_cache(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_columnar_telemetry_cache, tmpdir)
+
+
+def _test_columnar_telemetry_cache(tmpdir):
+    import numpy as np
+    import pandas as pd
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False,
+                       columnar_telemetry=True)
+
+    reference = {
+        '1': pd.DataFrame({
+            'Date': pd.date_range('2020-01-01', periods=5, freq='s'),
+            'Speed': np.arange(5, dtype='int64'),
+            'Brake': np.array([True, False, True, False, True]),
+            'Status': ['OnTrack', 'OffTrack', None, 'OnTrack', 'OnTrack'],
+            'Source': ['car'] * 5
+        }),
+        '44': pd.DataFrame({
+            'Date': pd.date_range('2020-01-01', periods=3, freq='s'),
+            'Speed': np.arange(3, dtype='int64'),
+            'Brake': np.array([True, False, True]),
+            'Status': ['OnTrack'] * 3,
+            'Source': ['car'] * 3
+        })
+    }
+    calls = list()
+
+    @Cache.api_request_wrapper
+    def telemetry(path, response=None, livedata=None):
+        calls.append(path)
+        return {k: v.copy() for k, v in reference.items()}
+
+    api_path = '/static/2020/test/'
+    first = telemetry(api_path)
+    second = telemetry(api_path)
+    assert len(calls) == 1  # second call is served from the cache
+
+    entry_path = os.path.join(tmpdir, '2020', 'test', 'telemetry.ff1col')
+    assert os.path.isdir(entry_path)
+    assert not os.path.exists(
+        os.path.join(tmpdir, '2020', 'test', 'telemetry.ff1pkl')
+    )
+
+    for drv in reference:
+        pd.testing.assert_frame_equal(first[drv], reference[drv])
+        pd.testing.assert_frame_equal(second[drv], reference[drv])
+
+    # data is memory mapped, but modifications are copy-on-write
+    second['1'].loc[0, 'Speed'] = 100
+    third = telemetry(api_path)
+    pd.testing.assert_frame_equal(third['1'], reference['1'])
+
+    Cache.clear_cache(tmpdir)
+    assert not os.path.exists(entry_path)
+
+
+def test_driver_partitioned_cache(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_driver_partitioned_cache, tmpdir)
+
+
+def _test_driver_partitioned_cache(tmpdir):
+    import numpy as np
+    import pandas as pd
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False,
+                       columnar_telemetry=True)
+
+    reference = {
+        drv: pd.DataFrame({'Speed': np.arange(5, dtype='int64') * int(drv),
+                           'Source': ['car'] * 5})
+        for drv in ('1', '16', '44')
+    }
+    calls = list()
+
+    @Cache.api_request_wrapper
+    def telemetry(path, response=None, livedata=None, drivers=None):
+        calls.append(drivers)
+        return {k: v.copy() for k, v in reference.items()
+                if (drivers is None) or (k in drivers)}
+
+    api_path = '/static/2020/test/'
+    # data is parsed and cached for all drivers, even if only some are
+    # requested
+    first = telemetry(api_path, drivers=['16'])
+    assert list(first.keys()) == ['16']
+    assert calls == [None]
+
+    entry_path = os.path.join(tmpdir, '2020', 'test', 'telemetry.ff1col')
+    assert os.path.isdir(entry_path)
+
+    second = telemetry(api_path, drivers=['44', '1', '99'])
+    assert list(second.keys()) == ['44', '1']
+    assert len(calls) == 1  # served from the cache
+    for drv in second:
+        pd.testing.assert_frame_equal(second[drv], reference[drv])
+
+    assert list(telemetry(api_path).keys()) == ['1', '16', '44']
+
+    # without columnar_telemetry, the data is stored as a single pickle file
+    Cache.enable_cache(tmpdir, use_requests_cache=False, force_renew=True)
+    assert list(telemetry(api_path, drivers=['16']).keys()) == ['16']
+    assert len(calls) == 2
+    assert not os.path.exists(entry_path)
+    assert os.path.isfile(os.path.join(tmpdir, '2020', 'test',
+                                       'telemetry.ff1pkl'))
+
+
+def test_cache_size_limit(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_size_limit, tmpdir)
+
+
+def _test_cache_size_limit(tmpdir):
+    import time
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False)
+
+    @Cache.api_request_wrapper
+    def dummy_data(path, response=None, livedata=None):
+        return b'x' * 10_000
+
+    for session in ('2020/a/', '2020/b/', '2020/c/'):
+        dummy_data(f'/static/{session}')
+        time.sleep(0.01)
+
+    # no index is kept without a size limit
+    assert Cache._index is None
+    assert not os.path.exists(os.path.join(tmpdir, INDEX_FILE_NAME))
+
+    # existing entries are indexed when a limit is set
+    Cache.enable_cache(tmpdir, use_requests_cache=False, max_size='1 GB')
+    Cache._wait_for_maintenance()
+    assert Cache._index.total_size() > 30_000
+
+    # access the oldest session again, so that it becomes the most recent one
+    dummy_data('/static/2020/a/')
+    Cache._wait_for_maintenance()
+
+    # a limit that allows only two of the sessions to be kept
+    Cache.enable_cache(tmpdir, use_requests_cache=False, max_size='25 KB')
+    Cache._wait_for_maintenance()
+
+    assert os.path.exists(os.path.join(tmpdir, '2020', 'a'))
+    assert not os.path.exists(os.path.join(tmpdir, '2020', 'b'))
+    assert os.path.exists(os.path.join(tmpdir, '2020', 'c'))
+    assert Cache._index.total_size() <= 25 * 1024
+
+
+def test_cache_warm_up(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_warm_up, tmpdir)
+
+
+def _test_cache_warm_up(tmpdir):
+    import fastf1
+    import requests_mock
+    from fastf1.cache import warm_sessions
+
+    with requests_mock.Mocker() as mocker:
+        Cache.ci_mode(False)
+        Cache.enable_cache(tmpdir)
+
+        with open('fastf1/testing/reference_data/'
+                  'schedule_2020.json', 'rb') as fobj:
+            content = fobj.read()
+        mocker.get('https://raw.githubusercontent.com/theOehrly/f1schedule/'
+                   'master/schedule_2020.json',
+                   content=content, status_code=200)
+
+        session = fastf1.get_session(2020, 5, 'FP2')
+
+        req_pages = ['timing_data', 'timing_app_data', 'track_status',
+                     'session_status', 'car_data', 'position',
+                     'weather_data', 'driver_list', 'race_control_messages',
+                     'session_info']
+        for p in req_pages:
+            with open(f'fastf1/testing/reference_data/'
+                      f'2020_05_FP2/{p}.raw', 'rb') as fobj:
+                lines = fobj.readlines()
+            content = b''
+            for line in lines:
+                content += line.strip(b'\n').strip(b'\r') + b'\r\n'
+            responses = [{'content': content, 'status_code': 200}]
+            if p == 'weather_data':
+                # a server error on the first request
+                responses.insert(0, {'status_code': 500})
+            mocker.get(fastf1._api.base_url + session.api_path
+                       + fastf1._api.pages[p], responses)
+        # no lap count data for practice sessions
+        mocker.get(fastf1._api.base_url + session.api_path
+                   + fastf1._api.pages['lap_count'], status_code=404)
+        Cache.set_retry_policy(max_retries=0)
+
+        # a server error is a failure, not unavailable data
+        result = warm_sessions([session], parse_workers=2)
+        assert result.failures == [
+            (session.api_path, 'weather_data', 'HTTP 500')
+        ]
+        assert result.fetched == result.parsed == len(req_pages) - 1
+        assert result.unavailable == 1
+
+        # the failed page is fetched again
+        result = warm_sessions([session], parse_workers=2)
+        assert result.failures == []
+        assert result.fetched == result.parsed == 1
+
+        cache_dir_path = os.path.join(tmpdir, session.api_path[8:])
+        dir_list = os.listdir(cache_dir_path)
+        for name in ('car_data.ff1pkl', 'position_data.ff1pkl',
+                     '_extended_timing_data.ff1pkl', 'session_info.ff1pkl'):
+            assert name in dir_list
+
+        # a second warm-up only finds cached data
+        result = warm_sessions([session], parse_workers=2)
+        assert result.fetched == 0
+        assert result.cached == len(req_pages)
+
+
+def test_cache_warm_up_configuration(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_warm_up_configuration,
+                                     tmpdir)
+
+
+def _test_cache_warm_up_configuration(tmpdir):
+    import fastf1
+    import requests_mock
+    from fastf1.cache import warm_sessions
+    from fastf1.internals import compression
+
+    with requests_mock.Mocker() as mocker:
+        Cache.ci_mode(False)
+        Cache.enable_cache(tmpdir, compression='zlib', raw_store=True)
+
+        with open('fastf1/testing/reference_data/'
+                  'schedule_2020.json', 'rb') as fobj:
+            content = fobj.read()
+        mocker.get('https://raw.githubusercontent.com/theOehrly/f1schedule/'
+                   'master/schedule_2020.json',
+                   content=content, status_code=200)
+
+        session = fastf1.get_session(2020, 5, 'FP2')
+
+        req_pages = ['timing_data', 'timing_app_data', 'track_status',
+                     'session_status', 'weather_data', 'driver_list',
+                     'race_control_messages', 'session_info']
+        for p in req_pages:
+            with open(f'fastf1/testing/reference_data/'
+                      f'2020_05_FP2/{p}.raw', 'rb') as fobj:
+                lines = fobj.readlines()
+            content = b''
+            for line in lines:
+                content += line.strip(b'\n').strip(b'\r') + b'\r\n'
+            mocker.get(fastf1._api.base_url + session.api_path
+                       + fastf1._api.pages[p],
+                       content=content, status_code=200)
+        for p in ('lap_count', 'position'):
+            mocker.get(fastf1._api.base_url + session.api_path
+                       + fastf1._api.pages[p], status_code=404)
+        mocker.get(fastf1._api.base_url + session.api_path
+                   + fastf1._api.pages['car_data'], status_code=500)
+        Cache.set_retry_policy(max_retries=0)
+
+        result = warm_sessions([session], parse_workers=2)
+        assert result.failures == [(session.api_path, 'car_data', 'HTTP 500')]
+        assert result.fetched == result.parsed == len(req_pages)
+        assert result.unavailable == 2
+
+        # the pages are stored in the raw store
+        for p in req_pages:
+            assert Cache._raw_store.lookup(
+                fastf1._api.base_url + session.api_path
+                + fastf1._api.pages[p]
+            ) is not None
+
+        # the workers store compressed data, like the main process
+        cache_dir_path = os.path.join(tmpdir, session.api_path[8:])
+        with open(os.path.join(cache_dir_path,
+                               '_extended_timing_data.ff1pkl'), 'rb') as fobj:
+            assert fobj.read(4) == compression.MAGIC
+
+        # data of an older parser version is parsed again
+        cache_file_path = os.path.join(cache_dir_path, 'weather_data.ff1pkl')
+        Cache._write_cache(Cache._read_cache(cache_file_path)['data'],
+                           cache_file_path, parser_version=0)
+        result = warm_sessions([session], parse_workers=2)
+        assert result.fetched == result.parsed == 1
+        assert result.cached == len(req_pages) - 1
+        assert Cache._read_cache(cache_file_path)['parser_version'] == 1
+
+
+def test_cache_single_flight(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_single_flight, tmpdir)
+
+
+@Cache.api_request_wrapper
+def _slow_data(path, response=None, livedata=None):
+    import time
+    # record each call in a file that is shared between processes
+    with open(os.path.join(Cache._CACHE_DIR, 'calls.txt'), 'a') as fobj:
+        fobj.write(f'{os.getpid()}\n')
+    time.sleep(1)
+    return list(range(100_000))
+
+
+def _load_slow_data(tmpdir):
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False)
+    assert _slow_data('/static/2020/test/') == list(range(100_000))
+
+
+def _test_cache_single_flight(tmpdir):
+    import multiprocessing
+
+    processes = [multiprocessing.Process(target=_load_slow_data,
+                                         args=(tmpdir, ))
+                 for _ in range(4)]
+    for prcs in processes:
+        prcs.start()
+    for prcs in processes:
+        prcs.join()
+    assert all(prcs.exitcode == 0 for prcs in processes)
+
+    # data was only created once, the other processes used the cached data
+    with open(os.path.join(tmpdir, 'calls.txt')) as fobj:
+        assert len(fobj.readlines()) == 1
+
+    # no temporary files are left behind
+    assert sorted(os.listdir(os.path.join(tmpdir, '2020', 'test'))) \
+        == ['_slow_data.ff1lock', '_slow_data.ff1pkl']
+
+
+def test_memory_cache(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_memory_cache, tmpdir)
+
+
+def _test_memory_cache(tmpdir):
+    import pandas as pd
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False)
+    Cache.enable_memory_cache(max_items=2)
+    calls = list()
+
+    @Cache.api_request_wrapper
+    def dummy_data(path, response=None, livedata=None):
+        calls.append(path)
+        return pd.DataFrame({'A': range(10)})
+
+    first = dummy_data('/static/2020/a/')
+    # remove the data from the disk, it needs to be served from memory
+    os.remove(os.path.join(tmpdir, '2020', 'a', 'dummy_data.ff1pkl'))
+
+    # returned data is a copy that can be modified
+    first.drop(columns=['A'], inplace=True)
+    second = dummy_data('/static/2020/a/')
+    pd.testing.assert_frame_equal(second, pd.DataFrame({'A': range(10)}))
+    assert len(calls) == 1
+
+    info = Cache.memory_cache_info()
+    assert (info.hits, info.misses, info.items) == (1, 1, 1)
+    assert info.size > 0
+
+    # least recently used data is removed when the limit is exceeded
+    dummy_data('/static/2020/b/')
+    dummy_data('/static/2020/c/')
+    assert Cache.memory_cache_info().items == 2
+    dummy_data('/static/2020/a/')
+    assert len(calls) == 4
+
+    Cache.disable_memory_cache()
+    assert Cache.memory_cache_info() is None
+
+
+@pytest.mark.parametrize('codec', ['zstd', 'lz4'])
+def test_compressed_cache(tmpdir, codec):
+    pytest.importorskip({'zstd': 'zstandard', 'lz4': 'lz4'}[codec])
+    fastf1.testing.run_in_subprocess(_test_compressed_cache, tmpdir, codec)
+
+
+def _test_compressed_cache(tmpdir, codec):
+    import numpy as np
+    import pandas as pd
+    from fastf1.internals import compression
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False)
+    reference = {drv: pd.DataFrame({'Speed': np.arange(10_000) % 300,
+                                    'Source': ['car'] * 10_000})
+                 for drv in ('1', '44')}
+
+    @Cache.api_request_wrapper
+    def telemetry(path, response=None, livedata=None):
+        return {k: v.copy() for k, v in reference.items()}
+
+    @Cache.api_request_wrapper
+    def other_data(path, response=None, livedata=None):
+        return list(range(100)) * 100
+
+    # uncompressed data is written first and needs to remain usable
+    telemetry('/static/2020/a/')
+    other_data('/static/2020/a/')
+    Cache.enable_cache(tmpdir, use_requests_cache=False, compression=codec)
+    telemetry('/static/2020/b/')
+    other_data('/static/2020/b/')
+
+    for session in ('a', 'b'):
+        with open(os.path.join(tmpdir, '2020', session, 'other_data.ff1pkl'),
+                  'rb') as fobj:
+            is_compressed = fobj.read(4) == compression.MAGIC
+        assert is_compressed == (session == 'b')
+
+        assert other_data(f'/static/2020/{session}/') \
+            == list(range(100)) * 100
+        cached = telemetry(f'/static/2020/{session}/')
+        for drv in reference:
+            pd.testing.assert_frame_equal(cached[drv], reference[drv])
+
+    size_a = os.path.getsize(
+        os.path.join(tmpdir, '2020', 'a', 'other_data.ff1pkl'))
+    size_b = os.path.getsize(
+        os.path.join(tmpdir, '2020', 'b', 'other_data.ff1pkl'))
+    assert size_b < size_a / 2
+
+
+def test_parser_version(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_parser_version, tmpdir)
+
+
+def _test_parser_version(tmpdir):
+    import pickle
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir, use_requests_cache=False)
+    calls = list()
+
+    def make_func(name, version, result):
+        def func(path, response=None, livedata=None):
+            calls.append((name, version))
+            return result
+        func.__name__ = name
+        return Cache.api_request_wrapper(func, parser_version=version)
+
+    api_path = '/static/2020/test/'
+    assert make_func('first', 1, 'a')(api_path) == 'a'
+    assert make_func('second', 1, 'b')(api_path) == 'b'
+
+    # only data of the function with a new parser version is created again
+    assert make_func('first', 2, 'c')(api_path) == 'c'
+    assert make_func('second', 1, 'd')(api_path) == 'b'
+    assert calls == [('first', 1), ('second', 1), ('first', 2)]
+
+    # data that was cached before parser versions were introduced is
+    # version 1
+    legacy_path = os.path.join(tmpdir, '2020', 'test', 'legacy.ff1pkl')
+    with open(legacy_path, 'wb') as fobj:
+        pickle.dump({'version': Cache._API_CORE_VERSION, 'data': 'e'}, fobj)
+    assert make_func('legacy', 1, 'f')(api_path) == 'e'
+    assert make_func('legacy', 2, 'g')(api_path) == 'g'
+
+    # usable as decorator with and without arguments
+    @Cache.api_request_wrapper
+    def default_version(path, response=None, livedata=None):
+        return 'h'
+
+    assert default_version(api_path) == 'h'
+
+
+def test_raw_store(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_raw_store, tmpdir)
+
+
+def _test_raw_store(tmpdir):
+    import datetime
+    import requests_mock
+
+    api_path = '/static/2020/test/'
+    url = fastf1._api.base_url + api_path \
+        + fastf1._api.pages['session_status']
+    content = (b'\xef\xbb\xbf00:00:00.000{"Status": "Started"}\r\n'
+               b'00:10:00.000{"Status": "Finished"}\r\n')
+    expected = [['00:00:00.000', {'Status': 'Started'}],
+                ['00:10:00.000', {'Status': 'Finished'}]]
+
+    with requests_mock.Mocker() as mocker:
+        Cache.ci_mode(False)
+        Cache.enable_cache(tmpdir, raw_store=True)
+        mocker.get(url, content=content, headers={'ETag': '"abc"'})
+
+        assert fastf1._api.fetch_page(api_path, 'session_status') == expected
+        assert fastf1._api.fetch_page(api_path, 'session_status') == expected
+        assert mocker.call_count == 1
+
+        # the response is not stored in the requests cache
+        assert not Cache._requests_session_cached.cache.contains(url=url)
+        store_dir = os.path.join(tmpdir, 'fastf1_raw_store', 'objects')
+        assert sum(len(f) for _, _, f in os.walk(store_dir)) == 1
+
+        # expired responses are revalidated
+        Cache._EXPIRE_AFTER_HISTORICAL = datetime.timedelta(seconds=0)
+        mocker.get(url, status_code=304)
+        assert fastf1._api.fetch_page(api_path, 'session_status') == expected
+        assert mocker.call_count == 2
+        assert mocker.last_request.headers['If-None-Match'] == '"abc"'
+
+        # the old body is removed by garbage collection after it changed
+        mocker.get(url, content=content.split(b'\r\n')[0] + b'\r\n')
+        assert fastf1._api.fetch_page(api_path, 'session_status') \
+            == expected[:1]
+        assert sum(len(f) for _, _, f in os.walk(store_dir)) == 2
+        Cache.gc_raw_store()
+        assert sum(len(f) for _, _, f in os.walk(store_dir)) == 1
+
+        Cache.clear_cache(tmpdir, deep=True)
+        assert not os.path.exists(os.path.join(tmpdir, 'fastf1_raw_store'))
+
+
+def test_cache_revalidation(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_revalidation, tmpdir)
+
+
+def _test_cache_revalidation(tmpdir):
+    import datetime
+    import requests_mock
+
+    year = datetime.datetime.now().year
+    current_url = f'https://ergast.com/api/f1/{year}.json'
+    past_url = 'https://ergast.com/api/f1/2020.json'
+    assert Cache._get_expire_after(current_url) == Cache._EXPIRE_AFTER
+    assert Cache._get_expire_after(past_url) \
+        == Cache._EXPIRE_AFTER_HISTORICAL
+    assert Cache._get_expire_after(
+        f'https://livetiming.formula1.com/static/{year}/Index.json'
+    ) == Cache._EXPIRE_AFTER
+
+    Cache.ci_mode(False)
+    Cache._EXPIRE_AFTER = datetime.timedelta(seconds=0)
+    Cache.enable_cache(tmpdir)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(current_url, text='abc', headers={'ETag': '"v1"'})
+        mocker.get(past_url, text='def', headers={'ETag': '"v1"'})
+        assert Cache.requests_get(current_url).text == 'abc'
+        assert Cache.requests_get(past_url).text == 'def'
+        assert mocker.call_count == 2
+
+        # past seasons are not revalidated yet
+        assert Cache.requests_get(past_url).from_cache
+        assert mocker.call_count == 2
+
+        # expired responses are revalidated with a conditional request
+        mocker.get(current_url, status_code=304)
+        r = Cache.requests_get(current_url)
+        assert mocker.call_count == 3
+        assert mocker.last_request.headers['If-None-Match'] == '"v1"'
+        assert r.text == 'abc'
+
+
+def test_raw_store_streaming(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_raw_store_streaming, tmpdir)
+
+
+def _test_raw_store_streaming(tmpdir):
+    import requests_mock
+
+    api_path = '/static/2020/test/'
+    url = fastf1._api.base_url + api_path + fastf1._api.pages['car_data']
+    records = [f'00:00:{i:02d}.000"abc{i}"' for i in range(50)]
+    content = '\r\n'.join(records).encode() + b'\r\n'
+
+    with requests_mock.Mocker() as mocker:
+        Cache.ci_mode(False)
+        Cache.enable_cache(tmpdir, raw_store=True)
+        mocker.get(url, content=content)
+
+        # incompletely read responses are not stored
+        stream = fastf1._api._fetch_stream_records(api_path, 'car_data')
+        assert next(stream) == records[0]
+        stream.close()
+        assert Cache._raw_store.lookup(url) is None
+
+        stream = fastf1._api._fetch_stream_records(api_path, 'car_data')
+        assert list(stream) == records
+        assert mocker.call_count == 2
+        assert Cache._raw_store.lookup(url).size == len(content)
+
+        # served from the raw store
+        stream = fastf1._api._fetch_stream_records(api_path, 'car_data')
+        assert list(stream) == records
+        assert mocker.call_count == 2
+
+    store_dir = os.path.join(tmpdir, 'fastf1_raw_store', 'objects')
+    assert [f for _, _, files in os.walk(store_dir) for f in files
+            if f.endswith('.ff1tmp')] == []
+
+
+def test_cache_stats(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_stats, tmpdir)
+
+
+def _test_cache_stats(tmpdir):
+    import requests_mock
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir)
+    Cache.enable_memory_cache()
+    Cache.reset_stats()
+
+    url = 'http://example.com/data'
+
+    @Cache.api_request_wrapper
+    def func(path, response=None, livedata=None):
+        return Cache.requests_get(url).text
+
+    api_path = '/static/2020/test/'
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, text='abc')
+        with Cache.collect_stats() as first:
+            assert func(api_path) == 'abc'
+        with Cache.collect_stats() as second:
+            assert func(api_path) == 'abc'
+        Cache.disable_memory_cache()
+        assert func(api_path) == 'abc'
+
+    assert first.memory.misses == 1
+    assert first.parsed.misses == 1
+    assert first.parsed.bytes_written > 0
+    assert first.parse_calls == 1
+    assert first.requests.misses == 1
+    assert first.requests.bytes_written == 3
+    assert first.functions['func'].requests.misses == 1
+
+    assert second.memory.hits == 1
+    assert second.parsed.hits == 0
+    assert second.parse_calls == 0
+    assert second.requests.hits + second.requests.misses == 0
+
+    total = Cache.stats()
+    assert total.parsed.hits == 1
+    assert total.parsed.bytes_read == first.parsed.bytes_written
+    assert total.parsed.hit_rate == 0.5
+    assert total.to_dict()['functions']['func']['parse_calls'] == 1
+
+    # the version of the cached data does not match
+    Cache._API_CORE_VERSION += 1
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, text='abc')
+        with Cache.collect_stats() as third:
+            assert func(api_path) == 'abc'
+    assert third.parsed.stale == 1
+    assert third.parsed.misses == 1
+    # the response is served by the requests cache
+    assert third.requests.hits == 1
+    assert third.requests.bytes_read == 3
+
+
+@pytest.mark.parametrize('backend_type', ['local', 'shared'])
+def test_cache_backend_interface(tmpdir, backend_type):
+    from fastf1.cache import LocalDirectoryBackend, SharedDirectoryBackend
+
+    if backend_type == 'local':
+        backend = LocalDirectoryBackend(str(tmpdir))
+    else:
+        backend = SharedDirectoryBackend(str(tmpdir), read_only=False)
+
+    assert backend.get('a/b') is None
+    assert not backend.exists('a/b')
+    backend.put('a/b', b'123')
+    backend.put('a/c', b'456')
+    backend.put('d', b'789')
+    assert backend.get('a/b') == b'123'
+    assert backend.exists('a/b')
+    assert sorted(backend.list()) == ['a/b', 'a/c', 'd']
+    assert sorted(backend.list('a/')) == ['a/b', 'a/c']
+    backend.delete('a/b')
+    backend.delete('a/b')
+    assert sorted(backend.list()) == ['a/c', 'd']
+
+    with pytest.raises(ValueError):
+        backend.get('../x')
+
+    read_only = SharedDirectoryBackend(str(tmpdir))
+    assert read_only.get('d') == b'789'
+    with pytest.raises(PermissionError):
+        read_only.put('e', b'')
+
+
+def test_http_cache_backend():
+    import requests_mock
+
+    from fastf1.cache import HTTPBackend
+
+    backend = HTTPBackend('http://store.local/cache/')
+    with requests_mock.Mocker() as mocker:
+        mocker.get('http://store.local/cache/a/b', content=b'123')
+        mocker.get('http://store.local/cache/a/c', status_code=404)
+        mocker.head('http://store.local/cache/a/c', status_code=404)
+        mocker.put('http://store.local/cache/a/c', status_code=201)
+        mocker.get('http://store.local/cache/?prefix=a', json=['a/b'])
+
+        assert backend.get('a/b') == b'123'
+        assert backend.get('a/c') is None
+        assert not backend.exists('a/c')
+        backend.put('a/c', b'456')
+        assert mocker.last_request.body == b'456'
+        assert list(backend.list('a')) == ['a/b']
+
+
+def test_shared_cache(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_shared_cache, tmpdir)
+
+
+def _test_shared_cache(tmpdir):
+    import pandas as pd
+
+    from fastf1.cache import LocalDirectoryBackend, SharedDirectoryBackend
+
+    shared_dir = os.path.join(tmpdir, 'shared')
+    calls = list()
+
+    @Cache.api_request_wrapper
+    def frames(path, response=None, livedata=None, drivers=None):
+        calls.append('frames')
+        return {'1': pd.DataFrame({'a': [1, 2]}),
+                '44': pd.DataFrame({'a': [3, 4]})}
+
+    @Cache.api_request_wrapper
+    def other(path, response=None, livedata=None):
+        calls.append('other')
+        return [1, 2, 3]
+
+    api_path = '/static/2020/test/'
+    Cache.ci_mode(False)
+    for i, backend in enumerate((LocalDirectoryBackend(shared_dir),
+                                 SharedDirectoryBackend(shared_dir))):
+        # a new node with an empty local cache directory
+        node_dir = os.path.join(tmpdir, f'node{i}')
+        os.mkdir(node_dir)
+        Cache.enable_cache(node_dir, use_requests_cache=False,
+                           columnar_telemetry=True, backend=backend)
+        with Cache.collect_stats() as stats:
+            assert frames(api_path, drivers=['44'])['44']['a'].tolist() \
+                == [3, 4]
+            assert other(api_path) == [1, 2, 3]
+        if i == 0:
+            assert stats.remote.misses == 2
+            assert stats.remote.bytes_written > 0
+        else:
+            assert stats.remote.hits == 2
+            assert stats.parsed.bytes_read > 0
+        assert os.path.isdir(os.path.join(node_dir, '2020', 'test',
+                                          'frames.ff1col'))
+
+    # only parsed once, by the first node
+    assert calls == ['frames', 'other']
+    assert sorted(LocalDirectoryBackend(shared_dir).list()) == [
+        'parsed/2020/test/frames.ff1col.tar',
+        'parsed/2020/test/other.ff1pkl'
+    ]
+
+
+def test_cache_bundle(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_bundle, tmpdir)
+
+
+def _test_cache_bundle(tmpdir):
+    import pandas as pd
+    import requests_mock
+
+    calls = list()
+
+    @Cache.api_request_wrapper
+    def frames(path, response=None, livedata=None, drivers=None):
+        calls.append('frames')
+        return {'1': pd.DataFrame({'a': [1, 2]}),
+                '44': pd.DataFrame({'a': [3, 4]})}
+
+    @Cache.api_request_wrapper
+    def other(path, response=None, livedata=None):
+        calls.append('other')
+        return Cache.requests_get(url).text
+
+    api_path = '/static/2020/test/'
+    url = 'https://ergast.com/api/f1/2020/5.json'
+    stream_url = fastf1._api.base_url + api_path + 'Stream.jsonStream'
+    bundle_path = os.path.join(tmpdir, '2020.ff1bundle')
+    source_dir = os.path.join(tmpdir, 'source')
+    target_dir = os.path.join(tmpdir, 'target')
+    os.mkdir(source_dir)
+    os.mkdir(target_dir)
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(source_dir, raw_store=True, columnar_telemetry=True)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, text='abc')
+        mocker.get(stream_url, content=b'xyz')
+        mocker.get('https://ergast.com/api/f1/2021/5.json', text='def')
+        frames(api_path)
+        other(api_path)
+        assert b''.join(Cache.requests_get_stream(stream_url)) == b'xyz'
+        Cache.requests_get('https://ergast.com/api/f1/2021/5.json')
+
+    summary = Cache.export_bundle(2020, bundle_path)
+    assert summary.parsed == 2
+    assert summary.responses == 2  # the 2021 response is not included
+
+    Cache.enable_cache(target_dir, raw_store=True)
+    summary = Cache.import_bundle(bundle_path)
+    assert (summary.year, summary.parsed, summary.responses) == (2020, 2, 2)
+    assert os.path.isdir(os.path.join(target_dir, '2020', 'test',
+                                      'frames.ff1col'))
+
+    Cache.offline_mode(True)
+    assert frames(api_path, drivers=['44'])['44']['a'].tolist() == [3, 4]
+    assert calls == ['frames', 'other']
+    assert Cache.requests_get(url).text == 'abc'
+    assert b''.join(Cache.requests_get_stream(stream_url)) == b'xyz'
+
+    # damaged bundles are rejected without modifying the cache
+    with open(bundle_path, 'rb') as fobj:
+        content = bytearray(fobj.read())
+    content[len(content) // 2] ^= 0xff
+    with open(bundle_path, 'wb') as fobj:
+        fobj.write(content)
+    Cache.clear_cache(target_dir)
+    with pytest.raises(ValueError):
+        Cache.import_bundle(bundle_path)
+    assert not os.path.exists(os.path.join(target_dir, '2020', 'test',
+                                           'frames.ff1col'))
+    assert [name for name in os.listdir(target_dir)
+            if name.endswith('.ff1tmp')] == []
+
+
+def test_bundle_http_responses(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_bundle_http_responses, tmpdir)
+
+
+def _test_bundle_http_responses(tmpdir):
+    # responses that are stored by the requests cache are selected by their
+    # url; fails if the stored format of the responses is not understood
+    import requests_mock
+
+    from fastf1.cache.bundle import _iter_http_responses
+
+    urls = ['https://livetiming.formula1.com/static/2020/' + 'x' * 2000,
+            'https://ergast.com/api/f1/2020/5.json',
+            'https://ergast.com/api/f1/2021/5.json']
+
+    Cache.ci_mode(False)
+    Cache.enable_cache(tmpdir)
+    with requests_mock.Mocker() as mocker:
+        for url in urls:
+            mocker.get(url, content=b'url' * 10_000)
+            Cache.requests_get(url)
+
+    keys = [key for key, _, _ in _iter_http_responses(tmpdir, 2020)]
+    responses = Cache._requests_session_cached.cache.responses
+    assert sorted(responses[key].url for key in keys) == sorted(urls[:2])
+
+
+def test_prefetch_pages(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_prefetch_pages, tmpdir)
+
+
+def _test_prefetch_pages(tmpdir):
+    import datetime
+
+    import requests_mock
+
+    api_path = '/static/2020/test/'
+    content = b'\xef\xbb\xbf00:00:00.000{"Status": "Started"}\r\n'
+    names = ['session_status', 'track_status', 'weather_data', 'index']
+
+    with requests_mock.Mocker() as mocker:
+        Cache.ci_mode(False)
+        Cache.enable_cache(tmpdir)
+        for name in names:
+            mocker.get(fastf1._api.base_url + api_path
+                       + fastf1._api.pages[name], content=content)
+
+        # parsed data exists already for this page
+        fastf1._api.session_status_data(api_path)
+        assert mocker.call_count == 1
+
+        fastf1._api.prefetch_pages(api_path, names)
+        assert mocker.call_count == 4
+
+        # the pages are now served from the cache
+        fastf1._api.fetch_page(api_path, 'weather_data')
+        fastf1._api.track_status_data(api_path)
+        assert mocker.call_count == 4
+
+        # cached responses are not read again
+        requested = list()
+        requests_get = Cache.requests_get
+        Cache.requests_get = \
+            lambda url, **kwargs: requested.append(url) \
+            or requests_get(url, **kwargs)
+        fastf1._api.prefetch_pages(api_path, names)
+        assert requested == []
+        Cache.requests_get = requests_get
+
+        # expired responses and pages with parsed data of an older parser
+        # version are fetched again
+        Cache._requests_session_cached.cache.reset_expiration(
+            datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+        )
+        cache_file_path = Cache._get_cache_file_path(api_path,
+                                                     'track_status_data')
+        Cache._write_cache(Cache._read_cache(cache_file_path)['data'],
+                           cache_file_path, parser_version=0)
+        mocker.reset_mock()
+        fastf1._api.prefetch_pages(api_path, names)
+        assert sorted(r.url.split('/')[-1] for r in mocker.request_history) \
+            == ['Index.json', 'TrackStatus.jsonStream',
+                'WeatherData.jsonStream']
+
+
+def test_connection_pool(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_connection_pool, tmpdir)
+
+
+def _test_connection_pool(tmpdir):
+    Cache.enable_cache(tmpdir)
+    Cache.set_connection_pool(max_hosts=2, max_per_host=4)
+
+    # one pool is shared by all sessions
+    adapter = Cache._requests_session.get_adapter('https://ergast.com')
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 4
+    assert Cache._requests_session_cached.get_adapter(
+        'https://livetiming.formula1.com') is adapter
+
+    # and also used by sessions that are created later
+    Cache.enable_cache(tmpdir)
+    assert Cache._requests_session_cached.get_adapter(
+        'http://example.com') is adapter
+
+
+def test_retry_policy(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_retry_policy, tmpdir)
+
+
+def _test_retry_policy(tmpdir):
+    import requests
+    import requests_mock
+
+    Cache.enable_cache(tmpdir)
+    Cache.set_retry_policy(max_retries=2, backoff=0.01)
+    url = 'https://livetiming.formula1.com/static/2020/test.json'
+
+    with requests_mock.Mocker() as mocker:
+        # temporary errors are retried
+        mocker.get(url, [{'status_code': 503},
+                         {'exc': requests.exceptions.ConnectTimeout},
+                         {'status_code': 200, 'content': b'data'}])
+        with Cache.collect_stats() as stats:
+            r = Cache.requests_get(url)
+        assert r.status_code == 200
+        assert r.content == b'data'
+        assert mocker.call_count == 3
+
+        endpoint = stats.endpoints['livetiming.formula1.com']
+        assert endpoint.requests == 3
+        assert endpoint.retries == 2
+        assert endpoint.failures == 0
+        assert endpoint.errors == {'http_503': 1, 'timeout': 1}
+        assert sum(endpoint.latency) == 3
+
+        # the last response is returned when all retries failed
+        mocker.reset_mock()
+        mocker.get(url + '?v=2', status_code=500)
+        with Cache.collect_stats() as stats:
+            r = Cache.requests_get(url + '?v=2')
+        assert r.status_code == 500
+        assert mocker.call_count == 3
+        assert stats.endpoints['livetiming.formula1.com'].failures == 1
+
+        # other errors are not retried
+        mocker.reset_mock()
+        mocker.get(url + '?v=3', status_code=404)
+        r = Cache.requests_get(url + '?v=3')
+        assert r.status_code == 404
+        assert mocker.call_count == 1
+
+        # only requests with idempotent methods are retried
+        mocker.reset_mock()
+        mocker.post(url, status_code=503)
+        r = Cache.requests_post(url, data=b'data')
+        assert r.status_code == 503
+        assert mocker.call_count == 1
+
+        # no retry if the time budget would be exceeded; the server
+        # requests a minimum wait time
+        Cache.set_retry_policy(total_timeout=1)
+        mocker.reset_mock()
+        mocker.get(url + '?v=4', status_code=429,
+                   headers={'Retry-After': '5'})
+        r = Cache.requests_get(url + '?v=4')
+        assert r.status_code == 429
+        assert mocker.call_count == 1
+
+        # connection errors are raised after all retries failed
+        Cache.set_retry_policy(max_retries=1, backoff=0.01)
+        mocker.reset_mock()
+        mocker.get(url + '?v=5', exc=requests.exceptions.ConnectionError)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            Cache.requests_get(url + '?v=5')
+        assert mocker.call_count == 2
@@ -56,6 +56,34 @@ def test_first_lap_pitout_times():
     assert race_laps[race_mask]["Driver"].tolist() == []
 
 
+@pytest.mark.f1telapi
+def test_lazy_loading():
+    session = fastf1.get_session(2023, 1, 'Q')
+    session.load(lazy=True, weather=False)
+    assert not hasattr(session, '_results')
+
+    # laps and results are loaded without loading telemetry
+    laps = session.laps
+    assert hasattr(session, '_results')
+    assert hasattr(session, '_race_control_messages')
+    assert not hasattr(session, '_car_data')
+    assert 'LapStartDate' not in laps.columns
+
+    eager = fastf1.get_session(2023, 1, 'Q')
+    eager.load(telemetry=False, weather=False)
+    pd.testing.assert_frame_equal(laps, eager.laps)
+    pd.testing.assert_frame_equal(session.results, eager.results)
+
+    # telemetry is loaded on first access and memoized
+    car_data = session.car_data
+    assert session.car_data is car_data
+    assert session.t0_date is not None
+    assert 'LapStartDate' in session.laps.columns
+
+    with pytest.raises(fastf1.core.DataNotLoadedError):
+        session.weather_data
+
+
 def test_laps_constructor_metadata_propagation(reference_laps_data):
     session, laps = reference_laps_data
 
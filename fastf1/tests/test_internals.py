@@ -1,4 +1,16 @@
-from fastf1.internals.pandas_extensions import _unsafe_create_df_fast
+import asyncio
+import datetime
+import json
+import multiprocessing
+
+import pytest
+
+import fastf1.req
+from fastf1.internals import json_backend, rate_limit
+from fastf1.internals.memory_cache import copy_value
+from fastf1.internals.pandas_extensions import _unsafe_create_df_fast, \
+    _unsafe_create_df_from_blocks
+from fastf1.internals.rate_limit import SlidingWindowLimit
 
 import numpy as np
 import pandas as pd
@@ -18,3 +30,158 @@ def test_fast_df_creation():
     )
 
     pd.testing.assert_frame_equal(df_safe, df_fast)
+
+
+def test_df_creation_from_blocks():
+    df_safe = pd.DataFrame({'A': [1, 2, 3], 'B': [1.0, 2.0, 3.0],
+                            'C': [4, 5, 6], 'D': ['a', 'b', 'c']})
+
+    int_block = np.array([[1, 2, 3], [4, 5, 6]], dtype='int64')
+    float_block = np.array([[1.0, 2.0, 3.0]], dtype='float64')
+    obj_block = np.array([['a', 'b', 'c']], dtype='object')
+    df_blocks = _unsafe_create_df_from_blocks(
+        [(int_block, [0, 2]), (float_block, [1]), (obj_block, [3])],
+        columns=['A', 'B', 'C', 'D'], length=3
+    )
+
+    pd.testing.assert_frame_equal(df_safe, df_blocks)
+    # data is not copied
+    assert np.shares_memory(df_blocks['C'].to_numpy(), int_block)
+
+
+def test_copy_value():
+    td = datetime.timedelta(seconds=1)
+    df = pd.DataFrame({'A': [1, 2], 'B': ['a', 'b']})
+    value = {'frames': {'1': df}, 'times': [td, None], 'pair': ([1], 'x')}
+    copied = copy_value(value)
+    assert copied == {'frames': copied['frames'], 'times': [td, None],
+                      'pair': ([1], 'x')}
+
+    # containers and data are copied, immutable objects are shared
+    assert copied['frames']['1'] is not df
+    assert not np.shares_memory(copied['frames']['1']['A'].to_numpy(),
+                                df['A'].to_numpy())
+    assert copied['times'] is not value['times']
+    assert copied['times'][0] is td
+    assert copied['pair'][0] is not value['pair'][0]
+
+    copied['frames']['1'].loc[0, 'A'] = 10
+    copied['pair'][0].append(2)
+    assert df.loc[0, 'A'] == 1
+    assert value['pair'] == ([1], 'x')
+
+
+def _take_calls(state_dir, n, queue):
+    window = SlidingWindowLimit('test', calls=5, interval=1000,
+                                state_dir=state_dir)
+    queue.put([window.acquire(block=False) for _ in range(n)])
+
+
+def test_sliding_window_shared(tmpdir):
+    # the limit is shared by all processes that use the same state file
+    window = SlidingWindowLimit('test', calls=5, interval=1000,
+                                state_dir=str(tmpdir))
+    assert window.acquire(block=False)
+    assert window.acquire(block=False)
+
+    queue = multiprocessing.Queue()
+    prcs = multiprocessing.Process(target=_take_calls,
+                                   args=(str(tmpdir), 4, queue))
+    prcs.start()
+    taken = queue.get(timeout=30)
+    prcs.join()
+    assert taken == [True, True, True, False]
+
+    assert not window.acquire(block=False)
+    # waiting time until the next call is allowed
+    assert window.try_acquire() > 900
+
+    # other limits are independent
+    other = SlidingWindowLimit('other', calls=1, interval=1000,
+                               state_dir=str(tmpdir))
+    assert other.acquire(block=False)
+
+
+def test_sliding_window_wait(tmpdir):
+    window = SlidingWindowLimit('test', calls=1, interval=0.05,
+                                state_dir=str(tmpdir))
+    assert window.acquire()
+    assert window.try_acquire() > 0
+    # blocks until the next call is allowed
+    assert window.acquire()
+    assert asyncio.run(window.acquire_async())
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1e9
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_ergast_rate_limits(tmpdir, monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', clock)
+    monkeypatch.setattr(rate_limit, 'get_default_state_dir',
+                        lambda: str(tmpdir))
+
+    # soft limit: at least 0.25s between two calls, no bursts
+    soft = fastf1.req._MinIntervalLimitDelay('test_soft', 0.25)
+    t_calls = list()
+    for _ in range(10):
+        soft.limit()
+        t_calls.append(clock.now)
+    assert min(np.diff(t_calls)) >= 0.25
+
+    # hard limit: never more than 200 calls within any hour, even when the
+    # limit is hit repeatedly over multiple hours
+    hard = fastf1.req._CallsPerIntervalLimitRaise('test_hard', 200, 60*60,
+                                                  "200 calls/h")
+    t_calls = list()
+    for _ in range(60 * 60):  # three hours, one call every 3s
+        try:
+            hard.limit()
+        except fastf1.req.RateLimitExceededError:
+            pass
+        else:
+            t_calls.append(clock.now)
+        clock.now += 3
+    t_calls = np.array(t_calls)
+    n_per_hour = np.searchsorted(t_calls, t_calls + 60*60) \
+        - np.arange(len(t_calls))
+    assert n_per_hour.max() == 200
+    assert len(t_calls) == 3 * 200
+
+
+@pytest.mark.parametrize('backend', json_backend.BACKENDS)
+def test_json_backend(backend):
+    if backend == 'orjson':
+        pytest.importorskip('orjson')  # optional dependency
+    documents = [
+        '{"Entries": [{"Utc": "2020-08-08T09:45:03.0619797Z", '
+        '"Cars": {"1": {"Channels": {"0": 10345, "2": 287}}}}]}',
+        '[1.5, -0.1, 1e-7, 12345678901234567890123, "\\u00fc\\ud800"]',
+        '{"a": NaN, "b": Infinity, "a": 2}',
+        b'{"bytes": true, "null": null}',
+    ]
+    try:
+        json_backend.set_json_backend(backend)
+        assert json_backend.get_json_backend() == backend
+        for doc in documents:
+            expected = json.loads(doc)
+            result = json_backend.loads(doc)
+            assert repr(result) == repr(expected)
+
+        with pytest.raises(json.JSONDecodeError):
+            json_backend.loads('{"invalid": ')
+    finally:
+        json_backend.set_json_backend()
+
+
+def test_json_backend_invalid():
+    with pytest.raises(ValueError):
+        json_backend.set_json_backend('simplejson')
@@ -1,6 +1,9 @@
 import datetime
 
-from fastf1.utils import to_datetime, to_timedelta
+import numpy as np
+
+from fastf1.utils import to_datetime, to_datetime_array, to_timedelta, \
+    to_timedelta_array
 
 
 def test_to_timedelta():
@@ -45,3 +48,33 @@ def test_to_datetime():
     ]
     for ts, expected in cases:
         assert to_datetime(ts) == expected
+
+
+def test_to_timedelta_array():
+    values = ['13:24:46.320215', '13:24:46.32', '13:24:46.', '13:24:46',
+              '24:46', '4:46', '46', '4:46.5264', '00:00:01.1234567',
+              datetime.timedelta(seconds=3), None, '', 'invalid', ':46']
+    result = to_timedelta_array(values)
+    assert result.dtype == 'timedelta64[ns]'
+    for value, converted in zip(values, result):
+        expected = to_timedelta(value)
+        if expected is None:
+            assert np.isnat(converted)
+        else:
+            assert converted == np.timedelta64(expected)
+
+
+def test_to_datetime_array():
+    values = ['2020-12-13T13:27:15.320653Z', '2020-12-13T13:27:15.320000',
+              '2020-12-13T13:27:15.32Z', '2020-12-13T13:27:15',
+              '2020-12-13T13:27:15.', '2020-12-13T13:27:15.0619797Z',
+              '2020-2-3T1:2:3', datetime.datetime(2020, 12, 13, 13, 27, 15),
+              '2021-02-30T00:00:00', '2020-12-13T24:00:00Z', None, 'invalid']
+    result = to_datetime_array(values)
+    assert result.dtype == 'datetime64[ns]'
+    for value, converted in zip(values, result):
+        expected = to_datetime(value)
+        if expected is None:
+            assert np.isnat(converted)
+        else:
+            assert converted == np.datetime64(expected)
@@ -1,7 +1,7 @@
 """This is a collection of various functions."""
 import datetime
 from functools import reduce
-from typing import Dict, Tuple, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 import warnings
 
 import numpy as np
@@ -225,3 +225,192 @@ def to_datetime(x: Union[str, datetime.datetime]) \
 
     else:
         return None
+
+
+def to_timedelta_array(x: Iterable[Union[str, datetime.timedelta, None]]) \
+        -> np.ndarray:
+    """Fast creation of an array of timedeltas from many time strings.
+
+    This is the bulk version of :func:`to_timedelta` and accepts the same
+    formats. All strings that have the same layout are converted at once.
+    Values that cannot be converted are NaT.
+
+    Args:
+        x: timestamps
+
+    Returns:
+        array of dtype ``timedelta64[ns]``
+    """
+    return _bulk_convert(x, _parse_timedelta_fields, to_timedelta,
+                         _timedelta_to_ns).view('timedelta64[ns]')
+
+
+def to_datetime_array(x: Iterable[Union[str, datetime.datetime, None]]) \
+        -> np.ndarray:
+    """Fast creation of an array of datetimes from many date strings.
+
+    This is the bulk version of :func:`to_datetime` and accepts the same
+    formats. All strings that have the same layout are converted at once.
+    Values that cannot be converted are NaT.
+
+    Args:
+        x: timestamps
+
+    Returns:
+        array of dtype ``datetime64[ns]``
+    """
+    return _bulk_convert(x, _parse_datetime_fields, to_datetime,
+                         _datetime_to_ns).view('datetime64[ns]')
+
+
+_NAT = np.iinfo(np.int64).min  # integer value of NaT
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_MAX_LAYOUTS = 8  # remaining values are converted one by one
+
+
+def _timedelta_to_ns(value: Optional[datetime.timedelta]) -> int:
+    return _NAT if value is None else value // _MICROSECOND * 1000
+
+
+def _datetime_to_ns(value: Optional[datetime.datetime]) -> int:
+    return _NAT if value is None \
+        else (value - _EPOCH) // _MICROSECOND * 1000
+
+
+def _bulk_convert(values, parse_fields: Callable, convert: Callable,
+                  to_ns: Callable) -> np.ndarray:
+    # Convert timestamps to integer nanoseconds. Strings are grouped by their
+    # layout (position of all non-digit characters). For each group, the
+    # digits are converted to integers with array arithmetic, which is done
+    # by `parse_fields`. Other values and strings with an unsupported layout
+    # are converted one by one with `convert`.
+    values = list(values)
+    result = np.full(len(values), _NAT, dtype='int64')
+    is_str = np.fromiter((isinstance(v, str) and bool(v) for v in values),
+                         dtype=bool, count=len(values))
+    str_idx = np.flatnonzero(is_str)
+
+    remaining = list(np.flatnonzero(~is_str))
+    if len(str_idx):
+        strings = np.array([values[i] for i in str_idx], dtype=str)
+        # unicode code points, zero padded to the longest string
+        codes = strings.view(np.uint32).reshape(len(strings), -1) \
+            .astype(np.int32) - ord('0')
+        lengths = np.char.str_len(strings)
+        is_digit = (codes >= 0) & (codes <= 9)
+        todo = np.ones(len(strings), dtype=bool)
+
+        for _ in range(_MAX_LAYOUTS):
+            if not todo.any():
+                break
+            first = np.flatnonzero(todo)[0]
+            length = lengths[first]
+            layout = codes[first, :length]
+            separators = ~is_digit[first, :length]
+            # strings with the same length, the same non-digit characters at
+            # the same positions and digits everywhere else
+            match = todo & (lengths == length)
+            match[match] = \
+                (is_digit[match, :length] != separators).all(axis=1) \
+                & (codes[match, :length][:, separators]
+                   == layout[separators]).all(axis=1)
+            todo &= ~match
+
+            fields = _split_fields(layout, separators)
+            parsed = parse_fields(codes[match], fields) \
+                if fields is not None else None
+            if parsed is None:
+                remaining.extend(str_idx[match])
+                continue
+            ns, valid = parsed
+            result[str_idx[match][valid]] = ns[valid]
+            # let the scalar function decide about invalid values
+            remaining.extend(str_idx[match][~valid])
+
+        remaining.extend(str_idx[todo])
+
+    for i in remaining:
+        result[i] = to_ns(convert(values[i]))
+    return result
+
+
+def _split_fields(layout: np.ndarray, separators: np.ndarray) \
+        -> Optional[List[Tuple[str, int, int]]]:
+    # split a layout into fields of digits; returns a list of
+    # (preceding separator, start, stop) or None if a field is too long to
+    # be converted without overflow
+    fields = list()
+    start = 0
+    sep = ''
+    for pos in list(np.flatnonzero(separators)) + [len(layout)]:
+        if pos - start > 9:
+            return None
+        fields.append((sep, start, pos))
+        if pos < len(layout):
+            sep = chr(layout[pos] + ord('0'))
+        start = pos + 1
+    return fields
+
+
+def _field_values(codes: np.ndarray, start: int, stop: int) -> np.ndarray:
+    value = np.zeros(len(codes), dtype=np.int64)
+    for i in range(start, stop):
+        value = value * 10 + codes[:, i]
+    return value
+
+
+def _fraction_to_ns(codes: np.ndarray, start: int, stop: int) -> np.ndarray:
+    # fractional seconds are truncated to microseconds, like in the scalar
+    # functions
+    stop = min(stop, start + 6)
+    return _field_values(codes, start, stop) \
+        * 10 ** (6 - (stop - start)) * 1000
+
+
+def _parse_timedelta_fields(codes, fields):
+    # [[hours:]minutes:]seconds[.fraction]
+    seps = [sep for sep, _, _ in fields]
+    fraction = None
+    if seps[-1] == '.':
+        fraction = fields.pop()
+        seps.pop()
+    if (not 1 <= len(fields) <= 3) \
+            or any(sep != ':' for sep in seps[1:]) \
+            or any(start == stop for _, start, stop in fields):
+        return None
+
+    ns = np.zeros(len(codes), dtype=np.int64)
+    for _, start, stop in fields:
+        ns = ns * 60 + _field_values(codes, start, stop)
+    ns *= 1_000_000_000
+    if fraction is not None:
+        ns += _fraction_to_ns(codes, fraction[1], fraction[2])
+    return ns, np.ones(len(codes), dtype=bool)
+
+
+def _parse_datetime_fields(codes, fields):
+    # year-month-dayThours:minutes:seconds[.fraction][Z]
+    if fields[-1][0] == 'Z':
+        if fields[-1][1] != fields[-1][2]:
+            return None  # 'Z' is not the last character
+        fields = fields[:-1]
+    seps = ''.join(sep for sep, _, _ in fields)
+    if seps not in ('--T::', '--T::.') \
+            or any(start == stop for _, start, stop in fields[:6]):
+        return None
+
+    year, month, day, hour, minute, second = \
+        (_field_values(codes, start, stop) for _, start, stop in fields[:6])
+    months = (year - 1970) * 12 + month - 1
+    month_start = months.astype('datetime64[M]').astype('datetime64[D]')
+    month_length = ((months + 1).astype('datetime64[M]')
+                    .astype('datetime64[D]') - month_start).astype(np.int64)
+    valid = (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) \
+        & (day <= month_length) & (hour < 24) & (minute < 60) & (second < 60)
+
+    ns = ((month_start.astype(np.int64) + day - 1) * 86400
+          + hour * 3600 + minute * 60 + second) * 1_000_000_000
+    if len(fields) == 7:
+        ns += _fraction_to_ns(codes, fields[6][1], fields[6][2])
+    return ns, valid
@@ -0,0 +1,73 @@
+"""Compare the JSON backends for decoding car data.
+
+Synthetic car data records with the structure of the F1 live timing API
+(compressed and base64 encoded, 20 drivers per sample) are decoded with
+:func:`fastf1._api.parse` and parsed with :func:`fastf1._api.car_data`, once
+with each available JSON backend.
+
+Usage: python scripts/benchmark_json.py [number of records]
+"""
+import base64
+import json
+import sys
+import time
+import zlib
+
+from fastf1 import Cache, set_json_backend, set_log_level
+import fastf1._api
+from fastf1.internals import json_backend
+
+
+def make_records(n):
+    drivers = [str(d) for d in (1, 2, 4, 10, 11, 14, 16, 18, 20, 21, 22, 23,
+                                24, 27, 31, 44, 55, 63, 77, 81)]
+    records = list()
+    for i in range(n):
+        entries = list()
+        for j in range(4):
+            ms = (i * 4 + j) * 60
+            entries.append({
+                'Utc': f"2023-07-09T14:{ms // 60000 % 60:02d}:"
+                       f"{ms // 1000 % 60:02d}.{ms % 1000:03d}1234Z",
+                'Cars': {drv: {'Channels': {
+                    '0': 10000 + i % 2000, '2': 250 + k, '3': 7,
+                    '4': 99, '5': 0, '45': 8
+                }} for k, drv in enumerate(drivers)}
+            })
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        data = compressor.compress(json.dumps({'Entries': entries}).encode())
+        data += compressor.flush()
+        ts = f"{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000"
+        records.append(ts + '"' + base64.b64encode(data).decode() + '"')
+    return records
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    set_log_level('WARNING')
+    records = make_records(n)
+    print(f"{n} car data records")
+
+    for backend in json_backend.BACKENDS:
+        try:
+            set_json_backend(backend)
+        except ImportError:
+            print(f"{backend:>8}: not installed")
+            continue
+
+        t_start = time.perf_counter()
+        for record in records:
+            fastf1._api.parse(record[12:], zipped=True)
+        t_parse = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        with Cache.disabled():
+            fastf1._api.car_data('benchmark', response=records)
+        t_car_data = time.perf_counter() - t_start
+
+        print(f"{backend:>8}: parse {t_parse:.2f}s | "
+              f"car_data {t_car_data:.2f}s")
+
+
+if __name__ == '__main__':
+    main()